@@ -0,0 +1,27 @@
+"""add user expires_at for ephemeral demo tenants
+
+Revision ID: 20261019_01
+Revises: 20260222_01
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_01"
+down_revision: str | None = "20260222_01"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_index("ix_users_expires_at", "users", ["expires_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_expires_at", table_name="users")
+    op.drop_column("users", "expires_at")
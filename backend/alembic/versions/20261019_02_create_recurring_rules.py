@@ -0,0 +1,82 @@
+"""create recurring rules and link materialized transactions
+
+Revision ID: 20261019_02
+Revises: 20261019_01
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_02"
+down_revision: str | None = "20261019_01"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    transaction_type = postgresql.ENUM("income", "expense", name="transaction_type", create_type=False)
+    recurrence_frequency = postgresql.ENUM(
+        "daily", "weekly", "monthly", "yearly", name="recurrence_frequency", create_type=False
+    )
+    recurrence_frequency.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        "recurring_rules",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("category_id", sa.Integer(), nullable=False),
+        sa.Column("amount", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("type", transaction_type, nullable=False),
+        sa.Column("note", sa.Text(), nullable=True),
+        sa.Column("frequency", recurrence_frequency, nullable=False),
+        sa.Column("anchor_date", sa.Date(), nullable=False),
+        sa.Column("end_date", sa.Date(), nullable=True),
+        sa.Column("materialized_through", sa.Date(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.CheckConstraint("amount > 0", name="ck_recurring_rules_amount_positive"),
+        sa.CheckConstraint(
+            "end_date IS NULL OR end_date >= anchor_date", name="ck_recurring_rules_end_after_anchor"
+        ),
+        sa.ForeignKeyConstraint(
+            ["category_id"], ["categories.id"], name="fk_recurring_rules_category_id_categories", ondelete="RESTRICT"
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], name="fk_recurring_rules_user_id_users", ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id", name="pk_recurring_rules"),
+    )
+    op.create_index("ix_recurring_rules_id", "recurring_rules", ["id"], unique=False)
+    op.create_index("ix_recurring_rules_user_id", "recurring_rules", ["user_id"], unique=False)
+    op.create_index("ix_recurring_rules_category_id", "recurring_rules", ["category_id"], unique=False)
+
+    op.add_column("transactions", sa.Column("recurring_rule_id", sa.Integer(), nullable=True))
+    op.add_column("transactions", sa.Column("occurrence_date", sa.Date(), nullable=True))
+    op.create_foreign_key(
+        "fk_transactions_recurring_rule_id_recurring_rules",
+        "transactions",
+        "recurring_rules",
+        ["recurring_rule_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    op.create_unique_constraint(
+        "uq_transactions_recurring_rule_occurrence", "transactions", ["recurring_rule_id", "occurrence_date"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_transactions_recurring_rule_occurrence", "transactions", type_="unique")
+    op.drop_constraint("fk_transactions_recurring_rule_id_recurring_rules", "transactions", type_="foreignkey")
+    op.drop_column("transactions", "occurrence_date")
+    op.drop_column("transactions", "recurring_rule_id")
+
+    op.drop_index("ix_recurring_rules_category_id", table_name="recurring_rules")
+    op.drop_index("ix_recurring_rules_user_id", table_name="recurring_rules")
+    op.drop_index("ix_recurring_rules_id", table_name="recurring_rules")
+    op.drop_table("recurring_rules")
+
+    recurrence_frequency = postgresql.ENUM("daily", "weekly", "monthly", "yearly", name="recurrence_frequency")
+    recurrence_frequency.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,84 @@
+"""create budgets, period spend counters and threshold events
+
+Revision ID: 20261019_03
+Revises: 20261019_02
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_03"
+down_revision: str | None = "20261019_02"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    budget_period = postgresql.ENUM("weekly", "monthly", "yearly", name="budget_period", create_type=False)
+    budget_period.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        "budgets",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("category_id", sa.Integer(), nullable=False),
+        sa.Column("period", budget_period, nullable=False),
+        sa.Column("limit_amount", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.CheckConstraint("limit_amount > 0", name="ck_budgets_limit_positive"),
+        sa.ForeignKeyConstraint(
+            ["category_id"], ["categories.id"], name="fk_budgets_category_id_categories", ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], name="fk_budgets_user_id_users", ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id", name="pk_budgets"),
+        sa.UniqueConstraint("category_id", "period", name="uq_budgets_category_period"),
+    )
+    op.create_index("ix_budgets_id", "budgets", ["id"], unique=False)
+    op.create_index("ix_budgets_user_id", "budgets", ["user_id"], unique=False)
+
+    op.create_table(
+        "budget_spend",
+        sa.Column("budget_id", sa.Integer(), nullable=False),
+        sa.Column("period_start", sa.Date(), nullable=False),
+        sa.Column("spent", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["budget_id"], ["budgets.id"], name="fk_budget_spend_budget_id_budgets", ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("budget_id", "period_start", name="pk_budget_spend"),
+    )
+
+    op.create_table(
+        "budget_events",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("budget_id", sa.Integer(), nullable=False),
+        sa.Column("period_start", sa.Date(), nullable=False),
+        sa.Column("threshold", sa.Integer(), nullable=False),
+        sa.Column("spent", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["budget_id"], ["budgets.id"], name="fk_budget_events_budget_id_budgets", ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id", name="pk_budget_events"),
+        sa.UniqueConstraint(
+            "budget_id", "period_start", "threshold", name="uq_budget_events_budget_period_threshold"
+        ),
+    )
+    op.create_index("ix_budget_events_id", "budget_events", ["id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_budget_events_id", table_name="budget_events")
+    op.drop_table("budget_events")
+    op.drop_table("budget_spend")
+
+    op.drop_index("ix_budgets_user_id", table_name="budgets")
+    op.drop_index("ix_budgets_id", table_name="budgets")
+    op.drop_table("budgets")
+
+    budget_period = postgresql.ENUM("weekly", "monthly", "yearly", name="budget_period")
+    budget_period.drop(op.get_bind(), checkfirst=True)
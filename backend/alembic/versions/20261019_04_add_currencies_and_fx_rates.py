@@ -0,0 +1,43 @@
+"""add transaction currencies and fx rates
+
+Revision ID: 20261019_04
+Revises: 20261019_03
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.config import get_settings
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_04"
+down_revision: str | None = "20261019_03"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Existing amounts were recorded in the configured base currency. The default only fills those rows; new rows
+    # always name their currency.
+    base_currency = get_settings().base_currency
+    for table in ("transactions", "recurring_rules"):
+        op.add_column(table, sa.Column("currency", sa.String(length=3), server_default=base_currency, nullable=False))
+        op.alter_column(table, "currency", existing_type=sa.String(length=3), server_default=None)
+
+    op.create_table(
+        "fx_rates",
+        sa.Column("currency", sa.String(length=3), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("rate", sa.Numeric(precision=18, scale=8), nullable=False),
+        sa.CheckConstraint("rate > 0", name="ck_fx_rates_rate_positive"),
+        sa.PrimaryKeyConstraint("currency", "date", name="pk_fx_rates"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("fx_rates")
+    op.drop_column("recurring_rules", "currency")
+    op.drop_column("transactions", "currency")
@@ -0,0 +1,39 @@
+"""create cash flow forecasts and user data versions
+
+Revision ID: 20261019_05
+Revises: 20261019_04
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_05"
+down_revision: str | None = "20261019_04"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("data_version", sa.Integer(), server_default="0", nullable=False))
+    op.create_table(
+        "cash_flow_forecasts",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("data_version", sa.Integer(), nullable=False),
+        sa.Column("as_of", sa.Date(), nullable=False),
+        sa.Column("currency", sa.String(length=3), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("generated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"], ["users.id"], name="fk_cash_flow_forecasts_user_id_users", ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("user_id", name="pk_cash_flow_forecasts"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("cash_flow_forecasts")
+    op.drop_column("users", "data_version")
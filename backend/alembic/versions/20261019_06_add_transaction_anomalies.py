@@ -0,0 +1,56 @@
+"""add transaction anomaly scores and category amount stats
+
+Revision ID: 20261019_06
+Revises: 20261019_05
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_06"
+down_revision: str | None = "20261019_05"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "category_amount_stats",
+        sa.Column("category_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("sample_size", sa.Integer(), nullable=False),
+        sa.Column("median", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("mad", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("computed_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["category_id"],
+            ["categories.id"],
+            name="fk_category_amount_stats_category_id_categories",
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"], ["users.id"], name="fk_category_amount_stats_user_id_users", ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("category_id", name="pk_category_amount_stats"),
+    )
+    op.create_index("ix_category_amount_stats_user_id", "category_amount_stats", ["user_id"], unique=False)
+
+    op.add_column("transactions", sa.Column("anomaly_score", sa.Numeric(precision=6, scale=2), nullable=True))
+    op.create_index(
+        "ix_transactions_anomalies",
+        "transactions",
+        ["user_id", "date"],
+        unique=False,
+        postgresql_where=sa.text("anomaly_score IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transactions_anomalies", table_name="transactions")
+    op.drop_column("transactions", "anomaly_score")
+    op.drop_index("ix_category_amount_stats_user_id", table_name="category_amount_stats")
+    op.drop_table("category_amount_stats")
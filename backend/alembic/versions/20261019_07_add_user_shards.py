@@ -0,0 +1,27 @@
+"""add user shard directory columns
+
+Revision ID: 20261019_07
+Revises: 20261019_06
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_07"
+down_revision: str | None = "20261019_06"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("shard", sa.String(length=32), nullable=True))
+    op.add_column("users", sa.Column("shard_moving", sa.Boolean(), server_default=sa.false(), nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column("users", "shard_moving")
+    op.drop_column("users", "shard")
@@ -0,0 +1,31 @@
+"""add user soft-delete marker and deletion progress
+
+Revision ID: 20261019_09
+Revises: 20261019_08
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_09"
+down_revision: str | None = "20261019_08"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("deleted_at", sa.DateTime(), nullable=True))
+    op.create_index("ix_users_deleted_at", "users", ["deleted_at"], unique=False)
+    op.add_column("users", sa.Column("deletion_phase", sa.String(length=32), nullable=True))
+    op.add_column("users", sa.Column("deletion_progress", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("users", "deletion_progress")
+    op.drop_column("users", "deletion_phase")
+    op.drop_index("ix_users_deleted_at", table_name="users")
+    op.drop_column("users", "deleted_at")
@@ -0,0 +1,73 @@
+import argparse
+import asyncio
+import importlib
+import time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app", description="Run the API server.")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Report per-phase import and startup timings up to the first served request, then exit.",
+    )
+    args = parser.parse_args()
+
+    if args.profile_startup:
+        asyncio.run(profile_startup())
+        return
+
+    import uvicorn
+
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    uvicorn.run("app.main:create_app", factory=True, host=settings.app_host, port=settings.app_port)
+
+
+async def profile_startup() -> None:
+    process_started = time.perf_counter()
+    phases: list[tuple[str, float]] = []
+
+    for module_name in ("fastapi", "sqlalchemy.ext.asyncio", "pydantic", "app.main"):
+        started = time.perf_counter()
+        importlib.import_module(module_name)
+        phases.append((f"import {module_name}", time.perf_counter() - started))
+
+    from httpx import ASGITransport, AsyncClient
+
+    from app.core.startup import get_startup_phases, reset_startup_phases
+    from app.main import create_app
+
+    reset_startup_phases()
+    started = time.perf_counter()
+    app = create_app()
+    phases.append(("create_app", time.perf_counter() - started))
+
+    async with app.router.lifespan_context(app):
+        phases.extend((f"lifespan {name}", elapsed) for name, elapsed in get_startup_phases())
+
+        started = time.perf_counter()
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://startup-profile") as client:
+            response = await client.get("/health")
+        phases.append((f"first request ({response.status_code})", time.perf_counter() - started))
+        time_to_first_request = time.perf_counter() - process_started
+
+        background_tasks = getattr(app.state, "background_tasks", set())
+        seed_tasks = [task for task in background_tasks if task.get_coro().__name__ == "_seed_demo_data"]
+        await asyncio.gather(*seed_tasks, return_exceptions=True)
+        phases.extend(
+            (f"background {name}", elapsed)
+            for name, elapsed in get_startup_phases()
+            if name == "demo_seed"
+        )
+
+    width = max(len(name) for name, _ in phases)
+    for name, elapsed in phases:
+        print(f"{name.ljust(width)}  {elapsed * 1000:9.1f} ms")
+    print(f"{'time to first request'.ljust(width)}  {time_to_first_request * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,16 +12,70 @@ class Settings(BaseSettings):
     app_port: int = Field(default=8000, alias="APP_PORT")
 
     database_url: str = Field(alias="DATABASE_URL")
+    db_pool_warmup_connections: int = Field(default=2, alias="DB_POOL_WARMUP_CONNECTIONS")
+    db_query_cache_size: int = Field(default=1000, alias="DB_QUERY_CACHE_SIZE")
+    db_prepared_statement_cache_size: int = Field(default=500, alias="DB_PREPARED_STATEMENT_CACHE_SIZE")
+    sqlite_journal_mode: str = Field(default="WAL", alias="SQLITE_JOURNAL_MODE")
+    sqlite_synchronous: str = Field(default="NORMAL", alias="SQLITE_SYNCHRONOUS")
+    sqlite_cache_size_kb: int = Field(default=65536, alias="SQLITE_CACHE_SIZE_KB")
+    sqlite_mmap_size: int = Field(default=268435456, alias="SQLITE_MMAP_SIZE")
+    sqlite_busy_timeout_ms: int = Field(default=5000, alias="SQLITE_BUSY_TIMEOUT_MS")
 
     jwt_secret_key: str = Field(alias="JWT_SECRET_KEY")
     jwt_algorithm: str = Field(default="HS256", alias="JWT_ALGORITHM")
     jwt_access_token_expire_minutes: int = Field(default=30, alias="JWT_ACCESS_TOKEN_EXPIRE_MINUTES")
     jwt_refresh_token_expire_days: int = Field(default=7, alias="JWT_REFRESH_TOKEN_EXPIRE_DAYS")
+    revocation_sync_interval_seconds: float = Field(default=30.0, alias="REVOCATION_SYNC_INTERVAL_SECONDS")
+    base_currency: str = Field(default="USD", alias="BASE_CURRENCY")
+    fx_rate_cache_currencies: int = Field(default=64, alias="FX_RATE_CACHE_CURRENCIES")
+    fx_rate_cache_ttl_seconds: float = Field(default=3600.0, alias="FX_RATE_CACHE_TTL_SECONDS")
+    report_job_concurrency: int = Field(default=2, alias="REPORT_JOB_CONCURRENCY")
+    report_job_result_ttl_seconds: float = Field(default=600.0, alias="REPORT_JOB_RESULT_TTL_SECONDS")
+    report_job_max_queued: int = Field(default=1000, alias="REPORT_JOB_MAX_QUEUED")
+    admin_emails: str = Field(default="", alias="ADMIN_EMAILS")
+    slow_query_log_enabled: bool = Field(default=False, alias="SLOW_QUERY_LOG_ENABLED")
+    slow_query_threshold_ms: float = Field(default=200.0, alias="SLOW_QUERY_THRESHOLD_MS")
+    slow_query_buffer_size: int = Field(default=200, alias="SLOW_QUERY_BUFFER_SIZE")
+    slow_query_explain: bool = Field(default=True, alias="SLOW_QUERY_EXPLAIN")
+    loop_monitor_enabled: bool = Field(default=True, alias="LOOP_MONITOR_ENABLED")
+    loop_monitor_interval_ms: float = Field(default=50.0, alias="LOOP_MONITOR_INTERVAL_MS")
+    loop_stall_threshold_ms: float = Field(default=100.0, alias="LOOP_STALL_THRESHOLD_MS")
+    loop_stall_buffer_size: int = Field(default=100, alias="LOOP_STALL_BUFFER_SIZE")
+    recurring_scheduler_enabled: bool = Field(default=True, alias="RECURRING_SCHEDULER_ENABLED")
+    recurring_scheduler_interval_seconds: int = Field(default=3600, alias="RECURRING_SCHEDULER_INTERVAL_SECONDS")
+    forecast_history_months: int = Field(default=24, alias="FORECAST_HISTORY_MONTHS")
+    forecast_cache_size: int = Field(default=1024, alias="FORECAST_CACHE_SIZE")
+    forecast_cache_ttl_seconds: float = Field(default=3600.0, alias="FORECAST_CACHE_TTL_SECONDS")
+    forecast_batch_chunk_size: int = Field(default=500, alias="FORECAST_BATCH_CHUNK_SIZE")
+    anomaly_score_threshold: float = Field(default=3.5, alias="ANOMALY_SCORE_THRESHOLD")
+    anomaly_min_samples: int = Field(default=8, alias="ANOMALY_MIN_SAMPLES")
+    anomaly_lookback_days: int = Field(default=365, alias="ANOMALY_LOOKBACK_DAYS")
+    anomaly_stats_chunk_size: int = Field(default=500, alias="ANOMALY_STATS_CHUNK_SIZE")
+    note_index_max_bytes: int = Field(default=64 * 1024 * 1024, alias="NOTE_INDEX_MAX_BYTES")
+    note_index_ttl_seconds: float = Field(default=900.0, alias="NOTE_INDEX_TTL_SECONDS")
+    export_batch_rows: int = Field(default=50000, alias="EXPORT_BATCH_ROWS")
+    category_move_chunk_size: int = Field(default=5000, alias="CATEGORY_MOVE_CHUNK_SIZE")
+    account_deletion_interval_seconds: float = Field(default=60.0, alias="ACCOUNT_DELETION_INTERVAL_SECONDS")
+    account_deletion_chunk_size: int = Field(default=5000, alias="ACCOUNT_DELETION_CHUNK_SIZE")
+    account_deletion_pause_seconds: float = Field(default=0.1, alias="ACCOUNT_DELETION_PAUSE_SECONDS")
+    shard_database_urls: str = Field(default="", alias="SHARD_DATABASE_URLS")
+    shard_new_users: str = Field(default="", alias="SHARD_NEW_USERS")
+    tracing_enabled: bool = Field(default=False, alias="TRACING_ENABLED")
+    trace_sample_rate: float = Field(default=0.01, alias="TRACE_SAMPLE_RATE")
+    trace_export_path: str = Field(default="traces.jsonl", alias="TRACE_EXPORT_PATH")
+    trace_export_max_bytes: int = Field(default=50 * 1024 * 1024, alias="TRACE_EXPORT_MAX_BYTES")
+    trace_export_backup_count: int = Field(default=5, alias="TRACE_EXPORT_BACKUP_COUNT")
+    events_subscriber_queue_size: int = Field(default=100, alias="EVENTS_SUBSCRIBER_QUEUE_SIZE")
+    events_keepalive_seconds: float = Field(default=15.0, alias="EVENTS_KEEPALIVE_SECONDS")
+    events_auth_timeout_seconds: float = Field(default=10.0, alias="EVENTS_AUTH_TIMEOUT_SECONDS")
+    metrics_enabled: bool = Field(default=True, alias="METRICS_ENABLED")
     cors_origins: str = Field(default="http://localhost:5173", alias="CORS_ORIGINS")
     demo_mode: bool = Field(default=True, alias="DEMO_MODE")
     demo_user_name: str = Field(default="Demo User", alias="DEMO_USER_NAME")
     demo_user_email: str = Field(default="demo@pftracker.app", alias="DEMO_USER_EMAIL")
-    demo_user_password: str = Field(default="Demo@12345", alias="DEMO_USER_PASSWORD")
+    demo_tenant_ttl_minutes: int = Field(default=120, alias="DEMO_TENANT_TTL_MINUTES")
+    demo_reaper_interval_seconds: int = Field(default=300, alias="DEMO_REAPER_INTERVAL_SECONDS")
+    demo_reaper_chunk_size: int = Field(default=500, alias="DEMO_REAPER_CHUNK_SIZE")
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
@@ -1,21 +1,260 @@
+import asyncio
+import re
+import weakref
+import zlib
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import Engine, event, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import TextClause
 
+from app.core import metrics
 from app.core.config import get_settings
+from app.core.slow_queries import slow_query_log
+from app.core.tracing import request_tracer
 from app.models.base import Base
 
-settings = get_settings()
+_engine: AsyncEngine | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+_shard_router: "ShardRouter | None" = None
+_sqlite_write_locks: "weakref.WeakKeyDictionary[Engine, tuple[asyncio.AbstractEventLoop, asyncio.Lock]]" = (
+    weakref.WeakKeyDictionary()
+)
+_WRITE_STATEMENT = re.compile(r"\b(INSERT|UPDATE|DELETE|REPLACE)\b", re.IGNORECASE)
 
-engine = create_async_engine(settings.database_url, echo=settings.app_debug, future=True)
-AsyncSessionLocal = async_sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=AsyncSession)
+
+def get_engine() -> AsyncEngine:
+    global _engine
+    if _engine is None:
+        _engine = build_engine(get_settings().database_url)
+    return _engine
+
+
+def build_engine(url: str) -> AsyncEngine:
+    settings = get_settings()
+    connect_args = {}
+    if make_url(url).get_driver_name() == "asyncpg":
+        connect_args["prepared_statement_cache_size"] = settings.db_prepared_statement_cache_size
+    engine = create_async_engine(
+        url,
+        echo=settings.app_debug,
+        future=True,
+        query_cache_size=settings.db_query_cache_size,
+        connect_args=connect_args,
+    )
+    instrument_engine(engine)
+    if engine.dialect.name == "sqlite":
+        configure_sqlite(engine)
+    return engine
+
+
+def configure_sqlite(engine: AsyncEngine) -> None:
+    settings = get_settings()
+    pragmas = (
+        f"PRAGMA journal_mode={settings.sqlite_journal_mode}",
+        f"PRAGMA synchronous={settings.sqlite_synchronous}",
+        f"PRAGMA cache_size=-{settings.sqlite_cache_size_kb}",
+        f"PRAGMA mmap_size={settings.sqlite_mmap_size}",
+        f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA foreign_keys=ON",
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def apply_pragmas(dbapi_connection, _) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    event.listen(engine.sync_engine, "before_cursor_execute", metrics.before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", metrics.after_cursor_execute)
+
+    settings = get_settings()
+    if settings.slow_query_log_enabled:
+        slow_query_log.configure(
+            threshold_ms=settings.slow_query_threshold_ms,
+            capacity=settings.slow_query_buffer_size,
+            explain=settings.slow_query_explain,
+        )
+        slow_query_log.install(engine)
+    if settings.tracing_enabled:
+        request_tracer.install(engine)
+
+
+def create_session_factory(engine: AsyncEngine, **kwargs) -> async_sessionmaker[AsyncSession]:
+    session_class = SQLiteSession if engine.dialect.name == "sqlite" else AsyncSession
+    return async_sessionmaker(bind=engine, class_=session_class, **kwargs)
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = create_session_factory(get_engine(), autoflush=False, autocommit=False)
+    return _session_factory
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSessionLocal() as session:
+    async with get_session_factory()() as session:
         yield session
 
 
+def get_db_session_factory() -> async_sessionmaker[AsyncSession]:
+    return get_session_factory()
+
+
+class _SQLiteSyncSession(Session):
+    pass
+
+
+@event.listens_for(_SQLiteSyncSession, "after_transaction_end")
+def _release_sqlite_write_lock(session: Session, transaction) -> None:
+    if transaction.parent is None:
+        lock = session.info.pop("sqlite_write_lock", None)
+        if lock is not None:
+            lock.release()
+
+
+class SQLiteSession(AsyncSession):
+    # SQLite admits one writer at a time and concurrent writers spin on busy_timeout until they fail with "database
+    # is locked". Sessions instead queue on a per-database lock from their first write until the transaction ends;
+    # pysqlite only opens the transaction at that first write, so reads never wait and never hold a stale snapshot.
+    sync_session_class = _SQLiteSyncSession
+
+    async def execute(self, statement, *args, **kwargs):
+        await self._queue_write(_is_write(statement) or (self.sync_session.autoflush and self._has_pending()))
+        return await super().execute(statement, *args, **kwargs)
+
+    async def scalar(self, statement, *args, **kwargs):
+        await self._queue_write(_is_write(statement) or (self.sync_session.autoflush and self._has_pending()))
+        return await super().scalar(statement, *args, **kwargs)
+
+    async def flush(self, objects=None) -> None:
+        await self._queue_write(self._has_pending())
+        await super().flush(objects)
+
+    async def commit(self) -> None:
+        await self._queue_write(self._has_pending())
+        await super().commit()
+
+    def _has_pending(self) -> bool:
+        return bool(self.new or self.deleted or self.dirty)
+
+    async def _queue_write(self, writes: bool) -> None:
+        info = self.sync_session.info
+        if not writes or "sqlite_write_lock" in info:
+            return
+        lock = _sqlite_write_lock(self.sync_session.get_bind())
+        await lock.acquire()
+        info["sqlite_write_lock"] = lock
+
+
+def _sqlite_write_lock(engine: Engine) -> asyncio.Lock:
+    loop = asyncio.get_running_loop()
+    entry = _sqlite_write_locks.get(engine)
+    if entry is None or entry[0] is not loop:
+        entry = _sqlite_write_locks[engine] = (loop, asyncio.Lock())
+    return entry[1]
+
+
+def _is_write(statement) -> bool:
+    if isinstance(statement, TextClause):
+        return _WRITE_STATEMENT.search(statement.text) is not None
+    return bool(getattr(statement, "is_dml", False))
+
+
+class ShardRouter:
+    # User data lives either in the primary database (shard None) or in one of the named shards; the users table in
+    # the primary database stays the directory that records which one.
+    def __init__(self, urls: dict[str, str], new_user_shards: list[str] | None = None) -> None:
+        unknown = set(new_user_shards or ()) - set(urls)
+        if unknown:
+            raise ValueError(f"Unknown shards for new users: {', '.join(sorted(unknown))}")
+        self.urls = urls
+        self.new_user_shards = new_user_shards or list(urls)
+        self._engines: dict[str, AsyncEngine] = {}
+        self._session_factories: dict[str, async_sessionmaker[AsyncSession]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.urls)
+
+    def assign(self, email: str) -> str | None:
+        # The key must be known before the user row exists, so new users are placed by a stable hash of their email.
+        if not self.new_user_shards:
+            return None
+        return self.new_user_shards[zlib.crc32(email.encode()) % len(self.new_user_shards)]
+
+    def engine(self, shard: str) -> AsyncEngine:
+        if shard not in self.urls:
+            raise LookupError(f"Unknown shard {shard!r}")
+        if shard not in self._engines:
+            self._engines[shard] = build_engine(self.urls[shard])
+        return self._engines[shard]
+
+    def session_factory(self, shard: str | None) -> async_sessionmaker[AsyncSession]:
+        if shard is None:
+            return get_session_factory()
+        if shard not in self._session_factories:
+            self._session_factories[shard] = create_session_factory(
+                self.engine(shard), autoflush=False, autocommit=False
+            )
+        return self._session_factories[shard]
+
+    def session_factories(self) -> list[tuple[str | None, async_sessionmaker[AsyncSession]]]:
+        return [(None, get_session_factory())] + [(shard, self.session_factory(shard)) for shard in self.urls]
+
+    async def dispose(self) -> None:
+        for engine in self._engines.values():
+            await engine.dispose()
+        self._engines.clear()
+        self._session_factories.clear()
+
+
+def parse_shard_urls(value: str) -> dict[str, str]:
+    urls: dict[str, str] = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        name, separator, url = item.partition("=")
+        if not separator or not name.strip() or not url.strip():
+            raise ValueError(f"Invalid shard entry {item.strip()!r}; expected name=url")
+        urls[name.strip()] = url.strip()
+    return urls
+
+
+def get_shard_router() -> ShardRouter:
+    global _shard_router
+    if _shard_router is None:
+        settings = get_settings()
+        new_user_shards = [name.strip() for name in settings.shard_new_users.split(",") if name.strip()]
+        _shard_router = ShardRouter(parse_shard_urls(settings.shard_database_urls), new_user_shards)
+    return _shard_router
+
+
+async def warm_pool(connections: int) -> None:
+    if connections <= 0:
+        return
+    engine = get_engine()
+    # Hold every connection at once so the pool opens distinct sockets instead of reusing one.
+    opened = await asyncio.gather(*(engine.connect().start() for _ in range(connections)))
+    await asyncio.gather(*(conn.close() for conn in opened))
+
+
+async def dispose_engine() -> None:
+    global _engine, _session_factory, _shard_router
+    if _engine is not None:
+        await _engine.dispose()
+    if _shard_router is not None:
+        await _shard_router.dispose()
+    _engine = None
+    _session_factory = None
+    _shard_router = None
+
+
 async def init_db() -> None:
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
\ No newline at end of file
+    async with get_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
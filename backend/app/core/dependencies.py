@@ -1,13 +1,29 @@
+from collections.abc import AsyncGenerator, Iterable
+from datetime import UTC, datetime
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import event, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
 
-from app.core.database import get_db_session
+from app.core.config import get_settings
+from app.core.database import get_db_session, get_db_session_factory, get_shard_router
 from app.core.security import TokenError, decode_token
+from app.core.tracing import span
 from app.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+WRITE_FENCE_USERS = "write_fence_user_ids"
+
+
+class UserMovingError(HTTPException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Account data is being moved, try again shortly",
+            headers={"Retry-After": "30"},
+        )
 
 
 async def get_current_user(
@@ -20,14 +36,101 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+    with span("auth.get_current_user"):
+        user = await authenticate_access_token(db, token)
+    if user is None:
+        raise unauthorized_exc
+    return user
+
+
+async def get_token_user_id(token: str = Depends(oauth2_scheme)) -> int:
+    # Only checks the signature and expiry: deleting an account revokes its token families, and the account may
+    # already be purged. Callers must expose nothing beyond that account's deletion status.
     try:
-        payload = decode_token(token, expected_type="access")
+        return int(decode_token(token, expected_type="access", check_revoked=False)["sub"])
+    except (TokenError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        ) from exc
+
+
+async def authenticate_access_token(db: AsyncSession, token: str) -> User | None:
+    try:
+        with span("auth.decode_token"):
+            payload = decode_token(token, expected_type="access")
         user_id = int(payload["sub"])
     except (TokenError, ValueError):
-        raise unauthorized_exc
+        return None
 
-    result = await db.execute(select(User).where(User.id == user_id))
+    # Expired demo tenants are refused here rather than when the reaper gets to them.
+    result = await db.execute(
+        select(User).where(User.id == user_id, or_(User.expires_at.is_(None), User.expires_at > datetime.now(UTC)))
+    )
     user = result.scalar_one_or_none()
-    if user is None:
-        raise unauthorized_exc
-    return user
\ No newline at end of file
+    if user is None or user.deleted_at is not None:
+        return None
+    return user
+
+
+async def get_current_admin(current_user: User = Depends(get_current_user)) -> User:
+    admin_emails = {email.strip().lower() for email in get_settings().admin_emails.split(",") if email.strip()}
+    if current_user.email.lower() not in admin_emails:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+    return current_user
+
+
+async def get_user_db_session(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_session),
+) -> AsyncGenerator[AsyncSession, None]:
+    _ensure_not_moving(current_user)
+    if current_user.shard is None:
+        fence_user_writes(db, [current_user.id])
+        yield db
+        return
+    async with get_shard_router().session_factory(current_user.shard)() as session:
+        fence_user_writes(session, [current_user.id])
+        yield session
+
+
+async def get_user_db_session_factory(
+    current_user: User = Depends(get_current_user),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_db_session_factory),
+) -> async_sessionmaker[AsyncSession]:
+    _ensure_not_moving(current_user)
+    if current_user.shard is None:
+        return session_factory
+    return get_shard_router().session_factory(current_user.shard)
+
+
+def _ensure_not_moving(user: User) -> None:
+    if user.shard_moving:
+        raise UserMovingError()
+
+
+def fence_user_writes(session: AsyncSession | Session, user_ids: Iterable[int]) -> None:
+    # Every commit of the session re-checks these users and bumps their data version; background writers call this
+    # with the users they touched.
+    session.info.setdefault(WRITE_FENCE_USERS, set()).update(user_ids)
+
+
+@event.listens_for(Session, "before_commit")
+def _check_write_fence(session: Session) -> None:
+    # The check at request start can be passed just before a move begins. Re-reading the flag inside the write
+    # transaction, while updating the row the mover updates, means a write either commits before the move flips the
+    # flag (and is copied) or sees the flag and rolls back. The same statement bumps users.data_version, so every
+    # worker can tell that results computed from the user's data before this commit are stale.
+    user_ids = session.info.get(WRITE_FENCE_USERS)
+    if not user_ids:
+        return
+    settled = session.execute(
+        update(User)
+        .where(User.id.in_(user_ids), User.shard_moving.is_(False))
+        .values(data_version=User.data_version + 1)
+        .returning(User.id)
+        .execution_options(synchronize_session=False)
+    ).scalars()
+    if len(set(settled)) < len(user_ids):
+        raise UserMovingError()
@@ -0,0 +1,138 @@
+import asyncio
+import json
+import logging
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "pftracker_events"
+RESYNC_EVENT = "resync"
+# Postgres rejects NOTIFY payloads of 8000 bytes or more.
+MAX_NOTIFY_BYTES = 7900
+RELAY_RETRY_SECONDS = 5.0
+RELAY_HEALTH_CHECK_SECONDS = 30.0
+
+
+class Subscription:
+    __slots__ = ("user_id", "queue", "overflowed")
+
+    def __init__(self, user_id: int, queue_size: int) -> None:
+        self.user_id = user_id
+        self.queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+
+    def put(self, name: str, data: str) -> None:
+        try:
+            self.queue.put_nowait((name, data))
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def get(self) -> tuple[str, str]:
+        # A client that fell behind has lost events it cannot be told about one by one; it refetches instead.
+        if self.overflowed:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.overflowed = False
+            return RESYNC_EVENT, "{}"
+        return await self.queue.get()
+
+
+class EventBroker:
+    def __init__(self, queue_size: int = 100, outbox_size: int = 1000) -> None:
+        self.queue_size = queue_size
+        self.origin = os.urandom(8).hex()
+        self._subscriptions: dict[int, set[Subscription]] = {}
+        self._outbox: asyncio.Queue[tuple[int, str, str]] = asyncio.Queue(maxsize=outbox_size)
+        self._relaying = False
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    @contextmanager
+    def subscribe(self, user_id: int) -> Iterator[Subscription]:
+        subscription = Subscription(user_id, self.queue_size)
+        self._subscriptions.setdefault(user_id, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscriptions = self._subscriptions.get(user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[user_id]
+
+    def publish(self, user_id: int, name: str, data: str) -> None:
+        self.deliver(user_id, name, data)
+        if not self._relaying:
+            return
+        try:
+            self._outbox.put_nowait((user_id, name, data))
+        except asyncio.QueueFull:
+            logger.warning("Event relay is behind, dropping %s for user %s", name, user_id)
+
+    def deliver(self, user_id: int, name: str, data: str) -> None:
+        for subscription in self._subscriptions.get(user_id, ()):
+            subscription.put(name, data)
+
+    def resync_all(self) -> None:
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription.put(RESYNC_EVENT, "{}")
+
+    async def run_postgres_relay(self, engine: AsyncEngine) -> None:
+        # One connection per worker LISTENs for the other workers' events and NOTIFYs its own; asyncpg calls the
+        # listener on the event loop, so remote events reach subscribers exactly like local ones.
+        while True:
+            try:
+                async with engine.connect() as conn:
+                    await self.relay((await conn.get_raw_connection()).driver_connection)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Event relay connection failed, retrying in %.0f seconds", RELAY_RETRY_SECONDS)
+            await asyncio.sleep(RELAY_RETRY_SECONDS)
+
+    async def relay(self, raw: Any) -> None:
+        await raw.add_listener(CHANNEL, self._on_notify)
+        try:
+            self._relaying = True
+            # Events from other workers may have been missed while the relay was down.
+            self.resync_all()
+            await self._drain_outbox(raw)
+        finally:
+            self._relaying = False
+            await raw.remove_listener(CHANNEL, self._on_notify)
+
+    async def _drain_outbox(self, raw: Any) -> None:
+        while True:
+            try:
+                batch = [await asyncio.wait_for(self._outbox.get(), timeout=RELAY_HEALTH_CHECK_SECONDS)]
+            except TimeoutError:
+                # A quiet worker never writes to the connection, so without this a dead one would go unnoticed.
+                await raw.execute("SELECT 1")
+                continue
+            while not self._outbox.empty():
+                batch.append(self._outbox.get_nowait())
+            payloads = []
+            for user_id, name, data in batch:
+                payload = json.dumps({"origin": self.origin, "user_id": user_id, "name": name, "data": data})
+                if len(payload.encode()) > MAX_NOTIFY_BYTES:
+                    payload = json.dumps({"origin": self.origin, "user_id": user_id, "name": RESYNC_EVENT, "data": "{}"})
+                payloads.append((CHANNEL, payload))
+            await raw.executemany("SELECT pg_notify($1, $2)", payloads)
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            if message["origin"] == self.origin:
+                return
+            self.deliver(int(message["user_id"]), message["name"], message["data"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed event notification: %.200s", payload)
+
@@ -0,0 +1,153 @@
+import asyncio
+import enum
+import itertools
+import logging
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+JobFunction = Callable[[AsyncSession], Awaitable[Any]]
+
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class QueueFullError(Exception):
+    pass
+
+
+@dataclass(eq=False)
+class Job:
+    id: str
+    owner_id: int
+    key: Hashable
+    priority: int
+    fn: JobFunction = field(repr=False)
+    session_factory: async_sessionmaker[AsyncSession] | None = field(default=None, repr=False)
+    status: JobStatus = JobStatus.QUEUED
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    result: Any = None
+    error: str | None = None
+    expires_at: float | None = None
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+
+class JobQueue:
+    def __init__(
+        self,
+        concurrency: int,
+        result_ttl_seconds: float,
+        max_queued: int,
+        session_factory: Callable[[], async_sessionmaker[AsyncSession]],
+    ) -> None:
+        self.concurrency = concurrency
+        self.result_ttl_seconds = result_ttl_seconds
+        self.max_queued = max_queued
+        self.session_factory = session_factory
+        self._jobs: dict[str, Job] = {}
+        self._by_key: dict[Hashable, Job] = {}
+        self._queue: asyncio.PriorityQueue[tuple[int, int, str]] | None = None
+        self._workers: list[asyncio.Task] = []
+        self._sequence = itertools.count()
+
+    def submit(
+        self,
+        owner_id: int,
+        key: Hashable,
+        priority: int,
+        fn: JobFunction,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ) -> Job:
+        self._purge_expired()
+        existing = self._by_key.get(key)
+        if existing is not None and existing.status != JobStatus.FAILED:
+            return existing
+
+        self._ensure_started()
+        assert self._queue is not None
+        if self._queue.qsize() >= self.max_queued:
+            raise QueueFullError("Job queue is full")
+
+        job = Job(
+            id=uuid.uuid4().hex,
+            owner_id=owner_id,
+            key=key,
+            priority=priority,
+            fn=fn,
+            session_factory=session_factory,
+        )
+        self._jobs[job.id] = job
+        self._by_key[key] = job
+        self._queue.put_nowait((priority, next(self._sequence), job.id))
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        self._purge_expired()
+        return self._jobs.get(job_id)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> None:
+        for key in [key for key in self._by_key if predicate(key)]:
+            del self._by_key[key]
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+        self._queue = None
+
+    def _ensure_started(self) -> None:
+        if self._workers:
+            return
+        self._queue = asyncio.PriorityQueue()
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            _, _, job_id = await queue.get()
+            job = self._jobs.get(job_id)
+            if job is None:
+                continue
+            job.status = JobStatus.RUNNING
+            job.started_at = datetime.now(UTC)
+            try:
+                async with (job.session_factory or self.session_factory())() as session:
+                    job.result = await job.fn(session)
+                job.status = JobStatus.SUCCEEDED
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.exception("Job %s failed", job.id)
+                job.error = getattr(exc, "detail", None) or str(exc) or type(exc).__name__
+                job.status = JobStatus.FAILED
+            finally:
+                job.finished_at = datetime.now(UTC)
+                job.expires_at = time.monotonic() + self.result_ttl_seconds
+                job.done.set()
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        expired = [job for job in self._jobs.values() if job.expires_at is not None and job.expires_at <= now]
+        for job in expired:
+            del self._jobs[job.id]
+            if self._by_key.get(job.key) is job:
+                del self._by_key[job.key]
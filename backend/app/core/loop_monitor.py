@@ -0,0 +1,180 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from types import FrameType
+
+from app.core.metrics import MetricsRegistry, registry
+from app.core.profiling import frame_stack
+from app.core.request_context import RequestContextMiddleware, endpoint_name
+
+logger = logging.getLogger(__name__)
+
+APP_DIRECTORY = str(Path(__file__).resolve().parents[1])
+_REQUEST_FRAME = RequestContextMiddleware.__call__.__code__
+
+
+@dataclass
+class LoopStall:
+    duration_ms: float
+    endpoint: str | None
+    site: str
+    stack: list[str]
+    recorded_at: datetime
+    finished: bool = False
+
+
+@dataclass
+class BlockingSite:
+    site: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    endpoints: set[str] = field(default_factory=set)
+
+
+class LoopMonitor:
+    def __init__(
+        self,
+        interval_ms: float = 50.0,
+        threshold_ms: float = 100.0,
+        capacity: int = 100,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self.interval_ms = interval_ms
+        self.threshold_ms = threshold_ms
+        self.metrics = metrics or registry
+        self.stalls: deque[LoopStall] = deque(maxlen=capacity)
+        self.sites: dict[str, BlockingSite] = {}
+        self._expected: float | None = None
+        self._captured: tuple[float, LoopStall] | None = None
+        self._loop_thread_id: int | None = None
+        self._heartbeat: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+    def configure(self, interval_ms: float, threshold_ms: float, capacity: int) -> None:
+        self.interval_ms = interval_ms
+        self.threshold_ms = threshold_ms
+        if capacity != self.stalls.maxlen:
+            self.stalls = deque(self.stalls, maxlen=capacity)
+
+    @property
+    def running(self) -> bool:
+        return self._heartbeat is not None
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._expected = None
+        self._stopping.clear()
+        self._heartbeat = asyncio.get_running_loop().create_task(self._beat())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        if self._heartbeat is None:
+            return
+        self._stopping.set()
+        self._heartbeat.cancel()
+        await asyncio.gather(self._heartbeat, return_exceptions=True)
+        self._heartbeat = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    def snapshot(self) -> list[LoopStall]:
+        return list(self.stalls)
+
+    def top_sites(self, limit: int) -> list[BlockingSite]:
+        return sorted(self.sites.values(), key=lambda site: site.total_ms, reverse=True)[:limit]
+
+    def clear(self) -> None:
+        self.stalls.clear()
+        self.sites.clear()
+
+    async def _beat(self) -> None:
+        interval = self.interval_ms / 1000
+        while True:
+            expected = time.perf_counter() + interval
+            self._expected = expected
+            await asyncio.sleep(interval)
+            lag = max(0.0, time.perf_counter() - expected)
+            self.metrics.observe("event_loop_lag_seconds", (), lag)
+            captured = self._captured
+            if captured is not None and captured[0] == expected:
+                self._finish(captured[1], lag * 1000)
+
+    def _watch(self) -> None:
+        # The loop cannot report on itself while it is blocked, so this thread notices the missed heartbeat and
+        # grabs the loop thread's stack while the blocking call is still on it.
+        poll = max(self.threshold_ms / 2, 1.0) / 1000
+        while not self._stopping.wait(poll):
+            expected = self._expected
+            if expected is None or (self._captured is not None and self._captured[0] == expected):
+                continue
+            overdue_ms = (time.perf_counter() - expected) * 1000
+            if overdue_ms < self.threshold_ms:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            try:
+                stall = LoopStall(
+                    duration_ms=round(overdue_ms, 3),
+                    endpoint=_active_endpoint(frame),
+                    site=_blocking_site(frame),
+                    stack=frame_stack(frame),
+                    recorded_at=datetime.now(UTC),
+                )
+            finally:
+                del frame
+            self._captured = (expected, stall)
+            self.stalls.append(stall)
+            logger.warning("Event loop blocked for %.0f ms at %s (%s)", overdue_ms, stall.site, stall.endpoint)
+
+    def _finish(self, stall: LoopStall, duration_ms: float) -> None:
+        stall.duration_ms = round(duration_ms, 3)
+        stall.finished = True
+        site = self.sites.get(stall.site)
+        if site is None:
+            site = self.sites[stall.site] = BlockingSite(stall.site)
+        site.count += 1
+        site.total_ms += duration_ms
+        site.max_ms = max(site.max_ms, duration_ms)
+        if stall.endpoint is not None:
+            site.endpoints.add(stall.endpoint)
+
+
+def _active_endpoint(frame: FrameType | None) -> str | None:
+    # The blocked coroutine's frame chain runs up through every coroutine awaiting it, including the request's
+    # RequestContextMiddleware call, whose scope names the route being served.
+    while frame is not None:
+        if frame.f_code is _REQUEST_FRAME:
+            scope = frame.f_locals.get("scope")
+            return endpoint_name(scope) if scope is not None else None
+        frame = frame.f_back
+    return None
+
+
+def _blocking_site(frame: FrameType) -> str:
+    # The innermost frame is usually inside a library (passlib, logging, decimal); the innermost application frame
+    # is the call that has to change.
+    innermost = frame
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(APP_DIRECTORY) and filename != __file__:
+            innermost = frame
+            break
+        frame = frame.f_back
+    code = innermost.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{innermost.f_lineno})"
+
+
+loop_monitor = LoopMonitor()
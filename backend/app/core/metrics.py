@@ -0,0 +1,174 @@
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Any
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50)
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "total", "count")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class RequestStats:
+    __slots__ = ("statements", "db_seconds")
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.db_seconds = 0.0
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self.histograms: dict[str, tuple[str, tuple[float, ...], dict[tuple[str, ...], Histogram]]] = {
+            "http_request_duration_seconds": ("Request latency by route.", LATENCY_BUCKETS, {}),
+            "http_response_size_bytes": ("Response body size by route.", SIZE_BUCKETS, {}),
+            "db_statements_per_request": ("SQL statements executed per request.", STATEMENT_BUCKETS, {}),
+            "db_time_per_request_seconds": ("Time spent in SQL statements per request.", LATENCY_BUCKETS, {}),
+            "event_loop_lag_seconds": ("How late the event loop ran a scheduled heartbeat.", LAG_BUCKETS, {}),
+        }
+        self.counters: dict[str, tuple[str, tuple[str, ...], dict[tuple[str, ...], int]]] = {
+            "budget_spend_skipped_total": ("Spend left out of budgets for lack of an exchange rate.", ("currency",), {}),
+        }
+        self.in_flight: dict[str, int] = {}
+
+    def observe(self, name: str, labels: tuple[str, ...], value: float) -> None:
+        _, buckets, series = self.histograms[name]
+        histogram = series.get(labels)
+        if histogram is None:
+            histogram = series[labels] = Histogram(buckets)
+        histogram.observe(value)
+
+    def inc(self, name: str, labels: tuple[str, ...], amount: int = 1) -> None:
+        series = self.counters[name][2]
+        series[labels] = series.get(labels, 0) + amount
+
+    def reset(self) -> None:
+        for _, _, series in self.histograms.values():
+            series.clear()
+        for _, _, series in self.counters.values():
+            series.clear()
+        self.in_flight.clear()
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for name, (help_text, buckets, series) in self.histograms.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, histogram in sorted(series.items()):
+                label_text = _label_text(labels)
+                bucket_prefix = f"{label_text}," if label_text else ""
+                cumulative = 0
+                for bound, bucket_count in zip(buckets, histogram.counts):
+                    cumulative += bucket_count
+                    lines.append(f'{name}_bucket{{{bucket_prefix}le="{bound:g}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{{bucket_prefix}le="+Inf"}} {histogram.count}')
+                label_set = f"{{{label_text}}}" if label_text else ""
+                lines.append(f"{name}_sum{label_set} {histogram.total:.6f}")
+                lines.append(f"{name}_count{label_set} {histogram.count}")
+
+        for name, (help_text, label_names, series) in self.counters.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in sorted(series.items()):
+                label_text = ",".join(f'{key}="{_escape(label)}"' for key, label in zip(label_names, labels))
+                lines.append(f"{name}{{{label_text}}} {value}")
+
+        lines.append("# HELP http_requests_in_flight Requests currently being served.")
+        lines.append("# TYPE http_requests_in_flight gauge")
+        for method, value in sorted(self.in_flight.items()):
+            lines.append(f'http_requests_in_flight{{method="{method}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+_request_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, metrics: MetricsRegistry | None = None) -> None:
+        self.app = app
+        self.metrics = metrics or registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = self.metrics
+        method = scope["method"]
+        status_code = 500
+        response_size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        metrics.in_flight[method] = metrics.in_flight.get(method, 0) + 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            metrics.in_flight[method] -= 1
+            _request_stats.reset(token)
+
+            route = scope.get("route")
+            route_path = getattr(route, "path", UNMATCHED_ROUTE)
+            labels = (method, route_path)
+            metrics.observe("http_request_duration_seconds", (method, route_path, str(status_code)), elapsed)
+            metrics.observe("http_response_size_bytes", labels, response_size)
+            metrics.observe("db_statements_per_request", labels, stats.statements)
+            metrics.observe("db_time_per_request_seconds", labels, stats.db_seconds)
+
+
+def before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    if context is not None:
+        context._metrics_started = time.perf_counter()
+
+
+def after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    stats = _request_stats.get()
+    if stats is None or context is None:
+        return
+    stats.statements += 1
+    started = getattr(context, "_metrics_started", None)
+    if started is not None:
+        stats.db_seconds += time.perf_counter() - started
+
+
+def _label_text(labels: tuple[str, ...]) -> str:
+    if not labels:
+        return ""
+    method, route, *rest = labels
+    label_text = f'method="{method}",route="{_escape(route)}"'
+    if rest:
+        label_text += f',status="{rest[0]}"'
+    return label_text
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
@@ -0,0 +1,84 @@
+import asyncio
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+
+# Frames kept per allocation when grouping by traceback. Deeper tracebacks make every allocation more expensive while
+# tracing is on, so grouping by line or file keeps a single frame.
+TRACEBACK_FRAMES = 16
+_busy = threading.Lock()
+
+
+def try_acquire() -> bool:
+    # One capture per worker at a time, whichever kind: two would skew each other and double the overhead.
+    return _busy.acquire(blocking=False)
+
+
+def release() -> None:
+    _busy.release()
+
+
+def sample_stacks(seconds: float, hz: int) -> tuple[Counter[str], int]:
+    # Runs in its own thread so the event loop keeps serving while it is being watched.
+    own_id = threading.get_ident()
+    interval = 1.0 / hz
+    stacks: Counter[str] = Counter()
+    samples = 0
+    deadline = time.perf_counter() + seconds
+    next_sample = time.perf_counter()
+    while next_sample < deadline:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            thread_name = names.get(thread_id, f"thread-{thread_id}")
+            stacks[";".join([thread_name, *frame_stack(frame)])] += 1
+        samples += 1
+        next_sample += interval
+        time.sleep(max(0.0, next_sample - time.perf_counter()))
+    return stacks, samples
+
+
+def frame_stack(frame: FrameType | None) -> list[str]:
+    frames = []
+    while frame is not None:
+        code = frame.f_code
+        frames.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+        frame = frame.f_back
+    frames.reverse()
+    return frames
+
+
+async def profile(seconds: float, hz: int) -> tuple[str, int]:
+    stacks, samples = await asyncio.to_thread(sample_stacks, seconds, hz)
+    collapsed = "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+    return collapsed, samples
+
+
+async def heap_diff(seconds: float, group_by: str, limit: int) -> tuple[list[tracemalloc.StatisticDiff], int, int]:
+    started_here = not tracemalloc.is_tracing()
+    if started_here:
+        tracemalloc.start(TRACEBACK_FRAMES if group_by == "traceback" else 1)
+    try:
+        before = tracemalloc.take_snapshot()
+        await asyncio.sleep(seconds)
+        after = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if started_here:
+            tracemalloc.stop()
+
+    def compare() -> list[tracemalloc.StatisticDiff]:
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), group_by)
+        return stats[:limit]
+
+    return await asyncio.to_thread(compare), current, peak
+
+
+def format_traceback(traceback: tracemalloc.Traceback) -> str:
+    return " <- ".join(f"{frame.filename}:{frame.lineno}" for frame in reversed(traceback))
@@ -0,0 +1,44 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+QUERY_BUDGET_ATTR = "__query_budget__"
+QUERY_BUDGET_PER_CHUNK_ATTR = "__query_budget_per_chunk__"
+
+_chunk_counter: ContextVar[list[int] | None] = ContextVar("query_budget_chunks", default=None)
+
+
+def query_budget(max_statements: int, per_chunk: int = 0) -> Callable[[F], F]:
+    # per_chunk is what each extra chunk of a chunked write costs; the fixed budget already covers the first one.
+    def decorator(func: F) -> F:
+        setattr(func, QUERY_BUDGET_ATTR, max_statements)
+        setattr(func, QUERY_BUDGET_PER_CHUNK_ATTR, per_chunk)
+        return func
+
+    return decorator
+
+
+def get_query_budget(endpoint: Callable[..., Any] | None, extra_chunks: int = 0) -> int | None:
+    budget = getattr(endpoint, QUERY_BUDGET_ATTR, None)
+    if budget is None:
+        return None
+    return budget + extra_chunks * getattr(endpoint, QUERY_BUDGET_PER_CHUNK_ATTR, 0)
+
+
+def record_extra_chunk() -> None:
+    counter = _chunk_counter.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+@contextmanager
+def count_extra_chunks() -> Iterator[list[int]]:
+    counter = [0]
+    token = _chunk_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _chunk_counter.reset(token)
@@ -0,0 +1,43 @@
+import time
+from datetime import datetime
+from functools import lru_cache
+
+
+class RevocationList:
+    # Revoked refresh-token families, checked on every token decode. Entries only matter until the family's last
+    # refresh token expires, so the set stays bounded and a plain dict lookup is enough.
+    def __init__(self) -> None:
+        self._families: dict[str, float] = {}
+
+    def is_revoked(self, family_id: str | None) -> bool:
+        if family_id is None:
+            return False
+        expires_at = self._families.get(family_id)
+        if expires_at is None:
+            return False
+        if expires_at <= time.time():
+            del self._families[family_id]
+            return False
+        return True
+
+    def revoke(self, family_id: str, expires_at: datetime) -> None:
+        self._families[family_id] = max(self._families.get(family_id, 0.0), _timestamp(expires_at))
+
+    def replace(self, families: dict[str, datetime]) -> None:
+        self._families = {family_id: _timestamp(expires_at) for family_id, expires_at in families.items()}
+
+    def clear(self) -> None:
+        self._families.clear()
+
+    def __len__(self) -> int:
+        return len(self._families)
+
+
+def _timestamp(value: datetime) -> float:
+    # Token expiries are stored as naive UTC, like the rest of the schema.
+    return value.timestamp() if value.tzinfo is not None else (value - datetime(1970, 1, 1)).total_seconds()
+
+
+@lru_cache
+def get_revocation_list() -> RevocationList:
+    return RevocationList()
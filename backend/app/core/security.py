@@ -5,9 +5,9 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import get_settings
+from app.core.revocation import get_revocation_list
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-settings = get_settings()
 
 
 class TokenError(Exception):
@@ -28,17 +28,27 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
-def create_access_token(subject: str) -> str:
+def create_access_token(subject: str, family_id: str | None = None) -> str:
+    settings = get_settings()
     expires_delta = timedelta(minutes=settings.jwt_access_token_expire_minutes)
-    return _create_token(subject=subject, expires_delta=expires_delta, token_type="access")
-
-
-def create_refresh_token(subject: str) -> str:
-    expires_delta = timedelta(days=settings.jwt_refresh_token_expire_days)
-    return _create_token(subject=subject, expires_delta=expires_delta, token_type="refresh")
+    return _create_token(subject=subject, expires_delta=expires_delta, token_type="access", family_id=family_id)
+
+
+def create_refresh_token(subject: str, jti: str, family_id: str, expires_at: datetime) -> str:
+    settings = get_settings()
+    payload = {
+        "sub": subject,
+        "type": "refresh",
+        "jti": jti,
+        "fam": family_id,
+        "iat": datetime.now(UTC),
+        "exp": expires_at,
+    }
+    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
 
 
-def decode_token(token: str, expected_type: str | None = None) -> dict[str, Any]:
+def decode_token(token: str, expected_type: str | None = None, check_revoked: bool = True) -> dict[str, Any]:
+    settings = get_settings()
     try:
         payload: dict[str, Any] = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
     except JWTError as exc:
@@ -50,11 +60,17 @@ def decode_token(token: str, expected_type: str | None = None) -> dict[str, Any]
     if payload.get("sub") is None:
         raise TokenError("Token subject missing")
 
+    if check_revoked and get_revocation_list().is_revoked(payload.get("fam")):
+        raise TokenError("Token revoked")
+
     return payload
 
 
-def _create_token(subject: str, expires_delta: timedelta, token_type: str) -> str:
+def _create_token(subject: str, expires_delta: timedelta, token_type: str, family_id: str | None = None) -> str:
+    settings = get_settings()
     now = datetime.now(UTC)
     expire = now + expires_delta
     payload = {"sub": subject, "type": token_type, "iat": now, "exp": expire}
+    if family_id is not None:
+        payload["fam"] = family_id
     return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
@@ -0,0 +1,153 @@
+import asyncio
+import json
+import logging
+import re
+import time
+from collections import deque
+from contextvars import Context, ContextVar
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.request_context import current_endpoint
+
+logger = logging.getLogger(__name__)
+
+MAX_PARAMETERS_LENGTH = 2000
+# Statements that write or take row locks are only planned; running them under EXPLAIN ANALYZE would repeat the
+# write (rolled back, but still paid for) or wait on the locks.
+_NOT_READ_ONLY = re.compile(
+    r"\b(?:INSERT|UPDATE|DELETE|MERGE|INTO|FOR\s+(?:NO\s+KEY\s+)?UPDATE|FOR\s+(?:KEY\s+)?SHARE|SKIP\s+LOCKED|NOWAIT)\b",
+    re.IGNORECASE,
+)
+_explaining: ContextVar[bool] = ContextVar("explaining_slow_query", default=False)
+
+
+@dataclass
+class SlowQuery:
+    statement: str
+    parameters: str
+    duration_ms: float
+    endpoint: str | None
+    recorded_at: datetime
+    plan: str | None = None
+    explain_error: str | None = None
+
+
+class SlowQueryLog:
+    def __init__(self, threshold_ms: float = 200.0, capacity: int = 200, explain: bool = True, max_pending_explains: int = 4) -> None:
+        self.threshold_ms = threshold_ms
+        self.explain = explain
+        self.max_pending_explains = max_pending_explains
+        self.records: deque[SlowQuery] = deque(maxlen=capacity)
+        self._pending: set[asyncio.Task] = set()
+        self._engine: AsyncEngine | None = None
+
+    def configure(self, threshold_ms: float, capacity: int, explain: bool) -> None:
+        self.threshold_ms = threshold_ms
+        self.explain = explain
+        if capacity != self.records.maxlen:
+            self.records = deque(self.records, maxlen=capacity)
+
+    def install(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+        event.listen(engine.sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine.sync_engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def uninstall(self, engine: AsyncEngine) -> None:
+        event.remove(engine.sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(engine.sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        if self._engine is engine:
+            self._engine = None
+
+    def snapshot(self) -> list[SlowQuery]:
+        return list(self.records)
+
+    def clear(self) -> None:
+        self.records.clear()
+
+    def dump_jsonl(self, path: Path) -> int:
+        records = self.snapshot()
+        with path.open("a", encoding="utf-8") as handle:
+            for record in records:
+                handle.write(json.dumps(asdict(record), default=str) + "\n")
+        return len(records)
+
+    async def wait_for_explains(self) -> None:
+        while self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+
+    def _before_cursor_execute(self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        if context is not None:
+            context._slow_query_started = time.perf_counter()
+
+    def _after_cursor_execute(self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        started = getattr(context, "_slow_query_started", None)
+        if started is None or _explaining.get():
+            return
+        duration_ms = (time.perf_counter() - started) * 1000
+        if duration_ms < self.threshold_ms:
+            return
+
+        record = SlowQuery(
+            statement=statement,
+            parameters=repr(parameters)[:MAX_PARAMETERS_LENGTH],
+            duration_ms=round(duration_ms, 3),
+            endpoint=current_endpoint(),
+            recorded_at=datetime.now(UTC),
+        )
+        self.records.append(record)
+
+        if not self.explain or executemany or self._engine is None:
+            return
+        if len(self._pending) >= self.max_pending_explains:
+            record.explain_error = "Skipped: too many EXPLAIN captures in flight"
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        # A fresh context keeps the capture out of the issuing request's metrics and traces.
+        task = loop.create_task(self._capture_plan(record, statement, parameters), context=Context())
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _capture_plan(self, record: SlowQuery, statement: str, parameters: Any) -> None:
+        engine = self._engine
+        if engine is None:
+            return
+        token = _explaining.set(True)
+        try:
+            async with engine.connect() as conn:
+                # EXPLAIN ANALYZE executes the statement, so only read-only statements get it and everything rolls back.
+                async with conn.begin() as transaction:
+                    if engine.dialect.name == "postgresql":
+                        await conn.exec_driver_sql("SET TRANSACTION READ ONLY")
+                    result = await conn.exec_driver_sql(_explain_prefix(engine, statement) + statement, parameters)
+                    record.plan = "\n".join(" ".join(str(value) for value in row) for row in result.all())
+                    await transaction.rollback()
+        except Exception as exc:
+            record.explain_error = f"{type(exc).__name__}: {exc}"[:MAX_PARAMETERS_LENGTH]
+            logger.debug("Slow query EXPLAIN failed", exc_info=True)
+        finally:
+            _explaining.reset(token)
+
+
+def _explain_prefix(engine: AsyncEngine, statement: str) -> str:
+    if engine.dialect.name == "postgresql":
+        return "EXPLAIN (ANALYZE, BUFFERS) " if _is_plain_select(statement) else "EXPLAIN "
+    if engine.dialect.name == "sqlite":
+        return "EXPLAIN QUERY PLAN "
+    return "EXPLAIN "
+
+
+def _is_plain_select(statement: str) -> bool:
+    keyword = statement.lstrip().split(None, 1)[0].upper()
+    return keyword in {"SELECT", "WITH"} and _NOT_READ_ONLY.search(statement) is None
+
+
+slow_query_log = SlowQueryLog()
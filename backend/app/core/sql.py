@@ -0,0 +1,20 @@
+from sqlalchemy import Date
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class month_trunc(FunctionElement):
+    # First day of the value's month, computed natively by each dialect so grouping never calls back into Python.
+    type = Date()
+    name = "month_trunc"
+    inherit_cache = True
+
+
+@compiles(month_trunc)
+def _compile_month_trunc(element: month_trunc, compiler, **kw) -> str:
+    return f"CAST(date_trunc('month', {compiler.process(element.clauses, **kw)}) AS DATE)"
+
+
+@compiles(month_trunc, "sqlite")
+def _compile_month_trunc_sqlite(element: month_trunc, compiler, **kw) -> str:
+    return f"date({compiler.process(element.clauses, **kw)}, 'start of month')"
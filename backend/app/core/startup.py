@@ -0,0 +1,22 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+_phases: list[tuple[str, float]] = []
+
+
+@contextmanager
+def startup_phase(name: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _phases.append((name, time.perf_counter() - started))
+
+
+def get_startup_phases() -> list[tuple[str, float]]:
+    return list(_phases)
+
+
+def reset_startup_phases() -> None:
+    _phases.clear()
@@ -0,0 +1,255 @@
+import functools
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import re
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import UNMATCHED_ROUTE
+
+MAX_STATEMENT_LENGTH = 2000
+RESOLVE_SPAN = "request.resolve"
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+class Span:
+    __slots__ = ("name", "span_id", "parent_id", "start_ns", "end_ns", "attributes")
+
+    def __init__(self, name: str, parent_id: str | None, start_ns: int | None = None, **attributes: Any) -> None:
+        self.name = name
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.start_ns = start_ns or time.time_ns()
+        self.end_ns: int | None = None
+        self.attributes = attributes
+
+
+class Trace:
+    __slots__ = ("trace_id", "root", "spans", "endpoint_end_ns")
+
+    def __init__(self, trace_id: str, root: Span) -> None:
+        self.trace_id = trace_id
+        self.root = root
+        self.spans: list[Span] = []
+        self.endpoint_end_ns: int | None = None
+
+    def finish(self, span: Span, end_ns: int | None = None) -> None:
+        span.end_ns = end_ns or time.time_ns()
+        self.spans.append(span)
+
+
+_current_trace: ContextVar[Trace | None] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    def __init__(self, sample_rate: float = 0.01) -> None:
+        self.sample_rate = sample_rate
+        self._queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        self._listener: logging.handlers.QueueListener | None = None
+
+    def configure(self, sample_rate: float, path: Path, max_bytes: int, backup_count: int) -> None:
+        # Spans are handed to a background thread through a queue, so a request only pays for json.dumps; the file
+        # write and rotation never run on the event loop.
+        self.stop()
+        self.sample_rate = sample_rate
+        handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self._listener = logging.handlers.QueueListener(self._queue, handler)
+        self._listener.start()
+
+    def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
+
+    def install(self, engine: AsyncEngine) -> None:
+        event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine.sync_engine, "handle_error", _handle_error)
+
+    def uninstall(self, engine: AsyncEngine) -> None:
+        event.remove(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.remove(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+        event.remove(engine.sync_engine, "handle_error", _handle_error)
+
+    def should_sample(self, parent_flags: str | None) -> bool:
+        if parent_flags is not None:
+            return int(parent_flags, 16) & 1 == 1
+        return random.random() < self.sample_rate
+
+    def export(self, trace: Trace) -> None:
+        if self._listener is None:
+            return
+        for finished in trace.spans:
+            line = json.dumps(
+                {
+                    "traceId": trace.trace_id,
+                    "spanId": finished.span_id,
+                    "parentSpanId": finished.parent_id,
+                    "name": finished.name,
+                    "startTimeUnixNano": finished.start_ns,
+                    "endTimeUnixNano": finished.end_ns,
+                    "attributes": finished.attributes,
+                },
+                default=str,
+            )
+            self._queue.put_nowait(logging.makeLogRecord({"msg": line, "levelno": logging.INFO}))
+
+
+class TracingMiddleware:
+    def __init__(self, app: ASGIApp, tracer: Tracer | None = None) -> None:
+        self.app = app
+        self.tracer = tracer or request_tracer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        parent = _parse_traceparent(scope)
+        if not self.tracer.should_sample(parent[2] if parent else None):
+            await self.app(scope, receive, send)
+            return
+
+        trace_id, parent_id = (parent[0], parent[1]) if parent else (os.urandom(16).hex(), None)
+        root = Span("http.request", parent_id, **{"http.method": scope["method"], "http.target": scope["path"]})
+        trace = Trace(trace_id, root)
+        # Routing, body parsing and dependency resolution all happen before the endpoint runs; the endpoint wrapper
+        # closes this span, so anything left open here was spent resolving the request.
+        resolve = Span(RESOLVE_SPAN, root.span_id)
+        trace_token = _current_trace.set(trace)
+        span_token = _current_span.set(resolve)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                root.attributes["http.status_code"] = message["status"]
+                if trace.endpoint_end_ns is not None:
+                    trace.finish(Span("response.encode", root.span_id, trace.endpoint_end_ns))
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"traceresponse", f"00-{trace_id}-{root.span_id}-01".encode()),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_span.reset(span_token)
+            _current_trace.reset(trace_token)
+            if resolve.end_ns is None:
+                trace.finish(resolve)
+            route = scope.get("route")
+            root.name = f"{scope['method']} {getattr(route, 'path', UNMATCHED_ROUTE)}"
+            root.attributes["http.route"] = getattr(route, "path", UNMATCHED_ROUTE)
+            trace.finish(root)
+            self.tracer.export(trace)
+
+
+class TracedRoute(APIRoute):
+    # Wrapping the analysed endpoint call, not the endpoint itself, leaves FastAPI's signature inspection untouched.
+    def get_route_handler(self):
+        self.dependant.call = _traced_endpoint(self.dependant.call)
+        return super().get_route_handler()
+
+
+def _traced_endpoint(call):
+    @functools.wraps(call)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        trace = _current_trace.get()
+        if trace is None:
+            return await call(*args, **kwargs)
+        resolve = _current_span.get()
+        if resolve is not None and resolve.name == RESOLVE_SPAN and resolve.end_ns is None:
+            trace.finish(resolve)
+            # Not reset on purpose: encoding the response afterwards belongs to the request, not to resolution.
+            _current_span.set(trace.root)
+        endpoint = Span("endpoint", trace.root.span_id, **{"code.function": call.__name__})
+        token = _current_span.set(endpoint)
+        try:
+            return await call(*args, **kwargs)
+        finally:
+            _current_span.reset(token)
+            trace.finish(endpoint)
+            trace.endpoint_end_ns = endpoint.end_ns
+
+    return wrapper
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span | None]:
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+    parent = _current_span.get()
+    current = Span(name, parent.span_id if parent else trace.root.span_id, **attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    finally:
+        _current_span.reset(token)
+        trace.finish(current)
+
+
+def _parse_traceparent(scope: Scope) -> tuple[str, str, str] | None:
+    for name, value in scope["headers"]:
+        if name == b"traceparent":
+            match = _TRACEPARENT.match(value.decode("latin-1").strip().lower())
+            if match is None or match.group(1) == "0" * 32 or match.group(2) == "0" * 16:
+                return None
+            return match.group(1), match.group(2), match.group(3)
+    return None
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    trace = _current_trace.get()
+    if trace is None or context is None:
+        return
+    parent = _current_span.get()
+    context._trace_span = Span(
+        "db.statement",
+        parent.span_id if parent else trace.root.span_id,
+        **{"db.system": conn.dialect.name, "db.statement": statement[:MAX_STATEMENT_LENGTH]},
+    )
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    _finish_statement_span(context)
+
+
+def _handle_error(exception_context: Any) -> None:
+    context = exception_context.execution_context
+    current = getattr(context, "_trace_span", None)
+    if current is not None:
+        current.attributes["error"] = type(exception_context.original_exception).__name__
+    _finish_statement_span(context)
+
+
+def _finish_statement_span(context: Any) -> None:
+    current = getattr(context, "_trace_span", None)
+    trace = _current_trace.get()
+    if current is None or trace is None:
+        return
+    context._trace_span = None
+    trace.finish(current)
+
+
+request_tracer = Tracer()
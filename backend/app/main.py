@@ -1,40 +1,138 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
+from app.core import metrics
 from app.core.config import get_settings
-from app.core.database import AsyncSessionLocal
+from app.core.database import dispose_engine, get_engine, get_session_factory, get_shard_router, warm_pool
+from app.core.loop_monitor import loop_monitor
+from app.core.query_budget import query_budget
+from app.core.request_context import RequestContextMiddleware
+from app.core.startup import startup_phase
+from app.core.tracing import TracingMiddleware, request_tracer
 from app.routers.auth import router as auth_router
+from app.routers.budgets import router as budgets_router
 from app.routers.categories import router as categories_router
+from app.routers.debug import router as debug_router
+from app.routers.events import router as events_router
+from app.routers.recurring_rules import router as recurring_rules_router
 from app.routers.reports import router as reports_router
 from app.routers.transactions import router as transactions_router
+from app.routers.users import router as users_router
+from app.services.account_service import run_account_deleter
 from app.services.demo_seed_service import ensure_demo_data
+from app.services.demo_tenant_service import run_demo_reaper
+from app.services.event_service import get_event_broker
+from app.services.recurring_rule_service import run_recurring_scheduler
+from app.services.report_job_service import get_report_jobs
+from app.services.token_service import load_revocations, run_revocation_sync
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    settings = get_settings()
+    with startup_phase("engine"):
+        get_engine()
+    with startup_phase("pool_warmup"):
+        await warm_pool(settings.db_pool_warmup_connections)
+    with startup_phase("revocations"):
+        async with get_session_factory()() as session:
+            await load_revocations(session)
+
+    background_tasks: set[asyncio.Task] = {
+        asyncio.create_task(run_revocation_sync(get_session_factory())),
+        asyncio.create_task(run_account_deleter(get_session_factory())),
+    }
+    if get_engine().dialect.name == "postgresql":
+        # Workers share nothing in memory; LISTEN/NOTIFY on the directory database carries events between them.
+        background_tasks.add(asyncio.create_task(get_event_broker().run_postgres_relay(get_engine())))
+    if settings.demo_mode:
+        background_tasks.add(asyncio.create_task(_seed_demo_data()))
+        background_tasks.add(asyncio.create_task(run_demo_reaper(get_session_factory())))
+    if settings.recurring_scheduler_enabled:
+        for _, session_factory in get_shard_router().session_factories():
+            background_tasks.add(asyncio.create_task(run_recurring_scheduler(session_factory)))
+    app.state.background_tasks = background_tasks
+    if settings.loop_monitor_enabled:
+        loop_monitor.configure(
+            interval_ms=settings.loop_monitor_interval_ms,
+            threshold_ms=settings.loop_stall_threshold_ms,
+            capacity=settings.loop_stall_buffer_size,
+        )
+        loop_monitor.start()
+
+    yield
+
+    await loop_monitor.stop()
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await get_report_jobs().stop()
+    await dispose_engine()
+    request_tracer.stop()
+
+
+async def _seed_demo_data() -> None:
+    try:
+        with startup_phase("demo_seed"):
+            async with get_session_factory()() as session:
+                await ensure_demo_data(session)
+    except Exception:
+        logger.exception("Demo data seeding failed")
+
 
-settings = get_settings()
-app = FastAPI(title=settings.app_name)
+def create_app() -> FastAPI:
+    settings = get_settings()
+    app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
-origins = [origin.strip() for origin in settings.cors_origins.split(",") if origin.strip()]
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+    origins = [origin.strip() for origin in settings.cors_origins.split(",") if origin.strip()]
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    app.add_middleware(RequestContextMiddleware)
+    if settings.metrics_enabled:
+        app.add_middleware(metrics.MetricsMiddleware)
+    if settings.tracing_enabled:
+        request_tracer.configure(
+            sample_rate=settings.trace_sample_rate,
+            path=Path(settings.trace_export_path),
+            max_bytes=settings.trace_export_max_bytes,
+            backup_count=settings.trace_export_backup_count,
+        )
+        app.add_middleware(TracingMiddleware)
 
-app.include_router(auth_router)
-app.include_router(categories_router)
-app.include_router(transactions_router)
-app.include_router(reports_router)
+    app.include_router(auth_router)
+    app.include_router(users_router)
+    app.include_router(categories_router)
+    app.include_router(transactions_router)
+    app.include_router(recurring_rules_router)
+    app.include_router(budgets_router)
+    app.include_router(reports_router)
+    app.include_router(events_router)
+    app.include_router(debug_router)
 
+    @app.get("/health")
+    @query_budget(0)
+    async def health_check() -> dict[str, str]:
+        return {"status": "ok"}
 
-@app.on_event("startup")
-async def seed_demo_data_on_startup() -> None:
-    if not settings.demo_mode:
-        return
-    async with AsyncSessionLocal() as session:
-        await ensure_demo_data(session)
+    if settings.metrics_enabled:
 
+        @app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+        @query_budget(0)
+        async def metrics_endpoint() -> PlainTextResponse:
+            return PlainTextResponse(metrics.registry.render(), media_type="text/plain; version=0.0.4")
 
-@app.get("/health")
-async def health_check() -> dict[str, str]:
-    return {"status": "ok"}
+    return app
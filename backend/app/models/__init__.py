@@ -1,5 +1,11 @@
+from app.models.anomaly import CategoryAmountStats
+from app.models.budget import Budget, BudgetEvent, BudgetSpend
 from app.models.category import Category
+from app.models.forecast import CashFlowForecast
+from app.models.fx_rate import FxRate
+from app.models.recurring_rule import RecurringRule
+from app.models.refresh_token import RefreshToken
 from app.models.transaction import Transaction
 from app.models.user import User
 
-__all__ = ["User", "Category", "Transaction"]
\ No newline at end of file
+__all__ = ["User", "Category", "Transaction", "RecurringRule", "Budget", "BudgetSpend", "BudgetEvent", "FxRate", "CashFlowForecast", "CategoryAmountStats", "RefreshToken"]
\ No newline at end of file
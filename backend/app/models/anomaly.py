@@ -0,0 +1,18 @@
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import ForeignKey, Integer, Numeric, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class CategoryAmountStats(Base):
+    __tablename__ = "category_amount_stats"
+
+    category_id: Mapped[int] = mapped_column(ForeignKey("categories.id", ondelete="CASCADE"), primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    sample_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    median: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False)
+    mad: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
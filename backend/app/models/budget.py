@@ -0,0 +1,53 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import CheckConstraint, Date, Enum, ForeignKey, Integer, Numeric, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import Base, TimestampMixin
+from app.models.enums import BudgetPeriod
+
+
+class Budget(Base, TimestampMixin):
+    __tablename__ = "budgets"
+    __table_args__ = (
+        CheckConstraint("limit_amount > 0", name="limit_positive"),
+        UniqueConstraint("category_id", "period", name="uq_budgets_category_period"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    category_id: Mapped[int] = mapped_column(ForeignKey("categories.id", ondelete="CASCADE"), nullable=False)
+    period: Mapped[BudgetPeriod] = mapped_column(
+        Enum(
+            BudgetPeriod,
+            name="budget_period",
+            native_enum=True,
+            values_callable=lambda enum_cls: [member.value for member in enum_cls],
+        ),
+        nullable=False,
+    )
+    limit_amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+
+    category = relationship("Category")
+
+
+class BudgetSpend(Base):
+    __tablename__ = "budget_spend"
+
+    budget_id: Mapped[int] = mapped_column(ForeignKey("budgets.id", ondelete="CASCADE"), primary_key=True)
+    period_start: Mapped[date] = mapped_column(Date, primary_key=True)
+    spent: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=Decimal("0"))
+
+
+class BudgetEvent(Base, TimestampMixin):
+    __tablename__ = "budget_events"
+    __table_args__ = (
+        UniqueConstraint("budget_id", "period_start", "threshold", name="uq_budget_events_budget_period_threshold"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    budget_id: Mapped[int] = mapped_column(ForeignKey("budgets.id", ondelete="CASCADE"), nullable=False)
+    period_start: Mapped[date] = mapped_column(Date, nullable=False)
+    threshold: Mapped[int] = mapped_column(Integer, nullable=False)
+    spent: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False)
@@ -3,4 +3,17 @@ import enum
 
 class TransactionType(str, enum.Enum):
     INCOME = "income"
-    EXPENSE = "expense"
\ No newline at end of file
+    EXPENSE = "expense"
+
+
+class RecurrenceFrequency(str, enum.Enum):
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+    YEARLY = "yearly"
+
+
+class BudgetPeriod(str, enum.Enum):
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+    YEARLY = "yearly"
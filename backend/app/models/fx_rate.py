@@ -0,0 +1,16 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import CheckConstraint, Date, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class FxRate(Base):
+    __tablename__ = "fx_rates"
+    __table_args__ = (CheckConstraint("rate > 0", name="rate_positive"),)
+
+    currency: Mapped[str] = mapped_column(String(3), primary_key=True)
+    date: Mapped[date] = mapped_column(Date, primary_key=True)
+    rate: Mapped[Decimal] = mapped_column(Numeric(18, 8), nullable=False)
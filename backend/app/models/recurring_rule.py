@@ -0,0 +1,46 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import CheckConstraint, Date, Enum, ForeignKey, Numeric, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import Base, TimestampMixin
+from app.models.enums import RecurrenceFrequency, TransactionType
+
+
+class RecurringRule(Base, TimestampMixin):
+    __tablename__ = "recurring_rules"
+    __table_args__ = (
+        CheckConstraint("amount > 0", name="amount_positive"),
+        CheckConstraint("end_date IS NULL OR end_date >= anchor_date", name="end_after_anchor"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    category_id: Mapped[int] = mapped_column(ForeignKey("categories.id", ondelete="RESTRICT"), nullable=False, index=True)
+    amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    type: Mapped[TransactionType] = mapped_column(
+        Enum(
+            TransactionType,
+            name="transaction_type",
+            native_enum=True,
+            values_callable=lambda enum_cls: [member.value for member in enum_cls],
+        ),
+        nullable=False,
+    )
+    currency: Mapped[str] = mapped_column(String(3), nullable=False)
+    note: Mapped[str | None] = mapped_column(Text, nullable=True)
+    frequency: Mapped[RecurrenceFrequency] = mapped_column(
+        Enum(
+            RecurrenceFrequency,
+            name="recurrence_frequency",
+            native_enum=True,
+            values_callable=lambda enum_cls: [member.value for member in enum_cls],
+        ),
+        nullable=False,
+    )
+    anchor_date: Mapped[date] = mapped_column(Date, nullable=False)
+    end_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    materialized_through: Mapped[date | None] = mapped_column(Date, nullable=True)
+
+    category = relationship("Category")
@@ -1,7 +1,7 @@
 from datetime import date
 from decimal import Decimal
 
-from sqlalchemy import CheckConstraint, Date, Enum, ForeignKey, Numeric, String, Text
+from sqlalchemy import CheckConstraint, Date, Enum, ForeignKey, Index, Numeric, String, Text, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin
@@ -12,6 +12,14 @@ class Transaction(Base, TimestampMixin):
     __tablename__ = "transactions"
     __table_args__ = (
         CheckConstraint("amount > 0", name="amount_positive"),
+        UniqueConstraint("recurring_rule_id", "occurrence_date", name="uq_transactions_recurring_rule_occurrence"),
+        Index(
+            "ix_transactions_anomalies",
+            "user_id",
+            "date",
+            postgresql_where=text("anomaly_score IS NOT NULL"),
+            sqlite_where=text("anomaly_score IS NOT NULL"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
@@ -27,8 +35,14 @@ class Transaction(Base, TimestampMixin):
         ),
         nullable=False,
     )
+    currency: Mapped[str] = mapped_column(String(3), nullable=False)
     note: Mapped[str | None] = mapped_column(Text, nullable=True)
     date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    recurring_rule_id: Mapped[int | None] = mapped_column(
+        ForeignKey("recurring_rules.id", ondelete="SET NULL"), nullable=True
+    )
+    occurrence_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    anomaly_score: Mapped[Decimal | None] = mapped_column(Numeric(6, 2), nullable=True)
 
     user = relationship("User", back_populates="transactions")
     category = relationship("Category", back_populates="transactions")
@@ -1,4 +1,6 @@
-from sqlalchemy import String
+from datetime import datetime
+
+from sqlalchemy import JSON, Boolean, DateTime, Integer, String, false
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin
@@ -11,6 +13,18 @@ class User(Base, TimestampMixin):
     name: Mapped[str] = mapped_column(String(120), nullable=False)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
+    expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True, index=True)
+    shard: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    shard_moving: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default=false())
+    # Bumped by every commit that writes the user's data, in the database that holds it; cached and stored forecasts
+    # are keyed on it.
+    data_version: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    deleted_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, index=True)
+    # Written by the account deleter after every chunk: the table being purged and the rows removed per table.
+    deletion_phase: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    deletion_progress: Mapped[dict[str, int] | None] = mapped_column(JSON, nullable=True)
 
-    categories = relationship("Category", back_populates="user", cascade="all, delete-orphan")
-    transactions = relationship("Transaction", back_populates="user", cascade="all, delete-orphan")
\ No newline at end of file
+    categories = relationship("Category", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    transactions = relationship(
+        "Transaction", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
\ No newline at end of file
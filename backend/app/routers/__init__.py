@@ -1,6 +1,11 @@
 from app.routers.auth import router as auth_router
+from app.routers.budgets import router as budgets_router
 from app.routers.categories import router as categories_router
+from app.routers.debug import router as debug_router
+from app.routers.events import router as events_router
+from app.routers.recurring_rules import router as recurring_rules_router
 from app.routers.reports import router as reports_router
 from app.routers.transactions import router as transactions_router
+from app.routers.users import router as users_router
 
-__all__ = ["auth_router", "categories_router", "transactions_router", "reports_router"]
\ No newline at end of file
+__all__ = ["auth_router", "users_router", "categories_router", "transactions_router", "recurring_rules_router", "budgets_router", "reports_router", "events_router", "debug_router"]
\ No newline at end of file
@@ -1,28 +1,42 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db_session
+from app.core.query_budget import query_budget
+from app.core.tracing import TracedRoute
 from app.schemas.auth import AuthResponse, AuthTokens, LoginRequest, RefreshTokenRequest, RegisterRequest
 from app.services.auth_service import demo_login_user, login_user, refresh_tokens, register_user
+from app.services.token_service import revoke_refresh_token
 
-router = APIRouter(prefix="/auth", tags=["Auth"])
+router = APIRouter(prefix="/auth", tags=["Auth"], route_class=TracedRoute)
 
 
 @router.post("/register", response_model=AuthResponse, status_code=status.HTTP_201_CREATED)
+@query_budget(4)
 async def register(payload: RegisterRequest, db: AsyncSession = Depends(get_db_session)) -> AuthResponse:
     return await register_user(db, payload)
 
 
 @router.post("/login", response_model=AuthResponse)
+@query_budget(2)
 async def login(payload: LoginRequest, db: AsyncSession = Depends(get_db_session)) -> AuthResponse:
     return await login_user(db, payload)
 
 
 @router.post("/refresh", response_model=AuthTokens)
+@query_budget(3)
 async def refresh(payload: RefreshTokenRequest, db: AsyncSession = Depends(get_db_session)) -> AuthTokens:
     return await refresh_tokens(db, payload)
 
 
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
+@query_budget(1)
+async def logout(payload: RefreshTokenRequest, db: AsyncSession = Depends(get_db_session)) -> Response:
+    await revoke_refresh_token(db, payload.refresh_token)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
 @router.post("/demo", response_model=AuthResponse)
+@query_budget(6)
 async def demo_login(db: AsyncSession = Depends(get_db_session)) -> AuthResponse:
     return await demo_login_user(db)
@@ -0,0 +1,82 @@
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dependencies import get_current_user, get_user_db_session
+from app.core.query_budget import query_budget
+from app.core.tracing import TracedRoute
+from app.models.user import User
+from app.schemas.budget import BudgetCreate, BudgetEventRead, BudgetRead, BudgetStatusResponse, BudgetUpdate
+from app.services.budget_service import (
+    create_budget,
+    delete_budget,
+    get_budget_status,
+    list_budget_events,
+    list_budgets,
+    update_budget,
+)
+
+router = APIRouter(prefix="/budgets", tags=["Budgets"], route_class=TracedRoute)
+
+
+@router.post("", response_model=BudgetRead, status_code=status.HTTP_201_CREATED)
+@query_budget(7)
+async def create_budget_endpoint(
+    payload: BudgetCreate,
+    db: AsyncSession = Depends(get_user_db_session),
+    current_user: User = Depends(get_current_user),
+) -> BudgetRead:
+    budget = await create_budget(db, current_user.id, payload)
+    return BudgetRead.model_validate(budget)
+
+
+@router.get("", response_model=list[BudgetRead])
+@query_budget(2)
+async def list_budgets_endpoint(
+    db: AsyncSession = Depends(get_user_db_session),
+    current_user: User = Depends(get_current_user),
+) -> list[BudgetRead]:
+    budgets = await list_budgets(db, current_user.id)
+    return [BudgetRead.model_validate(budget) for budget in budgets]
+
+
+@router.get("/status", response_model=BudgetStatusResponse)
+@query_budget(2)
+async def budget_status_endpoint(
+    db: AsyncSession = Depends(get_user_db_session),
+    current_user: User = Depends(get_current_user),
+) -> BudgetStatusResponse:
+    return await get_budget_status(db, current_user.id)
+
+
+@router.get("/events", response_model=list[BudgetEventRead])
+@query_budget(2)
+async def list_budget_events_endpoint(
+    limit: int = Query(default=50, ge=1, le=500),
+    db: AsyncSession = Depends(get_user_db_session),
+    current_user: User = Depends(get_current_user),
+) -> list[BudgetEventRead]:
+    events = await list_budget_events(db, current_user.id, limit)
+    return [BudgetEventRead.model_validate(event) for event in events]
+
+
+@router.put("/{budget_id}", response_model=BudgetRead)
+@query_budget(8)
+async def update_budget_endpoint(
+    budget_id: int,
+    payload: BudgetUpdate,
+    db: AsyncSession = Depends(get_user_db_session),
+    current_user: User = Depends(get_current_user),
+) -> BudgetRead:
+    budget = await update_budget(db, current_user.id, budget_id, payload)
+    return BudgetRead.model_validate(budget)
+
+
+@router.delete("/{budget_id}", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
+@query_budget(5)
+async def delete_budget_endpoint(
+    budget_id: int,
+    db: AsyncSession = Depends(get_user_db_session),
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    await delete_budget(db, current_user.id, budget_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
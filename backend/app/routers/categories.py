@@ -1,19 +1,34 @@
 from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db_session
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user, get_user_db_session
+from app.core.query_budget import query_budget
+from app.core.tracing import TracedRoute
 from app.models.user import User
-from app.schemas.category import CategoryCreate, CategoryRead, CategoryWithCount
-from app.services.category_service import create_category, delete_category, list_categories
+from app.schemas.category import (
+    CategoryCreate,
+    CategoryMerge,
+    CategoryMoveResult,
+    CategoryRead,
+    CategoryReassign,
+    CategoryWithCount,
+)
+from app.services.category_service import (
+    create_category,
+    delete_category,
+    list_categories,
+    merge_category,
+    reassign_category_transactions,
+)
 
-router = APIRouter(prefix="/categories", tags=["Categories"])
+router = APIRouter(prefix="/categories", tags=["Categories"], route_class=TracedRoute)
 
 
 @router.post("", response_model=CategoryRead, status_code=status.HTTP_201_CREATED)
+@query_budget(4)
 async def create_category_endpoint(
     payload: CategoryCreate,
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_user_db_session),
     current_user: User = Depends(get_current_user),
 ) -> CategoryRead:
     category = await create_category(db, current_user.id, payload)
@@ -21,18 +36,49 @@ async def create_category_endpoint(
 
 
 @router.get("", response_model=list[CategoryWithCount])
+@query_budget(2)
 async def list_categories_endpoint(
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_user_db_session),
     current_user: User = Depends(get_current_user),
 ) -> list[CategoryWithCount]:
     return await list_categories(db, current_user.id)
 
 
 @router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
+@query_budget(5)
 async def delete_category_endpoint(
     category_id: int,
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_user_db_session),
     current_user: User = Depends(get_current_user),
 ) -> Response:
     await delete_category(db, current_user.id, category_id)
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post("/{category_id}/merge", response_model=CategoryMoveResult)
+@query_budget(15, per_chunk=7)
+async def merge_category_endpoint(
+    category_id: int,
+    payload: CategoryMerge,
+    db: AsyncSession = Depends(get_user_db_session),
+    current_user: User = Depends(get_current_user),
+) -> CategoryMoveResult:
+    return await merge_category(db, current_user.id, category_id, payload.target_category_id)
+
+
+@router.post("/{category_id}/reassign", response_model=CategoryMoveResult)
+@query_budget(13, per_chunk=7)
+async def reassign_category_endpoint(
+    category_id: int,
+    payload: CategoryReassign,
+    db: AsyncSession = Depends(get_user_db_session),
+    current_user: User = Depends(get_current_user),
+) -> CategoryMoveResult:
+    return await reassign_category_transactions(
+        db,
+        current_user.id,
+        category_id,
+        payload.target_category_id,
+        start_date=payload.start_date,
+        end_date=payload.end_date,
+    )
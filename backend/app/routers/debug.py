@@ -0,0 +1,123 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import PlainTextResponse
+
+from app.core import profiling
+from app.core.config import get_settings
+from app.core.dependencies import get_current_admin
+from app.core.loop_monitor import loop_monitor
+from app.core.query_budget import query_budget
+from app.core.slow_queries import slow_query_log
+from app.core.tracing import TracedRoute
+from app.models.user import User
+from app.schemas.debug import (
+    BlockingSiteRead,
+    HeapDiffItem,
+    HeapDiffResponse,
+    LoopStallListResponse,
+    LoopStallRead,
+    SlowQueryListResponse,
+    SlowQueryRead,
+)
+
+router = APIRouter(prefix="/debug", tags=["Debug"], route_class=TracedRoute)
+
+
+@router.get("/slow-queries", response_model=SlowQueryListResponse)
+@query_budget(1)
+async def slow_queries_endpoint(
+    limit: int = Query(default=50, ge=1, le=1000),
+    _: User = Depends(get_current_admin),
+) -> SlowQueryListResponse:
+    records = slow_query_log.snapshot()[-limit:]
+    return SlowQueryListResponse(
+        enabled=get_settings().slow_query_log_enabled,
+        threshold_ms=slow_query_log.threshold_ms,
+        items=[SlowQueryRead.model_validate(record) for record in reversed(records)],
+    )
+
+
+@router.get("/slow-queries.jsonl", response_class=Response)
+@query_budget(1)
+async def slow_queries_jsonl_endpoint(_: User = Depends(get_current_admin)) -> Response:
+    lines = [SlowQueryRead.model_validate(record).model_dump_json() for record in slow_query_log.snapshot()]
+    return Response(content="".join(f"{line}\n" for line in lines), media_type="application/x-ndjson")
+
+
+@router.get("/event-loop", response_model=LoopStallListResponse)
+@query_budget(1)
+async def event_loop_stalls_endpoint(
+    limit: int = Query(default=50, ge=1, le=1000),
+    _: User = Depends(get_current_admin),
+) -> LoopStallListResponse:
+    records = loop_monitor.snapshot()[-limit:]
+    return LoopStallListResponse(
+        enabled=loop_monitor.running,
+        threshold_ms=loop_monitor.threshold_ms,
+        sites=[
+            BlockingSiteRead(
+                site=site.site,
+                count=site.count,
+                total_ms=round(site.total_ms, 3),
+                max_ms=round(site.max_ms, 3),
+                endpoints=sorted(site.endpoints),
+            )
+            for site in loop_monitor.top_sites(limit)
+        ],
+        items=[LoopStallRead.model_validate(record) for record in reversed(records)],
+    )
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+@query_budget(1)
+async def profile_endpoint(
+    seconds: float = Query(default=10.0, gt=0, le=60),
+    hz: int = Query(default=100, ge=1, le=250),
+    _: User = Depends(get_current_admin),
+) -> PlainTextResponse:
+    _acquire_capture()
+    try:
+        collapsed, samples = await profiling.profile(seconds, hz)
+    finally:
+        profiling.release()
+    return PlainTextResponse(collapsed, headers={"X-Profile-Samples": str(samples)})
+
+
+@router.get("/heap", response_model=HeapDiffResponse)
+@query_budget(1)
+async def heap_endpoint(
+    seconds: float = Query(default=10.0, gt=0, le=60),
+    limit: int = Query(default=25, ge=1, le=500),
+    group_by: Literal["lineno", "filename", "traceback"] = Query(default="lineno"),
+    _: User = Depends(get_current_admin),
+) -> HeapDiffResponse:
+    _acquire_capture()
+    try:
+        stats, current, peak = await profiling.heap_diff(seconds, group_by, limit)
+    finally:
+        profiling.release()
+    return HeapDiffResponse(
+        seconds=seconds,
+        group_by=group_by,
+        traced_current_bytes=current,
+        traced_peak_bytes=peak,
+        items=[
+            HeapDiffItem(
+                location=profiling.format_traceback(stat.traceback),
+                size_bytes=stat.size,
+                size_diff_bytes=stat.size_diff,
+                count=stat.count,
+                count_diff=stat.count_diff,
+            )
+            for stat in stats
+        ],
+    )
+
+
+def _acquire_capture() -> None:
+    if not profiling.try_acquire():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A profile or heap capture is already running on this worker",
+        )
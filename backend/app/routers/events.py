@@ -0,0 +1,82 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.core.database import get_db_session_factory
+from app.core.dependencies import authenticate_access_token, get_current_user
+from app.core.query_budget import query_budget
+from app.core.tracing import TracedRoute
+from app.models.user import User
+from app.services.event_service import user_events
+
+router = APIRouter(prefix="/events", tags=["Events"], route_class=TracedRoute)
+
+
+@router.get("/stream")
+@query_budget(1)
+async def stream_events_endpoint(current_user: User = Depends(get_current_user)) -> StreamingResponse:
+    user_id = current_user.id
+
+    async def events() -> AsyncIterator[str]:
+        async for event in user_events(user_id):
+            if event is None:
+                yield ": keep-alive\n\n"
+                continue
+            name, data = event
+            yield f"event: {name}\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws")
+async def events_websocket(
+    websocket: WebSocket,
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_db_session_factory),
+) -> None:
+    # Browsers cannot set headers on a WebSocket handshake, and tokens in URLs end up in access logs, so the access
+    # token is the first message instead.
+    await websocket.accept()
+    try:
+        token = await asyncio.wait_for(websocket.receive_text(), timeout=get_settings().events_auth_timeout_seconds)
+    except (TimeoutError, WebSocketDisconnect):
+        await _close_unauthorized(websocket)
+        return
+    async with session_factory() as db:
+        user = await authenticate_access_token(db, token.strip())
+    if user is None:
+        await _close_unauthorized(websocket)
+        return
+
+    sender = asyncio.create_task(_send_events(websocket, user.id))
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sender.cancel()
+        await asyncio.gather(sender, return_exceptions=True)
+
+
+async def _send_events(websocket: WebSocket, user_id: int) -> None:
+    async for event in user_events(user_id):
+        if event is None:
+            continue
+        name, data = event
+        await websocket.send_text(f'{{"event": {json.dumps(name)}, "data": {data}}}')
+
+
+async def _close_unauthorized(websocket: WebSocket) -> None:
+    try:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Invalid authentication credentials")
+    except RuntimeError:
+        pass
@@ -0,0 +1,72 @@
+from fastapi import APIRouter, Depends, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dependencies import get_current_user, get_user_db_session
+from app.core.query_budget import query_budget
+from app.core.tracing import TracedRoute
+from app.models.user import User
+from app.schemas.recurring_rule import RecurringRuleCreate, RecurringRuleRead, RecurringRuleUpdate
+from app.services.recurring_rule_service import (
+    create_recurring_rule,
+    delete_recurring_rule,
+    get_recurring_rule_or_404,
+    list_recurring_rules,
+    update_recurring_rule,
+)
+
+router = APIRouter(prefix="/recurring-rules", tags=["Recurring Rules"], route_class=TracedRoute)
+
+
+@router.post("", response_model=RecurringRuleRead, status_code=status.HTTP_201_CREATED)
+@query_budget(11)
+async def create_recurring_rule_endpoint(
+    payload: RecurringRuleCreate,
+    db: AsyncSession = Depends(get_user_db_session),
+    current_user: User = Depends(get_current_user),
+) -> RecurringRuleRead:
+    rule = await create_recurring_rule(db, current_user.id, payload)
+    return RecurringRuleRead.model_validate(rule)
+
+
+@router.get("", response_model=list[RecurringRuleRead])
+@query_budget(2)
+async def list_recurring_rules_endpoint(
+    db: AsyncSession = Depends(get_user_db_session),
+    current_user: User = Depends(get_current_user),
+) -> list[RecurringRuleRead]:
+    rules = await list_recurring_rules(db, current_user.id)
+    return [RecurringRuleRead.model_validate(rule) for rule in rules]
+
+
+@router.get("/{rule_id}", response_model=RecurringRuleRead)
+@query_budget(2)
+async def get_recurring_rule_endpoint(
+    rule_id: int,
+    db: AsyncSession = Depends(get_user_db_session),
+    current_user: User = Depends(get_current_user),
+) -> RecurringRuleRead:
+    rule = await get_recurring_rule_or_404(db, current_user.id, rule_id)
+    return RecurringRuleRead.model_validate(rule)
+
+
+@router.put("/{rule_id}", response_model=RecurringRuleRead)
+@query_budget(12)
+async def update_recurring_rule_endpoint(
+    rule_id: int,
+    payload: RecurringRuleUpdate,
+    db: AsyncSession = Depends(get_user_db_session),
+    current_user: User = Depends(get_current_user),
+) -> RecurringRuleRead:
+    rule = await update_recurring_rule(db, current_user.id, rule_id, payload)
+    return RecurringRuleRead.model_validate(rule)
+
+
+@router.delete("/{rule_id}", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
+@query_budget(3)
+async def delete_recurring_rule_endpoint(
+    rule_id: int,
+    db: AsyncSession = Depends(get_user_db_session),
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    await delete_recurring_rule(db, current_user.id, rule_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
@@ -1,34 +1,52 @@
+import asyncio
+from collections.abc import AsyncIterator
 from datetime import date
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db_session
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user, get_user_db_session
+from app.core.query_budget import query_budget
+from app.core.tracing import TracedRoute
 from app.models.enums import TransactionType
 from app.models.user import User
-from app.schemas.report import ReportByCategoryResponse, ReportMonthlyResponse, ReportSummaryResponse
+from app.schemas.common import CURRENCY_PATTERN
+from app.schemas.report import (
+    ForecastResponse,
+    ReportByCategoryResponse,
+    ReportJobCreate,
+    ReportJobRead,
+    ReportMonthlyResponse,
+    ReportSummaryResponse,
+)
+from app.services.forecast_service import MAX_FORECAST_MONTHS, get_forecast_report
+from app.services.report_job_service import get_report_job_or_404, submit_report_job, to_report_job_read
 from app.services.report_service import get_by_category_report, get_monthly_report, get_summary_report
 
-router = APIRouter(prefix="/reports", tags=["Reports"])
+router = APIRouter(prefix="/reports", tags=["Reports"], route_class=TracedRoute)
 
 
 @router.get("/summary", response_model=ReportSummaryResponse)
+@query_budget(3)
 async def summary_report_endpoint(
     start_date: date | None = Query(default=None),
     end_date: date | None = Query(default=None),
-    db: AsyncSession = Depends(get_db_session),
+    currency: str | None = Query(default=None, pattern=CURRENCY_PATTERN),
+    db: AsyncSession = Depends(get_user_db_session),
     current_user: User = Depends(get_current_user),
 ) -> ReportSummaryResponse:
-    return await get_summary_report(db, current_user.id, start_date=start_date, end_date=end_date)
+    return await get_summary_report(db, current_user.id, start_date=start_date, end_date=end_date, currency=currency)
 
 
 @router.get("/by-category", response_model=ReportByCategoryResponse)
+@query_budget(3)
 async def by_category_report_endpoint(
     start_date: date | None = Query(default=None),
     end_date: date | None = Query(default=None),
     type: TransactionType | None = Query(default=None),
-    db: AsyncSession = Depends(get_db_session),
+    currency: str | None = Query(default=None, pattern=CURRENCY_PATTERN),
+    db: AsyncSession = Depends(get_user_db_session),
     current_user: User = Depends(get_current_user),
 ) -> ReportByCategoryResponse:
     return await get_by_category_report(
@@ -37,14 +55,67 @@ async def by_category_report_endpoint(
         start_date=start_date,
         end_date=end_date,
         type_filter=type,
+        currency=currency,
     )
 
 
 @router.get("/monthly", response_model=ReportMonthlyResponse)
+@query_budget(3)
 async def monthly_report_endpoint(
     start_date: date | None = Query(default=None),
     end_date: date | None = Query(default=None),
-    db: AsyncSession = Depends(get_db_session),
+    currency: str | None = Query(default=None, pattern=CURRENCY_PATTERN),
+    db: AsyncSession = Depends(get_user_db_session),
     current_user: User = Depends(get_current_user),
 ) -> ReportMonthlyResponse:
-    return await get_monthly_report(db, current_user.id, start_date=start_date, end_date=end_date)
\ No newline at end of file
+    return await get_monthly_report(db, current_user.id, start_date=start_date, end_date=end_date, currency=currency)
+
+
+@router.get("/forecast", response_model=ForecastResponse)
+@query_budget(5)
+async def forecast_report_endpoint(
+    months: int = Query(default=3, ge=1, le=MAX_FORECAST_MONTHS),
+    currency: str | None = Query(default=None, pattern=CURRENCY_PATTERN),
+    db: AsyncSession = Depends(get_user_db_session),
+    current_user: User = Depends(get_current_user),
+) -> ForecastResponse:
+    return await get_forecast_report(db, current_user.id, months=months, currency=currency)
+
+
+@router.post("/jobs", response_model=ReportJobRead, status_code=status.HTTP_202_ACCEPTED)
+@query_budget(1)
+async def create_report_job_endpoint(
+    payload: ReportJobCreate,
+    current_user: User = Depends(get_current_user),
+) -> ReportJobRead:
+    return submit_report_job(current_user.id, payload, shard=current_user.shard)
+
+
+@router.get("/jobs/{job_id}", response_model=ReportJobRead)
+@query_budget(1)
+async def get_report_job_endpoint(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+) -> ReportJobRead:
+    return to_report_job_read(get_report_job_or_404(current_user.id, job_id))
+
+
+@router.get("/jobs/{job_id}/events")
+@query_budget(1)
+async def stream_report_job_endpoint(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    job = get_report_job_or_404(current_user.id, job_id)
+
+    async def events() -> AsyncIterator[str]:
+        yield f"event: status\ndata: {to_report_job_read(job).model_dump_json()}\n\n"
+        while not job.finished:
+            try:
+                await asyncio.wait_for(job.done.wait(), timeout=15)
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield f"event: status\ndata: {to_report_job_read(job).model_dump_json()}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
@@ -1,14 +1,34 @@
 from datetime import date
 
 from fastapi import APIRouter, Depends, Query, Response, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.core.database import get_db_session
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user, get_user_db_session, get_user_db_session_factory
+from app.core.query_budget import query_budget
+from app.core.tracing import TracedRoute
 from app.models.enums import TransactionType
 from app.models.user import User
-from app.schemas.transaction import TransactionCreate, TransactionListResponse, TransactionRead, TransactionUpdate
+from app.schemas.transaction import (
+    NoteSuggestion,
+    TransactionCreate,
+    TransactionListResponse,
+    TransactionRead,
+    TransactionUpdate,
+)
+from app.services.anomaly_service import list_anomalies
+from app.services.export_service import (
+    EXPORT_FILENAMES,
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+    load_category_dictionary,
+    require_pyarrow,
+    stream_transaction_export,
+)
+from app.services.report_service import validate_date_range
+from app.services.suggestion_service import MAX_SUGGESTIONS, suggest_notes
 from app.services.transaction_service import (
+    build_transaction_filters,
     create_transaction,
     delete_transaction,
     get_transaction_or_404,
@@ -16,20 +36,21 @@ from app.services.transaction_service import (
     update_transaction,
 )
 
-router = APIRouter(prefix="/transactions", tags=["Transactions"])
+router = APIRouter(prefix="/transactions", tags=["Transactions"], route_class=TracedRoute)
 
 
 @router.post("", response_model=TransactionRead, status_code=status.HTTP_201_CREATED)
+@query_budget(8)
 async def create_transaction_endpoint(
     payload: TransactionCreate,
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_user_db_session),
     current_user: User = Depends(get_current_user),
 ) -> TransactionRead:
-    transaction = await create_transaction(db, current_user.id, payload)
-    return TransactionRead.model_validate(transaction)
+    return await create_transaction(db, current_user.id, payload)
 
 
 @router.get("", response_model=TransactionListResponse)
+@query_budget(3)
 async def list_transactions_endpoint(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
@@ -37,7 +58,7 @@ async def list_transactions_endpoint(
     category_id: int | None = Query(default=None, ge=1),
     start_date: date | None = Query(default=None),
     end_date: date | None = Query(default=None),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_user_db_session),
     current_user: User = Depends(get_current_user),
 ) -> TransactionListResponse:
     return await list_transactions(
@@ -52,10 +73,65 @@ async def list_transactions_endpoint(
     )
 
 
+@router.get("/suggest", response_model=list[NoteSuggestion])
+@query_budget(2)
+async def suggest_notes_endpoint(
+    q: str = Query(min_length=1, max_length=100),
+    limit: int = Query(default=8, ge=1, le=MAX_SUGGESTIONS),
+    db: AsyncSession = Depends(get_user_db_session),
+    current_user: User = Depends(get_current_user),
+) -> list[NoteSuggestion]:
+    return await suggest_notes(db, current_user.id, q, limit)
+
+
+@router.get("/anomalies", response_model=list[TransactionRead])
+@query_budget(2)
+async def list_anomalies_endpoint(
+    limit: int = Query(default=50, ge=1, le=200),
+    db: AsyncSession = Depends(get_user_db_session),
+    current_user: User = Depends(get_current_user),
+) -> list[TransactionRead]:
+    transactions = await list_anomalies(db, current_user.id, limit)
+    return [TransactionRead.model_validate(transaction) for transaction in transactions]
+
+
+@router.get("/export.parquet", response_class=StreamingResponse)
+@query_budget(3)
+async def export_transactions_parquet_endpoint(
+    type: TransactionType | None = Query(default=None),
+    category_id: int | None = Query(default=None, ge=1),
+    start_date: date | None = Query(default=None),
+    end_date: date | None = Query(default=None),
+    db: AsyncSession = Depends(get_user_db_session),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_user_db_session_factory),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    return await _export_response(
+        ExportFormat.PARQUET, db, session_factory, current_user.id, type, category_id, start_date, end_date
+    )
+
+
+@router.get("/export.arrows", response_class=StreamingResponse)
+@query_budget(3)
+async def export_transactions_arrow_endpoint(
+    type: TransactionType | None = Query(default=None),
+    category_id: int | None = Query(default=None, ge=1),
+    start_date: date | None = Query(default=None),
+    end_date: date | None = Query(default=None),
+    db: AsyncSession = Depends(get_user_db_session),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_user_db_session_factory),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    return await _export_response(
+        ExportFormat.ARROW, db, session_factory, current_user.id, type, category_id, start_date, end_date
+    )
+
+
 @router.get("/{transaction_id}", response_model=TransactionRead)
+@query_budget(2)
 async def get_transaction_endpoint(
     transaction_id: int,
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_user_db_session),
     current_user: User = Depends(get_current_user),
 ) -> TransactionRead:
     transaction = await get_transaction_or_404(db, current_user.id, transaction_id)
@@ -63,21 +139,50 @@ async def get_transaction_endpoint(
 
 
 @router.put("/{transaction_id}", response_model=TransactionRead)
+@query_budget(9)
 async def update_transaction_endpoint(
     transaction_id: int,
     payload: TransactionUpdate,
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_user_db_session),
     current_user: User = Depends(get_current_user),
 ) -> TransactionRead:
-    transaction = await update_transaction(db, current_user.id, transaction_id, payload)
-    return TransactionRead.model_validate(transaction)
+    return await update_transaction(db, current_user.id, transaction_id, payload)
 
 
 @router.delete("/{transaction_id}", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
+@query_budget(6)
 async def delete_transaction_endpoint(
     transaction_id: int,
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_user_db_session),
     current_user: User = Depends(get_current_user),
 ) -> Response:
     await delete_transaction(db, current_user.id, transaction_id)
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+async def _export_response(
+    export_format: ExportFormat,
+    db: AsyncSession,
+    session_factory: async_sessionmaker[AsyncSession],
+    user_id: int,
+    type_filter: TransactionType | None,
+    category_id: int | None,
+    start_date: date | None,
+    end_date: date | None,
+) -> StreamingResponse:
+    require_pyarrow()
+    validate_date_range(start_date, end_date)
+    filters = build_transaction_filters(
+        user_id=user_id,
+        type_filter=type_filter,
+        category_id=category_id,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    category_index, category_names = await load_category_dictionary(db, user_id)
+    # The request session is released once the endpoint returns, so the body streams from its own session.
+    return StreamingResponse(
+        stream_transaction_export(session_factory, export_format, filters, category_index, category_names),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{EXPORT_FILENAMES[export_format]}"'},
+    )
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db_session
+from app.core.dependencies import get_current_user, get_token_user_id
+from app.core.query_budget import query_budget
+from app.core.tracing import TracedRoute
+from app.models.user import User
+from app.schemas.user import AccountDeletionRead
+from app.services.account_service import delete_account, get_account_deletion
+
+router = APIRouter(prefix="/users", tags=["Users"], route_class=TracedRoute)
+
+
+@router.delete("/me", status_code=status.HTTP_202_ACCEPTED, response_class=Response)
+@query_budget(3)
+async def delete_me(
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    await delete_account(db, current_user.id)
+    return Response(status_code=status.HTTP_202_ACCEPTED)
+
+
+@router.get("/me/deletion", response_model=AccountDeletionRead)
+@query_budget(1)
+async def get_my_deletion(
+    db: AsyncSession = Depends(get_db_session),
+    user_id: int = Depends(get_token_user_id),
+) -> AccountDeletionRead:
+    return await get_account_deletion(db, user_id)
@@ -1,5 +1,15 @@
 from app.schemas.auth import AuthResponse, AuthTokens, LoginRequest, RefreshTokenRequest, RegisterRequest
+from app.schemas.budget import (
+    BudgetCreate,
+    BudgetEventRead,
+    BudgetRead,
+    BudgetStatusItem,
+    BudgetStatusResponse,
+    BudgetUpdate,
+)
 from app.schemas.category import CategoryCreate, CategoryRead, CategoryWithCount
+from app.schemas.debug import SlowQueryListResponse, SlowQueryRead
+from app.schemas.recurring_rule import RecurringRuleCreate, RecurringRuleRead, RecurringRuleUpdate
 from app.schemas.report import (
     ReportByCategoryItem,
     ReportByCategoryResponse,
@@ -24,9 +34,20 @@ __all__ = [
     "TransactionUpdate",
     "TransactionRead",
     "TransactionListResponse",
+    "RecurringRuleCreate",
+    "RecurringRuleUpdate",
+    "RecurringRuleRead",
+    "BudgetCreate",
+    "BudgetUpdate",
+    "BudgetRead",
+    "BudgetStatusItem",
+    "BudgetStatusResponse",
+    "BudgetEventRead",
     "ReportSummaryResponse",
     "ReportByCategoryItem",
     "ReportByCategoryResponse",
     "ReportMonthlyItem",
     "ReportMonthlyResponse",
+    "SlowQueryRead",
+    "SlowQueryListResponse",
 ]
\ No newline at end of file
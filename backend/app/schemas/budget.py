@@ -0,0 +1,58 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.models.enums import BudgetPeriod
+
+
+class BudgetCreate(BaseModel):
+    category_id: int
+    period: BudgetPeriod = BudgetPeriod.MONTHLY
+    limit_amount: Decimal = Field(gt=0, max_digits=12, decimal_places=2)
+
+
+class BudgetUpdate(BaseModel):
+    period: BudgetPeriod
+    limit_amount: Decimal = Field(gt=0, max_digits=12, decimal_places=2)
+
+
+class BudgetRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    category_id: int
+    period: BudgetPeriod
+    limit_amount: Decimal
+    created_at: datetime
+
+
+class BudgetStatusItem(BaseModel):
+    budget_id: int
+    category_id: int
+    category_name: str
+    category_color: str
+    period: BudgetPeriod
+    period_start: date
+    period_end: date
+    limit_amount: Decimal
+    spent: Decimal
+    remaining: Decimal
+    percent_used: float
+
+
+class BudgetStatusResponse(BaseModel):
+    as_of: date
+    currency: str
+    items: list[BudgetStatusItem]
+
+
+class BudgetEventRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    budget_id: int
+    period_start: date
+    threshold: int
+    spent: Decimal
+    created_at: datetime
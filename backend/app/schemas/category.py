@@ -1,3 +1,5 @@
+from datetime import date
+
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.enums import TransactionType
@@ -19,4 +21,20 @@ class CategoryRead(BaseModel):
 
 
 class CategoryWithCount(CategoryRead):
-    transaction_count: int
\ No newline at end of file
+    transaction_count: int
+
+
+class CategoryMerge(BaseModel):
+    target_category_id: int
+
+
+class CategoryReassign(BaseModel):
+    target_category_id: int
+    start_date: date | None = None
+    end_date: date | None = None
+
+
+class CategoryMoveResult(BaseModel):
+    target_category_id: int
+    moved_transactions: int
+    moved_recurring_rules: int
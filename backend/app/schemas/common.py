@@ -1,5 +1,7 @@
 from pydantic import BaseModel, ConfigDict
 
+CURRENCY_PATTERN = "^[A-Z]{3}$"
+
 
 class PaginationMeta(BaseModel):
     page: int
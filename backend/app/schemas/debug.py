@@ -0,0 +1,63 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class SlowQueryRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    statement: str
+    parameters: str
+    duration_ms: float
+    endpoint: str | None
+    recorded_at: datetime
+    plan: str | None
+    explain_error: str | None
+
+
+class SlowQueryListResponse(BaseModel):
+    enabled: bool
+    threshold_ms: float
+    items: list[SlowQueryRead]
+
+
+class HeapDiffItem(BaseModel):
+    location: str
+    size_bytes: int
+    size_diff_bytes: int
+    count: int
+    count_diff: int
+
+
+class HeapDiffResponse(BaseModel):
+    seconds: float
+    group_by: str
+    traced_current_bytes: int
+    traced_peak_bytes: int
+    items: list[HeapDiffItem]
+
+
+class LoopStallRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    duration_ms: float
+    endpoint: str | None
+    site: str
+    stack: list[str]
+    recorded_at: datetime
+    finished: bool
+
+
+class BlockingSiteRead(BaseModel):
+    site: str
+    count: int
+    total_ms: float
+    max_ms: float
+    endpoints: list[str]
+
+
+class LoopStallListResponse(BaseModel):
+    enabled: bool
+    threshold_ms: float
+    sites: list[BlockingSiteRead]
+    items: list[LoopStallRead]
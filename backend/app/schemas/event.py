@@ -0,0 +1,37 @@
+import enum
+from datetime import date
+from decimal import Decimal
+
+from pydantic import BaseModel, Field
+
+from app.models.enums import TransactionType
+
+
+class ChangeResource(str, enum.Enum):
+    TRANSACTION = "transaction"
+    CATEGORY = "category"
+
+
+class ChangeAction(str, enum.Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    MERGED = "merged"
+    REASSIGNED = "reassigned"
+    GENERATED = "generated"
+
+
+class ReportDelta(BaseModel):
+    category_id: int
+    type: TransactionType
+    month: date
+    currency: str
+    amount: Decimal
+
+
+class ChangeEvent(BaseModel):
+    resource: ChangeResource
+    action: ChangeAction
+    id: int | None = None
+    target_id: int | None = None
+    deltas: list[ReportDelta] = Field(default_factory=list)
@@ -0,0 +1,44 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from app.models.enums import RecurrenceFrequency, TransactionType
+from app.schemas.common import CURRENCY_PATTERN
+
+
+class RecurringRuleCreate(BaseModel):
+    category_id: int
+    amount: Decimal = Field(gt=0, max_digits=12, decimal_places=2)
+    type: TransactionType
+    currency: str | None = Field(default=None, pattern=CURRENCY_PATTERN)
+    note: str | None = Field(default=None, max_length=1000)
+    frequency: RecurrenceFrequency
+    anchor_date: date
+    end_date: date | None = None
+
+    @model_validator(mode="after")
+    def check_end_date(self) -> "RecurringRuleCreate":
+        if self.end_date is not None and self.end_date < self.anchor_date:
+            raise ValueError("end_date must be on or after anchor_date")
+        return self
+
+
+class RecurringRuleUpdate(RecurringRuleCreate):
+    pass
+
+
+class RecurringRuleRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    category_id: int
+    amount: Decimal
+    type: TransactionType
+    currency: str
+    note: str | None
+    frequency: RecurrenceFrequency
+    anchor_date: date
+    end_date: date | None
+    materialized_through: date | None
+    created_at: datetime
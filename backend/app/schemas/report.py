@@ -1,12 +1,16 @@
-from datetime import date
+import enum
+from datetime import date, datetime
 from decimal import Decimal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from app.core.jobs import JobStatus
 from app.models.enums import TransactionType
+from app.schemas.common import CURRENCY_PATTERN
 
 
 class ReportSummaryResponse(BaseModel):
+    currency: str
     income: Decimal
     expenses: Decimal
     net: Decimal
@@ -22,6 +26,7 @@ class ReportByCategoryItem(BaseModel):
 
 
 class ReportByCategoryResponse(BaseModel):
+    currency: str
     items: list[ReportByCategoryItem]
     total: Decimal
 
@@ -34,4 +39,62 @@ class ReportMonthlyItem(BaseModel):
 
 
 class ReportMonthlyResponse(BaseModel):
-    items: list[ReportMonthlyItem]
\ No newline at end of file
+    currency: str
+    items: list[ReportMonthlyItem]
+
+
+class ReportJobKind(str, enum.Enum):
+    SUMMARY = "summary"
+    BY_CATEGORY = "by_category"
+    MONTHLY = "monthly"
+
+
+class ReportJobPriority(str, enum.Enum):
+    HIGH = "high"
+    NORMAL = "normal"
+    LOW = "low"
+
+
+class ReportJobCreate(BaseModel):
+    kind: ReportJobKind
+    start_date: date | None = None
+    end_date: date | None = None
+    type: TransactionType | None = None
+    currency: str | None = Field(default=None, pattern=CURRENCY_PATTERN)
+    priority: ReportJobPriority = ReportJobPriority.NORMAL
+
+
+class ReportJobRead(BaseModel):
+    id: str
+    status: JobStatus
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
+    error: str | None
+    result: ReportSummaryResponse | ReportByCategoryResponse | ReportMonthlyResponse | None
+
+
+class ForecastMonth(BaseModel):
+    month: date
+    income: Decimal
+    expenses: Decimal
+    net: Decimal
+    balance: Decimal
+
+
+class ForecastCategoryItem(BaseModel):
+    category_id: int
+    category_name: str
+    category_color: str
+    type: TransactionType
+    model: str
+    amounts: list[Decimal]
+
+
+class ForecastResponse(BaseModel):
+    currency: str
+    as_of: date
+    history_months: int
+    balance: Decimal
+    months: list[ForecastMonth]
+    categories: list[ForecastCategoryItem]
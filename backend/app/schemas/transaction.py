@@ -4,13 +4,14 @@ from decimal import Decimal
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.enums import TransactionType
-from app.schemas.common import PaginationMeta
+from app.schemas.common import CURRENCY_PATTERN, PaginationMeta
 
 
 class TransactionCreate(BaseModel):
     category_id: int
     amount: Decimal = Field(gt=0, max_digits=12, decimal_places=2)
     type: TransactionType
+    currency: str | None = Field(default=None, pattern=CURRENCY_PATTERN)
     note: str | None = Field(default=None, max_length=1000)
     date: date
 
@@ -19,6 +20,7 @@ class TransactionUpdate(BaseModel):
     category_id: int
     amount: Decimal = Field(gt=0, max_digits=12, decimal_places=2)
     type: TransactionType
+    currency: str | None = Field(default=None, pattern=CURRENCY_PATTERN)
     note: str | None = Field(default=None, max_length=1000)
     date: date
 
@@ -39,12 +41,22 @@ class TransactionRead(BaseModel):
     category_id: int
     amount: Decimal
     type: TransactionType
+    currency: str
     note: str | None
     date: date
+    recurring_rule_id: int | None = None
+    anomaly_score: Decimal | None = None
     created_at: datetime
     category: TransactionCategory
 
 
 class TransactionListResponse(BaseModel):
     items: list[TransactionRead]
-    pagination: PaginationMeta
\ No newline at end of file
+    pagination: PaginationMeta
+
+
+class NoteSuggestion(BaseModel):
+    note: str
+    category_id: int
+    last_amount: Decimal
+    count: int
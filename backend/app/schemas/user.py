@@ -9,4 +9,10 @@ class UserPublic(BaseModel):
     id: int
     name: str
     email: EmailStr
-    created_at: datetime
\ No newline at end of file
+    created_at: datetime
+
+
+class AccountDeletionRead(BaseModel):
+    # "pending" until the deleter starts, then the table being purged, then "completed" once the account is gone.
+    phase: str
+    deleted_rows: dict[str, int]
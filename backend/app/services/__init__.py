@@ -1,6 +1,25 @@
 from app.services.auth_service import demo_login_user, login_user, refresh_tokens, register_user
+from app.services.budget_service import (
+    apply_spend_deltas,
+    create_budget,
+    delete_budget,
+    get_budget_status,
+    list_budget_events,
+    list_budgets,
+    update_budget,
+)
 from app.services.category_service import create_category, delete_category, list_categories
 from app.services.demo_seed_service import ensure_demo_data
+from app.services.demo_tenant_service import create_demo_tenant, reap_expired_demo_tenants
+from app.services.recurring_rule_service import (
+    create_recurring_rule,
+    delete_recurring_rule,
+    get_recurring_rule_or_404,
+    list_recurring_rules,
+    materialize_due_occurrences,
+    update_recurring_rule,
+)
+from app.services.report_job_service import get_report_job_or_404, submit_report_job
 from app.services.report_service import get_by_category_report, get_monthly_report, get_summary_report
 from app.services.transaction_service import (
     create_transaction,
@@ -16,6 +35,8 @@ __all__ = [
     "demo_login_user",
     "refresh_tokens",
     "ensure_demo_data",
+    "create_demo_tenant",
+    "reap_expired_demo_tenants",
     "create_category",
     "list_categories",
     "delete_category",
@@ -24,7 +45,22 @@ __all__ = [
     "get_transaction_or_404",
     "update_transaction",
     "delete_transaction",
+    "create_recurring_rule",
+    "list_recurring_rules",
+    "get_recurring_rule_or_404",
+    "update_recurring_rule",
+    "delete_recurring_rule",
+    "materialize_due_occurrences",
+    "create_budget",
+    "list_budgets",
+    "update_budget",
+    "delete_budget",
+    "get_budget_status",
+    "list_budget_events",
+    "apply_spend_deltas",
     "get_summary_report",
     "get_by_category_report",
     "get_monthly_report",
+    "submit_report_job",
+    "get_report_job_or_404",
 ]
@@ -0,0 +1,143 @@
+import asyncio
+import logging
+from datetime import datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.core.database import ShardRouter, get_shard_router
+from app.models.budget import Budget
+from app.models.category import Category
+from app.models.forecast import CashFlowForecast
+from app.models.recurring_rule import RecurringRule
+from app.models.refresh_token import RefreshToken
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.schemas.user import AccountDeletionRead
+from app.services.report_job_service import invalidate_user_report_jobs
+from app.services.suggestion_service import get_note_index
+from app.services.token_service import revoke_user_tokens
+
+logger = logging.getLogger(__name__)
+
+# Rules go after the first transaction sweep so their ON DELETE SET NULL has almost nothing left to touch; the
+# second sweep picks up occurrences the scheduler materialized in between, which would otherwise block the category
+# delete. Budgets take their spend and events with them, categories their amount stats.
+PURGE_ORDER = (Transaction, RecurringRule, Transaction, Budget, Category)
+
+
+async def delete_account(db: AsyncSession, user_id: int) -> None:
+    await db.execute(
+        update(User)
+        .where(User.id == user_id, User.deleted_at.is_(None))
+        .values(deleted_at=datetime.utcnow(), deletion_phase="pending", deletion_progress={})
+        .execution_options(synchronize_session=False)
+    )
+    await revoke_user_tokens(db, user_id)
+    invalidate_user_report_jobs(user_id)
+    get_note_index().discard([user_id])
+
+
+async def get_account_deletion(db: AsyncSession, user_id: int) -> AccountDeletionRead:
+    result = await db.execute(
+        select(User.deleted_at, User.deletion_phase, User.deletion_progress).where(User.id == user_id)
+    )
+    row = result.one_or_none()
+    # The token proves the account existed, so a missing directory row means the purge has finished.
+    if row is None:
+        return AccountDeletionRead(phase="completed", deleted_rows={})
+    if row.deleted_at is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account is not being deleted")
+    return AccountDeletionRead(phase=row.deletion_phase or "pending", deleted_rows=row.deletion_progress or {})
+
+
+async def purge_deleted_accounts(
+    directory: async_sessionmaker[AsyncSession],
+    router: ShardRouter | None = None,
+    chunk_size: int | None = None,
+    pause_seconds: float | None = None,
+) -> int:
+    settings = get_settings()
+    router = router or get_shard_router()
+    chunk_size = chunk_size or settings.account_deletion_chunk_size
+    pause_seconds = settings.account_deletion_pause_seconds if pause_seconds is None else pause_seconds
+
+    async with directory() as session:
+        result = await session.execute(
+            select(User.id, User.shard)
+            .where(User.deleted_at.is_not(None), User.shard_moving.is_(False))
+            .order_by(User.deleted_at)
+        )
+        accounts = result.tuples().all()
+
+    for user_id, shard in accounts:
+        data_factory = directory if shard is None else router.session_factory(shard)
+        deleted = await _purge_user_rows(
+            directory, data_factory, user_id, chunk_size, pause_seconds, drop_stub=shard is not None
+        )
+        async with directory() as session:
+            await session.execute(delete(RefreshToken).where(RefreshToken.user_id == user_id))
+            await session.execute(delete(User).where(User.id == user_id, User.deleted_at.is_not(None)))
+            await session.commit()
+        logger.info("Purged deleted account %s: %s", user_id, deleted)
+    return len(accounts)
+
+
+async def _purge_user_rows(
+    directory: async_sessionmaker[AsyncSession],
+    session_factory: async_sessionmaker[AsyncSession],
+    user_id: int,
+    chunk_size: int,
+    pause_seconds: float,
+    drop_stub: bool,
+) -> dict[str, int]:
+    deleted: dict[str, int] = {}
+    async with session_factory() as session:
+        for model in PURGE_ORDER:
+            # Each chunk is picked through the user_id index and committed on its own, so locks are held briefly and
+            # a restarted worker resumes where the last one stopped.
+            chunk = select(model.id).where(model.user_id == user_id).order_by(model.id).limit(chunk_size)
+            while True:
+                result = await session.execute(
+                    delete(model).where(model.id.in_(chunk)).execution_options(synchronize_session=False)
+                )
+                await session.commit()
+                table = model.__tablename__
+                deleted[table] = deleted.get(table, 0) + result.rowcount
+                await _record_progress(directory, user_id, table, deleted)
+                if result.rowcount < chunk_size:
+                    break
+                logger.info("Deleting account %s: %s %s rows removed so far", user_id, deleted[table], table)
+                await asyncio.sleep(pause_seconds)
+
+        await session.execute(delete(CashFlowForecast).where(CashFlowForecast.user_id == user_id))
+        if drop_stub:
+            await session.execute(delete(User).where(User.id == user_id))
+        await session.commit()
+    return deleted
+
+
+async def _record_progress(
+    directory: async_sessionmaker[AsyncSession], user_id: int, phase: str, deleted: dict[str, int]
+) -> None:
+    # Kept on the directory row, which outlives the data, so GET /users/me/deletion can report it from any worker.
+    async with directory() as session:
+        await session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(deletion_phase=phase, deletion_progress=dict(deleted))
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+
+
+async def run_account_deleter(directory: async_sessionmaker[AsyncSession]) -> None:
+    settings = get_settings()
+    while True:
+        try:
+            await purge_deleted_accounts(directory)
+        except Exception:
+            logger.exception("Account deletion pass failed")
+        await asyncio.sleep(settings.account_deletion_interval_seconds)
@@ -0,0 +1,161 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import numpy as np
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.config import get_settings
+from app.models.anomaly import CategoryAmountStats
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.services.fx_service import converted_amount, to_base_currency
+from app.services.shard_service import users_stored_on
+
+# 1.4826 * MAD estimates the standard deviation of normally distributed data.
+MAD_TO_SIGMA = Decimal("1.4826")
+# Fixed amounts (rent, subscriptions) have a MAD of zero; a floor relative to the median keeps small changes quiet.
+MIN_SCALE_RATIO = Decimal("0.05")
+MAX_SCORE = Decimal("9999.99")
+CENT = Decimal("0.01")
+
+
+async def score_transaction(
+    db: AsyncSession,
+    stats: CategoryAmountStats | None,
+    amount: Decimal,
+    currency: str,
+    day: date,
+) -> Decimal | None:
+    settings = get_settings()
+    if stats is None or stats.sample_size < settings.anomaly_min_samples:
+        return None
+    amount_in_base = await to_base_currency(db, amount, currency, day)
+    if amount_in_base is None:
+        return None
+
+    scale = max(stats.mad * MAD_TO_SIGMA, stats.median * MIN_SCALE_RATIO, CENT)
+    score = ((amount_in_base - stats.median) / scale).quantize(CENT)
+    if abs(score) < Decimal(str(settings.anomaly_score_threshold)):
+        return None
+    return max(min(score, MAX_SCORE), -MAX_SCORE)
+
+
+async def list_anomalies(db: AsyncSession, user_id: int, limit: int) -> list[Transaction]:
+    result = await db.execute(
+        select(Transaction)
+        .options(joinedload(Transaction.category, innerjoin=True))
+        .where(Transaction.user_id == user_id, Transaction.anomaly_score.is_not(None))
+        .order_by(Transaction.date.desc(), Transaction.id.desc())
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+async def refresh_category_amount_stats(
+    db: AsyncSession,
+    chunk_size: int | None = None,
+    today: date | None = None,
+    shard: str | None = None,
+) -> int:
+    chunk_size = chunk_size or get_settings().anomaly_stats_chunk_size
+    since, amount = _stats_window(today)
+    stored = 0
+    last_user_id = 0
+
+    while True:
+        result = await db.execute(
+            select(User.id)
+            .where(User.id > last_user_id, *users_stored_on(shard))
+            .order_by(User.id.asc())
+            .limit(chunk_size)
+        )
+        user_ids = list(result.scalars().all())
+        if not user_ids:
+            return stored
+        last_user_id = user_ids[-1]
+
+        result = await db.execute(
+            select(Transaction.category_id, Transaction.user_id, amount)
+            .where(Transaction.user_id.in_(user_ids), Transaction.date >= since, amount.is_not(None))
+        )
+        rows = result.tuples().all()
+        await db.execute(
+            delete(CategoryAmountStats)
+            .where(CategoryAmountStats.user_id.in_(user_ids))
+            .execution_options(synchronize_session=False)
+        )
+        stored += await _insert_amount_stats(db, rows)
+        await db.commit()
+
+
+async def refresh_categories_amount_stats(
+    db: AsyncSession, user_id: int, category_ids: list[int], today: date | None = None
+) -> None:
+    # Moving transactions between categories changes the amounts both sides are scored against, so their stats are
+    # rebuilt in the caller's transaction instead of waiting for the next batch. The caller commits.
+    since, amount = _stats_window(today)
+    result = await db.execute(
+        select(Transaction.category_id, Transaction.user_id, amount).where(
+            Transaction.user_id == user_id,
+            Transaction.category_id.in_(category_ids),
+            Transaction.date >= since,
+            amount.is_not(None),
+        )
+    )
+    rows = result.tuples().all()
+    await db.execute(
+        delete(CategoryAmountStats)
+        .where(CategoryAmountStats.category_id.in_(category_ids))
+        .execution_options(synchronize_session=False)
+    )
+    await _insert_amount_stats(db, rows)
+
+
+def _stats_window(today: date | None) -> tuple[date, ColumnElement]:
+    settings = get_settings()
+    since = (today or date.today()) - timedelta(days=settings.anomaly_lookback_days)
+    return since, converted_amount(settings.base_currency)
+
+
+async def _insert_amount_stats(db: AsyncSession, rows: list[tuple]) -> int:
+    if not rows:
+        return 0
+    category_ids, owners, amounts = (np.array(column) for column in zip(*rows))
+    groups, first, counts, medians, mads = robust_group_stats(category_ids, amounts.astype(np.float64))
+    await db.execute(
+        insert(CategoryAmountStats),
+        [
+            {
+                "category_id": int(category_id),
+                "user_id": int(owners[index]),
+                "sample_size": int(count),
+                "median": Decimal(float(median)).quantize(CENT),
+                "mad": Decimal(float(mad)).quantize(CENT),
+            }
+            for category_id, index, count, median, mad in zip(groups, first, counts, medians, mads)
+        ],
+    )
+    return len(groups)
+
+
+def robust_group_stats(
+    groups: np.ndarray, values: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Median and MAD for every group in two sorts: values are ordered within contiguous groups, so each group's
+    # median sits at fixed offsets from its start.
+    order = np.lexsort((values, groups))
+    groups, values = groups[order], values[order]
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    counts = np.diff(np.r_[starts, len(groups)])
+
+    medians = _sorted_group_median(values, starts, counts)
+    deviations = np.abs(values - np.repeat(medians, counts))
+    mads = _sorted_group_median(deviations[np.lexsort((deviations, groups))], starts, counts)
+    return groups[starts], order[starts], counts, medians, mads
+
+
+def _sorted_group_median(values: np.ndarray, starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    return (values[starts + (counts - 1) // 2] + values[starts + counts // 2]) / 2
@@ -0,0 +1,283 @@
+import logging
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import date, timedelta
+from decimal import Decimal
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, case, delete, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.metrics import registry
+from app.models.budget import Budget, BudgetEvent, BudgetSpend
+from app.models.category import Category
+from app.models.enums import BudgetPeriod, TransactionType
+from app.models.transaction import Transaction
+from app.schemas.budget import BudgetCreate, BudgetStatusItem, BudgetStatusResponse, BudgetUpdate
+from app.services.fx_service import converted_amount, to_base_currency
+
+logger = logging.getLogger(__name__)
+
+BUDGET_THRESHOLDS = (80, 100)
+CATEGORY_CHUNK_SIZE = 500
+UPSERT_CHUNK_SIZE = 1000
+
+SpendDelta = tuple[int, date, Decimal, str]
+
+
+def period_bounds(period: BudgetPeriod, day: date) -> tuple[date, date]:
+    if period == BudgetPeriod.WEEKLY:
+        start = day - timedelta(days=day.weekday())
+        return start, start + timedelta(days=6)
+    if period == BudgetPeriod.MONTHLY:
+        start = day.replace(day=1)
+        next_month = (start + timedelta(days=32)).replace(day=1)
+        return start, next_month - timedelta(days=1)
+    return day.replace(month=1, day=1), day.replace(month=12, day=31)
+
+
+async def apply_spend_deltas(db: AsyncSession, deltas: Iterable[SpendDelta]) -> list[BudgetEvent]:
+    by_category: dict[int, list[tuple[date, Decimal, str]]] = defaultdict(list)
+    for category_id, day, amount, currency in deltas:
+        if amount:
+            by_category[category_id].append((day, amount, currency))
+    if not by_category:
+        return []
+
+    budgets: list[tuple[int, int, BudgetPeriod, Decimal]] = []
+    category_ids = list(by_category)
+    for start in range(0, len(category_ids), CATEGORY_CHUNK_SIZE):
+        result = await db.execute(
+            select(Budget.id, Budget.category_id, Budget.period, Budget.limit_amount).where(
+                Budget.category_id.in_(category_ids[start:start + CATEGORY_CHUNK_SIZE])
+            )
+        )
+        budgets.extend(result.tuples().all())
+    if not budgets:
+        return []
+
+    increments: dict[tuple[int, date], Decimal] = defaultdict(Decimal)
+    limits: dict[int, Decimal] = {}
+    converted: dict[int, list[tuple[date, Decimal]]] = {}
+    for budget_id, category_id, period, limit_amount in budgets:
+        limits[budget_id] = limit_amount
+        if category_id not in converted:
+            converted[category_id] = await _in_base_currency(db, by_category[category_id])
+        for day, amount in converted[category_id]:
+            increments[(budget_id, period_bounds(period, day)[0])] += amount
+
+    rows = [
+        {"budget_id": budget_id, "period_start": period_start, "spent": amount}
+        for (budget_id, period_start), amount in increments.items()
+    ]
+    insert = _dialect_insert(db)
+    events: list[dict] = []
+    for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        stmt = insert(BudgetSpend).values(rows[start:start + UPSERT_CHUNK_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[BudgetSpend.budget_id, BudgetSpend.period_start],
+            set_={"spent": BudgetSpend.spent + stmt.excluded.spent},
+        ).returning(BudgetSpend.budget_id, BudgetSpend.period_start, BudgetSpend.spent)
+        for budget_id, period_start, spent in (await db.execute(stmt)).tuples():
+            previous = spent - increments[(budget_id, period_start)]
+            for threshold in BUDGET_THRESHOLDS:
+                boundary = limits[budget_id] * threshold / 100
+                if previous < boundary <= spent:
+                    events.append(
+                        {"budget_id": budget_id, "period_start": period_start, "threshold": threshold, "spent": spent}
+                    )
+
+    if not events:
+        return []
+    result = await db.execute(
+        insert(BudgetEvent)
+        .values(events)
+        .on_conflict_do_nothing(index_elements=[BudgetEvent.budget_id, BudgetEvent.period_start, BudgetEvent.threshold])
+        .returning(BudgetEvent)
+    )
+    return list(result.scalars().all())
+
+
+async def create_budget(db: AsyncSession, user_id: int, payload: BudgetCreate) -> Budget:
+    await _validate_category(db, user_id, payload.category_id)
+    budget = Budget(
+        user_id=user_id,
+        category_id=payload.category_id,
+        period=payload.period,
+        limit_amount=payload.limit_amount,
+    )
+    db.add(budget)
+    try:
+        await db.flush()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Budget already exists for this category and period",
+        ) from exc
+
+    await _backfill_spend(db, budget)
+    await db.commit()
+    await db.refresh(budget)
+    return budget
+
+
+async def list_budgets(db: AsyncSession, user_id: int) -> list[Budget]:
+    result = await db.execute(select(Budget).where(Budget.user_id == user_id).order_by(Budget.id.asc()))
+    return list(result.scalars().all())
+
+
+async def get_budget_or_404(db: AsyncSession, user_id: int, budget_id: int) -> Budget:
+    result = await db.execute(select(Budget).where(Budget.id == budget_id, Budget.user_id == user_id))
+    budget = result.scalar_one_or_none()
+    if budget is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Budget not found")
+    return budget
+
+
+async def update_budget(db: AsyncSession, user_id: int, budget_id: int, payload: BudgetUpdate) -> Budget:
+    budget = await get_budget_or_404(db, user_id, budget_id)
+    period_changed = budget.period != payload.period
+    budget.period = payload.period
+    budget.limit_amount = payload.limit_amount
+    try:
+        await db.flush()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Budget already exists for this category and period",
+        ) from exc
+
+    # Counters are bucketed by period, so a new period means rebuilding them from history.
+    if period_changed:
+        await db.execute(delete(BudgetSpend).where(BudgetSpend.budget_id == budget.id))
+        await _backfill_spend(db, budget)
+    await db.commit()
+    await db.refresh(budget)
+    return budget
+
+
+async def delete_budget(db: AsyncSession, user_id: int, budget_id: int) -> None:
+    owned = select(Budget.id).where(Budget.id == budget_id, Budget.user_id == user_id).scalar_subquery()
+    for model in (BudgetSpend, BudgetEvent):
+        await db.execute(
+            delete(model).where(model.budget_id == owned).execution_options(synchronize_session=False)
+        )
+    result = await db.execute(
+        delete(Budget)
+        .where(Budget.id == budget_id, Budget.user_id == user_id)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Budget not found")
+    await db.commit()
+
+
+async def get_budget_status(db: AsyncSession, user_id: int, as_of: date | None = None) -> BudgetStatusResponse:
+    as_of = as_of or date.today()
+    current_start = case(
+        *((Budget.period == period, period_bounds(period, as_of)[0]) for period in BudgetPeriod),
+    )
+    stmt = (
+        select(Budget, Category.name, Category.color, func.coalesce(BudgetSpend.spent, 0))
+        .join(Category, Category.id == Budget.category_id)
+        .outerjoin(BudgetSpend, and_(BudgetSpend.budget_id == Budget.id, BudgetSpend.period_start == current_start))
+        .where(Budget.user_id == user_id)
+        .order_by(Category.name.asc(), Budget.period.asc())
+    )
+    result = await db.execute(stmt)
+
+    items: list[BudgetStatusItem] = []
+    for budget, category_name, category_color, spent in result.all():
+        spent = Decimal(spent)
+        period_start, period_end = period_bounds(budget.period, as_of)
+        items.append(
+            BudgetStatusItem(
+                budget_id=budget.id,
+                category_id=budget.category_id,
+                category_name=category_name,
+                category_color=category_color,
+                period=budget.period,
+                period_start=period_start,
+                period_end=period_end,
+                limit_amount=budget.limit_amount,
+                spent=spent,
+                remaining=budget.limit_amount - spent,
+                percent_used=round(float(spent / budget.limit_amount * 100), 2),
+            )
+        )
+    return BudgetStatusResponse(as_of=as_of, currency=get_settings().base_currency, items=items)
+
+
+async def list_budget_events(db: AsyncSession, user_id: int, limit: int) -> list[BudgetEvent]:
+    result = await db.execute(
+        select(BudgetEvent)
+        .join(Budget, Budget.id == BudgetEvent.budget_id)
+        .where(Budget.user_id == user_id)
+        .order_by(BudgetEvent.id.desc())
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+async def _in_base_currency(db: AsyncSession, spends: list[tuple[date, Decimal, str]]) -> list[tuple[date, Decimal]]:
+    converted: list[tuple[date, Decimal]] = []
+    for day, amount, currency in spends:
+        amount_in_base = await to_base_currency(db, amount, currency, day)
+        if amount_in_base is None:
+            # Writes validate the currency first, so this only happens when a database is missing rates it
+            # should have.
+            logger.warning("No %s exchange rate for %s; %s left out of budget spend", currency, day, amount)
+            registry.inc("budget_spend_skipped_total", (currency,))
+            continue
+        converted.append((day, amount_in_base))
+    return converted
+
+
+async def _validate_category(db: AsyncSession, user_id: int, category_id: int) -> None:
+    result = await db.execute(
+        select(Category.type).where(Category.id == category_id, Category.user_id == user_id)
+    )
+    category_type = result.scalar_one_or_none()
+    if category_type is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
+    if category_type != TransactionType.EXPENSE:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Budgets can only track expense categories")
+
+
+async def _backfill_spend(db: AsyncSession, budget: Budget) -> None:
+    await _lock_category_spend(db, budget.category_id)
+    result = await db.execute(
+        select(Transaction.date, func.sum(converted_amount(get_settings().base_currency)))
+        .where(Transaction.category_id == budget.category_id)
+        .group_by(Transaction.date)
+    )
+    totals: dict[date, Decimal] = defaultdict(Decimal)
+    for day, amount in result.tuples():
+        if amount is not None:
+            totals[period_bounds(budget.period, day)[0]] += Decimal(amount).quantize(Decimal("0.01"))
+    if totals:
+        await db.execute(
+            _dialect_insert(db)(BudgetSpend).values(
+                [{"budget_id": budget.id, "period_start": start, "spent": spent} for start, spent in totals.items()]
+            )
+        )
+
+
+async def _lock_category_spend(db: AsyncSession, category_id: int) -> None:
+    # A transaction written while the backfill runs would miss the uncommitted budget and be missing from the
+    # backfill's snapshot. Inserts and moves into the category wait on the category row (their foreign key check
+    # takes a key-share lock on it); edits and deletes wait on the transaction rows. SQLite writers are already
+    # serialized by the write lock.
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    await db.execute(select(Category.id).where(Category.id == category_id).with_for_update())
+    await db.execute(select(Transaction.id).where(Transaction.category_id == category_id).with_for_update(read=True))
+
+
+def _dialect_insert(db: AsyncSession):
+    return postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
@@ -1,11 +1,24 @@
+from datetime import date
+
 from fastapi import HTTPException, status
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, delete, exists, func, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
+from app.core.query_budget import record_extra_chunk
 from app.models.category import Category
+from app.models.recurring_rule import RecurringRule
 from app.models.transaction import Transaction
-from app.schemas.category import CategoryCreate, CategoryWithCount
+from app.schemas.category import CategoryCreate, CategoryMoveResult, CategoryWithCount
+from app.schemas.event import ChangeAction, ChangeResource
+from app.services.anomaly_service import refresh_categories_amount_stats
+from app.services.budget_service import apply_spend_deltas
+from app.services.event_service import publish_change
+from app.services.report_job_service import invalidate_user_report_jobs
+from app.services.report_service import validate_date_range
+from app.services.suggestion_service import get_note_index
+from app.services.transaction_service import build_transaction_filters
 
 
 async def create_category(db: AsyncSession, user_id: int, payload: CategoryCreate) -> Category:
@@ -23,6 +36,7 @@ async def create_category(db: AsyncSession, user_id: int, payload: CategoryCreat
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Category already exists") from exc
 
     await db.refresh(category)
+    publish_change(user_id, ChangeResource.CATEGORY, ChangeAction.CREATED, id=category.id)
     return category
 
 
@@ -68,5 +82,143 @@ async def delete_category(db: AsyncSession, user_id: int, category_id: int) -> N
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail="Cannot delete category with existing transactions",
+            detail=f"Cannot delete category with existing {await _category_dependents(db, category_id)}",
+        ) from exc
+    publish_change(user_id, ChangeResource.CATEGORY, ChangeAction.DELETED, id=category_id)
+
+
+async def merge_category(db: AsyncSession, user_id: int, category_id: int, target_id: int) -> CategoryMoveResult:
+    source, target = await _get_move_categories(db, user_id, category_id, target_id)
+    merged = False
+    try:
+        moved = await _move_transactions(
+            db, source, target, build_transaction_filters(user_id, None, source.id, None, None)
+        )
+        rules = await db.execute(
+            update(RecurringRule)
+            .where(RecurringRule.category_id == source.id)
+            .values(category_id=target.id)
+            .execution_options(synchronize_session=False)
+        )
+        # The source's budgets, spend counters and amount stats go with it through ON DELETE CASCADE.
+        await db.execute(delete(Category).where(Category.id == source.id).execution_options(synchronize_session=False))
+        await refresh_categories_amount_stats(db, user_id, [target.id])
+        await db.commit()
+        merged = True
+    except IntegrityError as exc:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Category received new transactions during the merge, retry",
         ) from exc
+    finally:
+        # Chunks committed before a failure stay in the target while the source survives, which is a reassign as
+        # far as caches and clients are concerned. Repeating the merge moves the rest.
+        _after_move(user_id, ChangeAction.MERGED if merged else ChangeAction.REASSIGNED, category_id, target_id)
+    return CategoryMoveResult(
+        target_category_id=target.id, moved_transactions=moved, moved_recurring_rules=rules.rowcount
+    )
+
+
+async def reassign_category_transactions(
+    db: AsyncSession,
+    user_id: int,
+    category_id: int,
+    target_id: int,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> CategoryMoveResult:
+    validate_date_range(start_date, end_date)
+    source, target = await _get_move_categories(db, user_id, category_id, target_id)
+    try:
+        moved = await _move_transactions(
+            db, source, target, build_transaction_filters(user_id, None, source.id, start_date, end_date)
+        )
+        await refresh_categories_amount_stats(db, user_id, [source.id, target.id])
+        await db.commit()
+    finally:
+        _after_move(user_id, ChangeAction.REASSIGNED, category_id, target_id)
+    return CategoryMoveResult(target_category_id=target.id, moved_transactions=moved, moved_recurring_rules=0)
+
+
+async def _get_move_categories(
+    db: AsyncSession, user_id: int, category_id: int, target_id: int
+) -> tuple[Category, Category]:
+    if category_id == target_id:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Target must be a different category")
+    result = await db.execute(
+        select(Category).where(Category.id.in_((category_id, target_id)), Category.user_id == user_id)
+    )
+    categories = {category.id: category for category in result.scalars().all()}
+    if category_id not in categories or target_id not in categories:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
+    source, target = categories[category_id], categories[target_id]
+    # Transactions always share their category's type, so one check covers every row that moves.
+    if source.type != target.type:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Target category type must match the source category type",
+        )
+    return source, target
+
+
+async def _move_transactions(db: AsyncSession, source: Category, target: Category, criteria: list) -> int:
+    # Rows move in id-ordered chunks, each committed with its budget spend adjustments, so no single transaction
+    # holds row locks on a huge category. The final chunk is left open for the caller to finish atomically.
+    chunk_size = get_settings().category_move_chunk_size
+    moved = 0
+    last_id = 0
+    while True:
+        boundary = await db.scalar(
+            select(Transaction.id)
+            .where(*criteria, Transaction.id > last_id)
+            .order_by(Transaction.id.asc())
+            .offset(chunk_size - 1)
+            .limit(1)
+        )
+        chunk = [*criteria, Transaction.id > last_id]
+        if boundary is not None:
+            chunk.append(Transaction.id <= boundary)
+
+        result = await db.execute(
+            select(Transaction.date, Transaction.currency, func.sum(Transaction.amount))
+            .where(*chunk)
+            .group_by(Transaction.date, Transaction.currency)
+        )
+        totals = result.tuples().all()
+        result = await db.execute(
+            update(Transaction)
+            .where(*chunk)
+            .values(category_id=target.id)
+            .execution_options(synchronize_session=False)
+        )
+        moved += result.rowcount
+        await apply_spend_deltas(
+            db,
+            [(source.id, day, -total, currency) for day, currency, total in totals]
+            + [(target.id, day, total, currency) for day, currency, total in totals],
+        )
+        if boundary is None:
+            return moved
+        await db.commit()
+        record_extra_chunk()
+        last_id = boundary
+
+
+async def _category_dependents(db: AsyncSession, category_id: int) -> str:
+    # Both transactions and recurring rules restrict the delete; the message names whichever still point here.
+    result = await db.execute(
+        select(
+            exists().where(Transaction.category_id == category_id),
+            exists().where(RecurringRule.category_id == category_id),
+        )
+    )
+    has_transactions, has_rules = result.one()
+    names = [name for name, present in (("transactions", has_transactions), ("recurring rules", has_rules)) if present]
+    return " and ".join(names) or "transactions"
+
+
+def _after_move(user_id: int, action: ChangeAction, source_id: int, target_id: int) -> None:
+    invalidate_user_report_jobs(user_id)
+    get_note_index().discard([user_id])
+    publish_change(user_id, ChangeResource.CATEGORY, action, id=source_id, target_id=target_id)
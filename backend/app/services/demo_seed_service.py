@@ -1,73 +1,98 @@
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 
-from sqlalchemy import func, select
+from sqlalchemy import insert, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
-from app.core.security import hash_password
 from app.models.category import Category
 from app.models.enums import TransactionType
 from app.models.transaction import Transaction
 from app.models.user import User
+from app.services.token_service import revoke_user_tokens
 
-settings = get_settings()
+
+DEMO_SEED_LOCK_KEY = 7_302_114_501
+UNUSABLE_PASSWORD_HASH = "!"
+
+DEMO_CATEGORY_SPECS = [
+    ("Salary", TransactionType.INCOME, "#17c964"),
+    ("Freelance", TransactionType.INCOME, "#06b6d4"),
+    ("Rent", TransactionType.EXPENSE, "#f31260"),
+    ("Groceries", TransactionType.EXPENSE, "#f59e0b"),
+    ("Transport", TransactionType.EXPENSE, "#8b5cf6"),
+    ("Utilities", TransactionType.EXPENSE, "#3b82f6"),
+]
 
 
 async def ensure_demo_data(db: AsyncSession) -> None:
+    settings = get_settings()
     if not settings.demo_mode:
         return
 
-    demo_user = await _get_demo_user(db)
-    if demo_user is None:
-        demo_user = User(
+    template_id = await get_demo_template_id(db)
+    if template_id is not None:
+        await _disable_template_login(db, template_id)
+        return
+
+    await _acquire_seed_lock(db)
+    if await get_demo_template_id(db) is not None:
+        await db.rollback()
+        return
+
+    result = await db.execute(
+        insert(User)
+        .values(
             name=settings.demo_user_name,
             email=settings.demo_user_email.lower(),
-            hashed_password=hash_password(settings.demo_user_password),
+            hashed_password=UNUSABLE_PASSWORD_HASH,
         )
-        db.add(demo_user)
-        await db.flush()
-
-    category_map = await _ensure_demo_categories(db, demo_user.id)
-    await _ensure_demo_transactions(db, demo_user.id, category_map)
+        .returning(User.id)
+    )
+    template_id = result.scalar_one()
+
+    result = await db.execute(
+        insert(Category)
+        .values([
+            {"user_id": template_id, "name": name, "type": kind, "color": color}
+            for name, kind, color in DEMO_CATEGORY_SPECS
+        ])
+        .returning(Category.id, Category.name)
+    )
+    category_ids = {row.name: row.id for row in result.all()}
+
+    await db.execute(insert(Transaction).values(_demo_transaction_rows(template_id, category_ids)))
     await db.commit()
 
 
-async def _get_demo_user(db: AsyncSession) -> User | None:
-    result = await db.execute(select(User).where(User.email == settings.demo_user_email.lower()))
+async def get_demo_template_id(db: AsyncSession) -> int | None:
+    settings = get_settings()
+    result = await db.execute(select(User.id).where(User.email == settings.demo_user_email.lower()))
     return result.scalar_one_or_none()
 
 
-async def _ensure_demo_categories(db: AsyncSession, user_id: int) -> dict[str, Category]:
-    category_specs = [
-        ("Salary", TransactionType.INCOME, "#17c964"),
-        ("Freelance", TransactionType.INCOME, "#06b6d4"),
-        ("Rent", TransactionType.EXPENSE, "#f31260"),
-        ("Groceries", TransactionType.EXPENSE, "#f59e0b"),
-        ("Transport", TransactionType.EXPENSE, "#8b5cf6"),
-        ("Utilities", TransactionType.EXPENSE, "#3b82f6"),
-    ]
-
-    result = await db.execute(select(Category).where(Category.user_id == user_id))
-    existing = {(c.name, c.type): c for c in result.scalars().all()}
-
-    category_map: dict[str, Category] = {}
-    for name, kind, color in category_specs:
-        category = existing.get((name, kind))
-        if category is None:
-            category = Category(user_id=user_id, name=name, type=kind, color=color)
-            db.add(category)
-            await db.flush()
-        category_map[name] = category
+async def _disable_template_login(db: AsyncSession, template_id: int) -> None:
+    # Templates seeded before tenants were cloned from them were real accounts with a password; nobody may log in
+    # as the template, or every later tenant would inherit their changes.
+    result = await db.execute(
+        update(User)
+        .where(User.id == template_id, User.hashed_password != UNUSABLE_PASSWORD_HASH)
+        .values(hashed_password=UNUSABLE_PASSWORD_HASH)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount:
+        await revoke_user_tokens(db, template_id)
+    else:
+        await db.rollback()
 
-    return category_map
 
+async def _acquire_seed_lock(db: AsyncSession) -> None:
+    # Serializes seeding across workers; released automatically at commit/rollback.
+    if db.get_bind().dialect.name == "postgresql":
+        await db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": DEMO_SEED_LOCK_KEY})
 
-async def _ensure_demo_transactions(db: AsyncSession, user_id: int, category_map: dict[str, Category]) -> None:
-    tx_count = await db.execute(select(func.count()).select_from(Transaction).where(Transaction.user_id == user_id))
-    if int(tx_count.scalar_one()) > 0:
-        return
 
+def _demo_transaction_rows(user_id: int, category_ids: dict[str, int]) -> list[dict]:
     today = date.today()
     base_month = date(today.year, today.month, 1)
 
@@ -82,17 +107,18 @@ async def _ensure_demo_transactions(db: AsyncSession, user_id: int, category_map
         ("Freelance", TransactionType.INCOME, Decimal("420.00"), "Design revisions", base_month + timedelta(days=19)),
     ]
 
+    currency = get_settings().base_currency
     created_at = datetime.utcnow()
-    for category_name, kind, amount, note, tx_date in seeded_rows:
-        category = category_map[category_name]
-        db.add(
-            Transaction(
-                user_id=user_id,
-                category_id=category.id,
-                amount=amount,
-                type=kind,
-                note=note,
-                date=tx_date,
-                created_at=created_at,
-            )
-        )
+    return [
+        {
+            "user_id": user_id,
+            "category_id": category_ids[category_name],
+            "amount": amount,
+            "type": kind,
+            "currency": currency,
+            "note": note,
+            "date": tx_date,
+            "created_at": created_at,
+        }
+        for category_name, kind, amount, note, tx_date in seeded_rows
+    ]
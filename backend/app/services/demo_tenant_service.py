@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import secrets
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import and_, delete, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import aliased
+
+from app.core.config import get_settings
+from app.models.category import Category
+from app.models.recurring_rule import RecurringRule
+from app.models.refresh_token import RefreshToken
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.services.demo_seed_service import UNUSABLE_PASSWORD_HASH
+
+logger = logging.getLogger(__name__)
+
+
+async def create_demo_tenant(db: AsyncSession, template_id: int) -> User:
+    settings = get_settings()
+    local_part, _, domain = settings.demo_user_email.lower().partition("@")
+    expires_at = datetime.now(UTC) + timedelta(minutes=settings.demo_tenant_ttl_minutes)
+
+    tenant = await db.scalar(
+        insert(User)
+        .values(
+            name=settings.demo_user_name,
+            email=f"{local_part}-{secrets.token_hex(8)}@{domain}",
+            hashed_password=UNUSABLE_PASSWORD_HASH,
+            expires_at=expires_at,
+        )
+        .returning(User)
+    )
+
+    await db.execute(
+        insert(Category).from_select(
+            ["user_id", "name", "type", "color"],
+            select(literal(tenant.id), Category.name, Category.type, Category.color).where(
+                Category.user_id == template_id
+            ),
+        )
+    )
+
+    template_category = aliased(Category)
+    tenant_category = aliased(Category)
+    await db.execute(
+        insert(Transaction).from_select(
+            ["user_id", "category_id", "amount", "type", "currency", "note", "date", "anomaly_score", "created_at"],
+            select(
+                literal(tenant.id),
+                tenant_category.id,
+                Transaction.amount,
+                Transaction.type,
+                Transaction.currency,
+                Transaction.note,
+                Transaction.date,
+                Transaction.anomaly_score,
+                Transaction.created_at,
+            )
+            .join(template_category, template_category.id == Transaction.category_id)
+            .join(
+                tenant_category,
+                and_(
+                    tenant_category.user_id == tenant.id,
+                    tenant_category.name == template_category.name,
+                    tenant_category.type == template_category.type,
+                ),
+            )
+            .where(Transaction.user_id == template_id),
+        )
+    )
+
+    await db.commit()
+    await db.refresh(tenant)
+    return tenant
+
+
+async def reap_expired_demo_tenants(db: AsyncSession, chunk_size: int | None = None) -> int:
+    settings = get_settings()
+    chunk_size = chunk_size or settings.demo_reaper_chunk_size
+    now = datetime.now(UTC)
+    reaped = 0
+
+    while True:
+        result = await db.execute(
+            select(User.id)
+            .where(User.expires_at.is_not(None), User.expires_at <= now, User.shard_moving.is_(False))
+            .limit(chunk_size)
+        )
+        user_ids = list(result.scalars().all())
+        if not user_ids:
+            return reaped
+
+        for model, column in (
+            (Transaction, Transaction.user_id),
+            (RecurringRule, RecurringRule.user_id),
+            (Category, Category.user_id),
+            (RefreshToken, RefreshToken.user_id),
+            (User, User.id),
+        ):
+            await db.execute(
+                delete(model).where(column.in_(user_ids)).execution_options(synchronize_session=False)
+            )
+        await db.commit()
+        reaped += len(user_ids)
+
+
+async def run_demo_reaper(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    settings = get_settings()
+    while True:
+        try:
+            async with session_factory() as session:
+                await reap_expired_demo_tenants(session)
+        except Exception:
+            logger.exception("Demo tenant reaper pass failed")
+        await asyncio.sleep(settings.demo_reaper_interval_seconds)
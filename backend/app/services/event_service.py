@@ -0,0 +1,51 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from datetime import date
+from decimal import Decimal
+from functools import lru_cache
+
+from app.core.config import get_settings
+from app.core.events import EventBroker
+from app.models.enums import TransactionType
+from app.schemas.event import ChangeAction, ChangeEvent, ChangeResource, ReportDelta
+
+READY_EVENT = ("ready", "{}")
+
+
+@lru_cache
+def get_event_broker() -> EventBroker:
+    return EventBroker(queue_size=get_settings().events_subscriber_queue_size)
+
+
+def publish_change(
+    user_id: int,
+    resource: ChangeResource,
+    action: ChangeAction,
+    id: int | None = None,
+    target_id: int | None = None,
+    deltas: Iterable[ReportDelta] = (),
+) -> None:
+    event = ChangeEvent(resource=resource, action=action, id=id, target_id=target_id, deltas=list(deltas))
+    get_event_broker().publish(user_id, f"{resource.value}.{action.value}", event.model_dump_json())
+
+
+def report_delta(
+    category_id: int, type: TransactionType, tx_date: date, amount: Decimal, currency: str
+) -> ReportDelta:
+    # Amounts stay in the transaction's currency: a client showing reports in that currency can apply the delta to
+    # its cached summary, category and monthly totals, any other client refetches.
+    return ReportDelta(
+        category_id=category_id, type=type, month=tx_date.replace(day=1), currency=currency, amount=amount
+    )
+
+
+async def user_events(user_id: int) -> AsyncIterator[tuple[str, str] | None]:
+    keepalive_seconds = get_settings().events_keepalive_seconds
+    with get_event_broker().subscribe(user_id) as subscription:
+        # Sent once the subscription is registered, so a client that refetches on "ready" cannot miss a change.
+        yield READY_EVENT
+        while True:
+            try:
+                yield await asyncio.wait_for(subscription.get(), timeout=keepalive_seconds)
+            except TimeoutError:
+                yield None
@@ -0,0 +1,194 @@
+from collections.abc import AsyncIterator, Callable
+from enum import Enum
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import get_settings
+from app.models.category import Category
+from app.models.enums import TransactionType
+from app.models.transaction import Transaction
+
+
+class ExportFormat(str, Enum):
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+    ExportFormat.ARROW: "application/vnd.apache.arrow.stream",
+}
+EXPORT_FILENAMES = {
+    ExportFormat.PARQUET: "transactions.parquet",
+    ExportFormat.ARROW: "transactions.arrows",
+}
+TRANSACTION_TYPES = [item.value for item in TransactionType]
+
+_EXPORT_COLUMNS = (
+    Transaction.id,
+    Transaction.date,
+    Transaction.type,
+    Transaction.category_id,
+    Transaction.amount,
+    Transaction.currency,
+    Transaction.note,
+    Transaction.recurring_rule_id,
+    Transaction.created_at,
+)
+
+
+def require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Columnar export requires pyarrow",
+        ) from exc
+    return pyarrow
+
+
+async def load_category_dictionary(db: AsyncSession, user_id: int) -> tuple[dict[int, int], list[str]]:
+    result = await db.execute(
+        select(Category.id, Category.name).where(Category.user_id == user_id).order_by(Category.id.asc())
+    )
+    rows = result.all()
+    return {row.id: index for index, row in enumerate(rows)}, [row.name for row in rows]
+
+
+async def stream_transaction_export(
+    session_factory: async_sessionmaker[AsyncSession],
+    export_format: ExportFormat,
+    filters: list,
+    category_index: dict[int, int],
+    category_names: list[str],
+) -> AsyncIterator[bytes]:
+    pa = require_pyarrow()
+    schema = _export_schema(pa)
+    # Dictionaries are built up front so batches share them. A category created after that is appended, which an
+    # IPC stream carries as a small delta.
+    type_dictionary = pa.array(TRANSACTION_TYPES, pa.string())
+    category_dictionary = pa.array(category_names, pa.string())
+    type_index = {value: index for index, value in enumerate(TRANSACTION_TYPES)}
+
+    def to_batch(rows: list) -> "pyarrow.RecordBatch":
+        ids, days, types, category_ids, amounts, currencies, notes, rule_ids, created = zip(*rows)
+        return pa.record_batch(
+            [
+                pa.array(ids, pa.int64()),
+                pa.array(days, pa.date32()),
+                pa.DictionaryArray.from_arrays(
+                    pa.array([type_index[kind.value] for kind in types], pa.int8()), type_dictionary
+                ),
+                pa.DictionaryArray.from_arrays(
+                    pa.array([category_index[category_id] for category_id in category_ids], pa.int32()),
+                    category_dictionary,
+                ),
+                pa.array(category_ids, pa.int64()),
+                pa.array(amounts, pa.decimal128(12, 2)),
+                pa.array(currencies, pa.string()),
+                pa.array(notes, pa.string()),
+                pa.array(rule_ids, pa.int64()),
+                pa.array(created, pa.timestamp("us")),
+            ],
+            schema=schema,
+        )
+
+    sink = _ChunkSink()
+    writer = await run_in_threadpool(_open_writer, pa, export_format, sink, schema)
+    stmt = (
+        select(*_EXPORT_COLUMNS)
+        .where(*filters)
+        .order_by(Transaction.date.asc(), Transaction.id.asc())
+        .execution_options(yield_per=get_settings().export_batch_rows)
+    )
+    try:
+        async with session_factory() as session:
+            result = await session.stream(stmt)
+            async for partition in result.partitions():
+                missing = {row.category_id for row in partition} - category_index.keys()
+                if missing:
+                    async with session_factory() as lookup:
+                        await _extend_category_dictionary(lookup, missing, category_index, category_names)
+                    category_dictionary = pa.array(category_names, pa.string())
+                await run_in_threadpool(_write_batch, writer, to_batch, partition)
+                yield sink.drain()
+    finally:
+        await run_in_threadpool(writer.close)
+    tail = sink.drain()
+    if tail:
+        yield tail
+
+
+async def _extend_category_dictionary(
+    db: AsyncSession, category_ids: set[int], category_index: dict[int, int], category_names: list[str]
+) -> None:
+    result = await db.execute(
+        select(Category.id, Category.name).where(Category.id.in_(category_ids)).order_by(Category.id.asc())
+    )
+    for row in result.all():
+        category_index[row.id] = len(category_names)
+        category_names.append(row.name)
+
+
+def _export_schema(pa) -> "pyarrow.Schema":
+    return pa.schema(
+        [
+            pa.field("id", pa.int64(), nullable=False),
+            pa.field("date", pa.date32(), nullable=False),
+            pa.field("type", pa.dictionary(pa.int8(), pa.string()), nullable=False),
+            pa.field("category", pa.dictionary(pa.int32(), pa.string()), nullable=False),
+            pa.field("category_id", pa.int64(), nullable=False),
+            pa.field("amount", pa.decimal128(12, 2), nullable=False),
+            pa.field("currency", pa.string(), nullable=False),
+            pa.field("note", pa.string()),
+            pa.field("recurring_rule_id", pa.int64()),
+            pa.field("created_at", pa.timestamp("us"), nullable=False),
+        ]
+    )
+
+
+def _open_writer(pa, export_format: ExportFormat, sink: "_ChunkSink", schema):
+    if export_format == ExportFormat.PARQUET:
+        return pa.parquet.ParquetWriter(sink, schema, compression="zstd")
+    return pa.ipc.new_stream(sink, schema, options=pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True))
+
+
+def _write_batch(writer, to_batch: Callable[[list], object], rows: list) -> None:
+    writer.write_batch(to_batch(rows))
+
+
+class _ChunkSink:
+    # Minimal file object for the pyarrow writers; bytes are handed to the response as soon as a batch lands.
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
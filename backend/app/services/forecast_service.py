@@ -0,0 +1,383 @@
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import date
+from decimal import Decimal
+from functools import lru_cache
+
+import numpy as np
+from sqlalchemy import Select, and_, bindparam, case, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.sql import month_trunc
+from app.models.category import Category
+from app.models.enums import TransactionType
+from app.models.forecast import CashFlowForecast
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.schemas.report import ForecastCategoryItem, ForecastMonth, ForecastResponse
+from app.services.fx_service import converted_amount
+from app.services.report_service import resolve_report_currency
+from app.services.shard_service import users_stored_on
+
+FORECAST_MODELS = ("moving_average", "seasonal_naive", "linear_trend")
+MOVING_AVERAGE_WINDOW = 3
+SEASON_MONTHS = 12
+BACKTEST_MONTHS = 3
+MAX_FORECAST_MONTHS = 24
+CENT = Decimal("0.01")
+
+
+def month_index(day: date) -> int:
+    return day.year * 12 + day.month - 1
+
+
+def month_start(index: int) -> date:
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def forecast_matrix(history: np.ndarray, horizon: int) -> tuple[np.ndarray, np.ndarray]:
+    # history is (series, months). Every model runs on the whole matrix at once; the one with the lowest error
+    # over the last BACKTEST_MONTHS is then picked per row.
+    if history.shape[1] > BACKTEST_MONTHS + 1:
+        train, actual = history[:, :-BACKTEST_MONTHS], history[:, -BACKTEST_MONTHS:]
+        errors = np.stack([np.abs(model(train, BACKTEST_MONTHS) - actual).mean(axis=1) for model in _MODELS])
+        choice = errors.argmin(axis=0)
+    else:
+        choice = np.zeros(history.shape[0], dtype=np.intp)
+
+    candidates = np.stack([model(history, horizon) for model in _MODELS])
+    forecasts = np.take_along_axis(candidates, choice[np.newaxis, :, np.newaxis], axis=0)[0]
+    return np.clip(forecasts, 0.0, None), choice
+
+
+def _moving_average(history: np.ndarray, horizon: int) -> np.ndarray:
+    level = history[:, -MOVING_AVERAGE_WINDOW:].mean(axis=1, keepdims=True)
+    return np.repeat(level, horizon, axis=1)
+
+
+def _seasonal_naive(history: np.ndarray, horizon: int) -> np.ndarray:
+    months = history.shape[1]
+    if months < SEASON_MONTHS:
+        return _moving_average(history, horizon)
+    return history[:, months - SEASON_MONTHS + np.arange(horizon) % SEASON_MONTHS]
+
+
+def _linear_trend(history: np.ndarray, horizon: int) -> np.ndarray:
+    months = history.shape[1]
+    steps = np.arange(months, dtype=np.float64)
+    centered = steps - steps.mean()
+    denominator = float((centered**2).sum()) or 1.0
+    level = history.mean(axis=1, keepdims=True)
+    slope = ((history - level) * centered).sum(axis=1, keepdims=True) / denominator
+    return level + slope * (np.arange(months, months + horizon) - steps.mean())
+
+
+_MODELS = (_moving_average, _seasonal_naive, _linear_trend)
+
+
+class ForecastCache:
+    # Keys carry the user's data version read from the database, so a write on any worker makes older entries
+    # unreachable; the TTL and size only bound memory.
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple, tuple[float, ForecastResponse]] = OrderedDict()
+
+    def get(self, key: tuple) -> ForecastResponse | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: tuple, response: ForecastResponse) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+@lru_cache
+def get_forecast_cache() -> ForecastCache:
+    settings = get_settings()
+    return ForecastCache(max_entries=settings.forecast_cache_size, ttl_seconds=settings.forecast_cache_ttl_seconds)
+
+
+async def get_forecast_report(
+    db: AsyncSession,
+    user_id: int,
+    months: int,
+    currency: str | None = None,
+    today: date | None = None,
+) -> ForecastResponse:
+    currency = await resolve_report_currency(db, currency)
+    today = today or date.today()
+    history_months = get_settings().forecast_history_months
+    # The version is read before any data, so a result is never filed under a version newer than what it saw.
+    version, stored = (
+        await db.execute(_stored_forecast_statement(), {"user_id": user_id, "as_of": today, "currency": currency})
+    ).one()
+    cache = get_forecast_cache()
+    key = (user_id, currency, today, version)
+    response = cache.get(key)
+    if response is None and stored is not None:
+        response = ForecastResponse.model_validate(stored)
+        if response.history_months != history_months:
+            response = None
+    if response is None:
+        response = await _compute_forecast(db, user_id, currency, today, history_months)
+    cache.put(key, response)
+    return _first_months(response, months)
+
+
+async def _compute_forecast(
+    db: AsyncSession, user_id: int, currency: str, today: date, history_months: int
+) -> ForecastResponse:
+    current = month_index(today)
+    month_col = month_trunc(Transaction.date)
+    result = await db.execute(
+        select(
+            Transaction.category_id,
+            Category.name,
+            Category.color,
+            Transaction.type,
+            month_col.label("month"),
+            func.sum(converted_amount(currency)).label("total"),
+        )
+        .join(Category, Category.id == Transaction.category_id)
+        .where(
+            Transaction.user_id == user_id,
+            Transaction.date >= month_start(current - history_months),
+            Transaction.date < month_start(current),
+        )
+        .group_by(Transaction.category_id, Category.name, Category.color, Transaction.type, month_col)
+    )
+    keys, history = _series_matrix(
+        (((row.category_id, row.name, row.color, row.type), row.month, row.total) for row in result),
+        first_month=current - history_months,
+        months=history_months,
+    )
+    balance = Decimal((await db.execute(_balance_stmt(currency).where(Transaction.user_id == user_id))).scalar_one())
+
+    # The current month is only partly recorded, so it is neither history nor forecast; its actuals are in the balance.
+    forecasts, choice = forecast_matrix(history, MAX_FORECAST_MONTHS + 1)
+    return _forecast_response(keys, choice, forecasts[:, 1:], balance, currency, today, history_months)
+
+
+async def store_forecasts_for_all_users(
+    db: AsyncSession,
+    chunk_size: int | None = None,
+    today: date | None = None,
+    shard: str | None = None,
+) -> int:
+    # Nightly batch: forecasts every user the database holds in BASE_CURRENCY, over the full horizon, so the endpoint
+    # can serve any months value from the stored row until the user writes again.
+    settings = get_settings()
+    chunk_size = chunk_size or settings.forecast_batch_chunk_size
+    currency = settings.base_currency
+    history_months = settings.forecast_history_months
+    today = today or date.today()
+    current = month_index(today)
+    month_col = month_trunc(Transaction.date)
+    stored = 0
+    last_user_id = 0
+
+    while True:
+        result = await db.execute(
+            select(User.id, User.data_version)
+            .where(User.id > last_user_id, *users_stored_on(shard))
+            .order_by(User.id.asc())
+            .limit(chunk_size)
+        )
+        versions = dict(result.tuples().all())
+        if not versions:
+            return stored
+        user_ids = list(versions)
+        last_user_id = user_ids[-1]
+
+        result = await db.execute(
+            select(
+                Transaction.user_id,
+                Transaction.category_id,
+                Category.name,
+                Category.color,
+                Transaction.type,
+                month_col.label("month"),
+                func.sum(converted_amount(currency)).label("total"),
+            )
+            .join(Category, Category.id == Transaction.category_id)
+            .where(
+                Transaction.user_id.in_(user_ids),
+                Transaction.date >= month_start(current - history_months),
+                Transaction.date < month_start(current),
+            )
+            .group_by(
+                Transaction.user_id, Transaction.category_id, Category.name, Category.color, Transaction.type, month_col
+            )
+        )
+        keys, history = _series_matrix(
+            (((row.user_id, row.category_id, row.name, row.color, row.type), row.month, row.total) for row in result),
+            first_month=current - history_months,
+            months=history_months,
+        )
+        result = await db.execute(
+            _balance_stmt(currency)
+            .add_columns(Transaction.user_id)
+            .where(Transaction.user_id.in_(user_ids))
+            .group_by(Transaction.user_id)
+        )
+        balances = {user_id: Decimal(total) for total, user_id in result.tuples()}
+
+        # One pass over every series of the chunk; the rows are then split back into each user's contiguous block.
+        forecasts, choice = forecast_matrix(history, MAX_FORECAST_MONTHS + 1)
+        forecasts = forecasts[:, 1:]
+        owners = np.array([key[0] for key in keys], dtype=np.int64)
+        order = np.argsort(owners, kind="stable")
+        bounds = np.searchsorted(owners[order], user_ids + [last_user_id + 1])
+        rows = []
+        for position, user_id in enumerate(user_ids):
+            block = order[bounds[position]:bounds[position + 1]]
+            response = _forecast_response(
+                [keys[index][1:] for index in block],
+                choice[block],
+                forecasts[block],
+                balances.get(user_id, Decimal(0)),
+                currency,
+                today,
+                history_months,
+            )
+            rows.append(
+                {
+                    "user_id": user_id,
+                    "data_version": versions[user_id],
+                    "as_of": today,
+                    "currency": currency,
+                    "payload": response.model_dump(mode="json"),
+                }
+            )
+
+        await db.execute(
+            delete(CashFlowForecast)
+            .where(CashFlowForecast.user_id.in_(user_ids))
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(insert(CashFlowForecast), rows)
+        await db.commit()
+        stored += len(rows)
+
+
+def _forecast_response(
+    keys: list[tuple],
+    choice: np.ndarray,
+    forecasts: np.ndarray,
+    balance: Decimal,
+    currency: str,
+    today: date,
+    history_months: int,
+) -> ForecastResponse:
+    current = month_index(today)
+    balance = balance.quantize(CENT)
+    is_income = np.array([key[3] == TransactionType.INCOME for key in keys], dtype=bool)
+    income, expenses = forecasts[is_income].sum(axis=0), forecasts[~is_income].sum(axis=0)
+
+    items: list[ForecastMonth] = []
+    running = balance
+    for offset in range(forecasts.shape[1]):
+        month_income, month_expenses = _money(income[offset]), _money(expenses[offset])
+        running += month_income - month_expenses
+        items.append(
+            ForecastMonth(
+                month=month_start(current + 1 + offset),
+                income=month_income,
+                expenses=month_expenses,
+                net=month_income - month_expenses,
+                balance=running,
+            )
+        )
+    categories = [
+        ForecastCategoryItem(
+            category_id=category_id,
+            category_name=name,
+            category_color=color,
+            type=kind,
+            model=FORECAST_MODELS[model],
+            amounts=[_money(value) for value in row],
+        )
+        for (category_id, name, color, kind), model, row in zip(keys, choice, forecasts)
+    ]
+    categories.sort(key=lambda item: (item.type.value, item.category_name))
+
+    return ForecastResponse(
+        currency=currency,
+        as_of=today,
+        history_months=history_months,
+        balance=balance,
+        months=items,
+        categories=categories,
+    )
+
+
+def _first_months(response: ForecastResponse, months: int) -> ForecastResponse:
+    # Every model's first N steps do not depend on the horizon, so shorter forecasts are prefixes of the full one.
+    return response.model_copy(
+        update={
+            "months": response.months[:months],
+            "categories": [
+                item.model_copy(update={"amounts": item.amounts[:months]}) for item in response.categories
+            ],
+        }
+    )
+
+
+@lru_cache(maxsize=None)
+def _stored_forecast_statement() -> Select:
+    return (
+        select(User.data_version, CashFlowForecast.payload)
+        .outerjoin(
+            CashFlowForecast,
+            and_(
+                CashFlowForecast.user_id == User.id,
+                CashFlowForecast.data_version == User.data_version,
+                CashFlowForecast.as_of == bindparam("as_of"),
+                CashFlowForecast.currency == bindparam("currency"),
+            ),
+        )
+        .where(User.id == bindparam("user_id"))
+    )
+
+
+def _series_matrix(rows: Iterable[tuple], first_month: int, months: int) -> tuple[list[tuple], np.ndarray]:
+    positions: dict[tuple, int] = {}
+    cells: list[tuple[int, int, float]] = []
+    for key, month, total in rows:
+        position = positions.setdefault(key, len(positions))
+        cells.append((position, month_index(month) - first_month, float(total or 0)))
+
+    history = np.zeros((len(positions), months))
+    if cells:
+        series, columns, totals = zip(*cells)
+        history[np.array(series), np.array(columns)] = totals
+    return list(positions), history
+
+
+def _balance_stmt(currency: str):
+    amount = converted_amount(currency)
+    return select(
+        func.coalesce(
+            func.sum(case((Transaction.type == TransactionType.INCOME, amount), else_=-amount)),
+            0,
+        )
+    )
+
+
+def _money(value: float) -> Decimal:
+    return Decimal(float(value)).quantize(CENT)
@@ -0,0 +1,138 @@
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import date
+from decimal import Decimal
+from functools import lru_cache
+
+from fastapi import HTTPException, status
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.config import get_settings
+from app.models.fx_rate import FxRate
+from app.models.transaction import Transaction
+
+ONE = Decimal("1")
+LOAD_CHUNK_SIZE = 1000
+
+
+def rate_at(currency, day) -> ColumnElement:
+    # Nearest rate: the latest one on or before the day, else the earliest after it. Both are seeks on the
+    # (currency, date) primary key, so this acts like a lateral join without leaving SQL.
+    on_or_before = (
+        select(FxRate.rate)
+        .where(FxRate.currency == currency, FxRate.date <= day)
+        .order_by(FxRate.date.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    after = (
+        select(FxRate.rate)
+        .where(FxRate.currency == currency, FxRate.date > day)
+        .order_by(FxRate.date.asc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    return func.coalesce(on_or_before, after)
+
+
+def converted_amount(display_currency: str) -> ColumnElement:
+    base_currency = get_settings().base_currency
+    in_base = case(
+        (Transaction.currency == base_currency, Transaction.amount),
+        else_=Transaction.amount * rate_at(Transaction.currency, Transaction.date),
+    )
+    if display_currency == base_currency:
+        return in_base
+    return case(
+        (Transaction.currency == display_currency, Transaction.amount),
+        else_=in_base / rate_at(display_currency, Transaction.date),
+    )
+
+
+class FxRateCache:
+    def __init__(self, max_currencies: int, ttl_seconds: float) -> None:
+        self.max_currencies = max_currencies
+        self.ttl_seconds = ttl_seconds
+        self._series: OrderedDict[tuple[str, str], tuple[float, list[date], list[Decimal]]] = OrderedDict()
+
+    async def get_rate(self, db: AsyncSession, currency: str, day: date) -> Decimal | None:
+        if currency == get_settings().base_currency:
+            return ONE
+
+        dates, rates = await self._load(db, currency)
+        if not dates:
+            return None
+        # Same nearest-date rule as rate_at(), answered from memory.
+        index = bisect_right(dates, day) - 1
+        return rates[max(index, 0)]
+
+    async def _load(self, db: AsyncSession, currency: str) -> tuple[list[date], list[Decimal]]:
+        # Every database, primary or shard, has its own fx_rates table; a rate loaded into one says nothing about
+        # the others.
+        key = (db.get_bind().url.render_as_string(hide_password=True), currency)
+        now = time.monotonic()
+        entry = self._series.get(key)
+        if entry is not None and entry[0] > now:
+            self._series.move_to_end(key)
+            return entry[1], entry[2]
+
+        result = await db.execute(
+            select(FxRate.date, FxRate.rate).where(FxRate.currency == currency).order_by(FxRate.date.asc())
+        )
+        rows = result.all()
+        dates, rates = [row.date for row in rows], [row.rate for row in rows]
+        # Rates are usually loaded by the CLI in another process, which cannot clear this cache; remembering "no
+        # rates" would keep rejecting the currency until the TTL ran out.
+        if not rows:
+            return dates, rates
+        self._series[key] = (now + self.ttl_seconds, dates, rates)
+        self._series.move_to_end(key)
+        while len(self._series) > self.max_currencies:
+            self._series.popitem(last=False)
+        return dates, rates
+
+    def clear(self) -> None:
+        self._series.clear()
+
+
+@lru_cache
+def get_fx_rate_cache() -> FxRateCache:
+    settings = get_settings()
+    return FxRateCache(max_currencies=settings.fx_rate_cache_currencies, ttl_seconds=settings.fx_rate_cache_ttl_seconds)
+
+
+async def to_base_currency(db: AsyncSession, amount: Decimal, currency: str, day: date) -> Decimal | None:
+    rate = await get_fx_rate_cache().get_rate(db, currency, day)
+    if rate is None:
+        return None
+    return (amount * rate).quantize(Decimal("0.01"))
+
+
+async def require_supported_currency(db: AsyncSession, currency: str, day: date) -> None:
+    if await get_fx_rate_cache().get_rate(db, currency, day) is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"No exchange rate available for {currency}",
+        )
+
+
+async def load_fx_rates(db: AsyncSession, rows: Iterable[tuple[date, str, Decimal]]) -> int:
+    insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+    latest = {(currency.upper(), day): rate for day, currency, rate in rows}
+    values = [{"currency": currency, "date": day, "rate": rate} for (currency, day), rate in latest.items()]
+    for start in range(0, len(values), LOAD_CHUNK_SIZE):
+        stmt = insert(FxRate).values(values[start:start + LOAD_CHUNK_SIZE])
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[FxRate.currency, FxRate.date],
+                set_={"rate": stmt.excluded.rate},
+            )
+        )
+    await db.commit()
+    get_fx_rate_cache().clear()
+    return len(values)
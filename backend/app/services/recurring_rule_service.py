@@ -0,0 +1,268 @@
+import asyncio
+import logging
+from datetime import date
+
+from fastapi import HTTPException, status
+from sqlalchemy import Date, Integer, Numeric, String, bindparam, delete, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.core.dependencies import UserMovingError, fence_user_writes
+from app.models.category import Category
+from app.models.recurring_rule import RecurringRule
+from app.schemas.event import ChangeAction, ChangeResource
+from app.schemas.recurring_rule import RecurringRuleCreate, RecurringRuleUpdate
+from app.services.budget_service import apply_spend_deltas
+from app.services.event_service import publish_change
+from app.services.fx_service import require_supported_currency
+from app.services.report_job_service import invalidate_report_jobs_for_users
+from app.services.suggestion_service import get_note_index
+
+logger = logging.getLogger(__name__)
+
+# Occurrence k of a rule is anchor_date + k * step. Each run only walks k between the last materialized
+# date and as_of, so catch-up after downtime costs one statement proportional to the missing occurrences.
+# Monthly and yearly bounds use the shortest/longest month and year so no occurrence falls outside them.
+_K_LOWER_DIVISOR = "CASE frequency WHEN 'daily' THEN 1 WHEN 'weekly' THEN 7 WHEN 'monthly' THEN 31 ELSE 366 END"
+_K_UPPER_DIVISOR = "CASE frequency WHEN 'daily' THEN 1 WHEN 'weekly' THEN 7 WHEN 'monthly' THEN 28 ELSE 365 END"
+# Rules of a user whose data is being copied to another shard wait for the move; their watermark moves with them.
+_SETTLED_USER = (
+    "AND NOT EXISTS (SELECT 1 FROM users WHERE users.id = recurring_rules.user_id AND users.shard_moving)"
+)
+
+_POSTGRES_MATERIALIZE = f"""
+WITH due AS (
+    SELECT id, user_id, category_id, amount, type, currency, note, frequency, anchor_date,
+           COALESCE(materialized_through, anchor_date - 1) AS after_date,
+           LEAST(COALESCE(end_date, :as_of), :as_of) AS until_date
+    FROM recurring_rules
+    WHERE anchor_date <= :as_of
+      AND (materialized_through IS NULL OR materialized_through < LEAST(COALESCE(end_date, :as_of), :as_of))
+      {_SETTLED_USER}
+      {{rule_filter}}
+    FOR UPDATE SKIP LOCKED
+),
+marked AS (
+    UPDATE recurring_rules SET materialized_through = due.until_date
+    FROM due
+    WHERE recurring_rules.id = due.id
+),
+occurrences AS (
+    SELECT due.*,
+           CAST(due.anchor_date + step.k * CASE frequency
+               WHEN 'daily' THEN INTERVAL '1 day'
+               WHEN 'weekly' THEN INTERVAL '7 days'
+               WHEN 'monthly' THEN INTERVAL '1 month'
+               ELSE INTERVAL '1 year'
+           END AS DATE) AS occurrence_date
+    FROM due
+    CROSS JOIN LATERAL generate_series(
+        GREATEST((due.after_date - due.anchor_date) / {_K_LOWER_DIVISOR}, 0),
+        (due.until_date - due.anchor_date) / {_K_UPPER_DIVISOR} + 1
+    ) AS step(k)
+)
+INSERT INTO transactions (user_id, category_id, amount, type, currency, note, date, recurring_rule_id, occurrence_date)
+SELECT user_id, category_id, amount, type, currency, note, occurrence_date, id, occurrence_date
+FROM occurrences
+WHERE occurrence_date > after_date AND occurrence_date <= until_date
+ON CONFLICT (recurring_rule_id, occurrence_date) DO NOTHING
+RETURNING user_id, category_id, date, amount, currency
+"""
+
+# SQLite has no generate_series or data-modifying CTEs: a recursive CTE walks k per rule, and the
+# watermark update runs as a second statement in the same (single-writer) transaction.
+_SQLITE_MATERIALIZE = f"""
+WITH RECURSIVE due AS (
+    SELECT id, user_id, category_id, amount, type, currency, note, anchor_date,
+           COALESCE(materialized_through, date(anchor_date, '-1 day')) AS after_date,
+           min(COALESCE(end_date, :as_of), :as_of) AS until_date,
+           CASE frequency WHEN 'daily' THEN 1 WHEN 'weekly' THEN 7 ELSE 0 END AS step_days,
+           CASE frequency WHEN 'monthly' THEN 1 WHEN 'yearly' THEN 12 ELSE 0 END AS step_months,
+           max(CAST(julianday(COALESCE(materialized_through, anchor_date)) - julianday(anchor_date) AS INTEGER)
+               / {_K_LOWER_DIVISOR}, 0) AS k,
+           CAST(julianday(min(COALESCE(end_date, :as_of), :as_of)) - julianday(anchor_date) AS INTEGER)
+               / {_K_UPPER_DIVISOR} + 1 AS k_max
+    FROM recurring_rules
+    WHERE anchor_date <= :as_of
+      AND (materialized_through IS NULL OR materialized_through < min(COALESCE(end_date, :as_of), :as_of))
+      {_SETTLED_USER}
+      {{rule_filter}}
+),
+steps AS (
+    SELECT * FROM due
+    UNION ALL
+    SELECT id, user_id, category_id, amount, type, currency, note, anchor_date, after_date, until_date,
+           step_days, step_months, k + 1, k_max
+    FROM steps
+    WHERE k < k_max
+),
+occurrences AS (
+    SELECT steps.*,
+           CASE WHEN step_days > 0 THEN date(anchor_date, '+' || (k * step_days) || ' days')
+           ELSE min(
+               date(anchor_date, 'start of month', '+' || (k * step_months) || ' months',
+                    '+' || (CAST(strftime('%d', anchor_date) AS INTEGER) - 1) || ' days'),
+               date(anchor_date, 'start of month', '+' || (k * step_months + 1) || ' months', '-1 day')
+           ) END AS occurrence_date
+    FROM steps
+)
+INSERT INTO transactions (user_id, category_id, amount, type, currency, note, date, recurring_rule_id, occurrence_date)
+SELECT user_id, category_id, amount, type, currency, note, occurrence_date, id, occurrence_date
+FROM occurrences
+WHERE occurrence_date > after_date AND occurrence_date <= until_date
+ON CONFLICT (recurring_rule_id, occurrence_date) DO NOTHING
+RETURNING user_id, category_id, date, amount, currency
+"""
+
+_SQLITE_MARK_MATERIALIZED = f"""
+UPDATE recurring_rules SET materialized_through = min(COALESCE(end_date, :as_of), :as_of)
+WHERE anchor_date <= :as_of
+  AND (materialized_through IS NULL OR materialized_through < min(COALESCE(end_date, :as_of), :as_of))
+  {_SETTLED_USER}
+  {{rule_filter}}
+"""
+
+
+async def materialize_due_occurrences(db: AsyncSession, as_of: date, rule_id: int | None = None) -> set[int]:
+    rule_filter = "AND id = :rule_id" if rule_id is not None else ""
+    params = {"as_of": as_of} if rule_id is None else {"as_of": as_of, "rule_id": rule_id}
+
+    def statement(template: str):
+        return text(template.format(rule_filter=rule_filter)).bindparams(bindparam("as_of", type_=Date))
+
+    postgres = db.get_bind().dialect.name == "postgresql"
+    materialize = statement(_POSTGRES_MATERIALIZE if postgres else _SQLITE_MATERIALIZE).columns(
+        user_id=Integer, category_id=Integer, date=Date, amount=Numeric(12, 2), currency=String
+    )
+    result = await db.execute(materialize, params)
+    rows = result.all()
+    if not postgres:
+        await db.execute(statement(_SQLITE_MARK_MATERIALIZED), params)
+
+    await apply_spend_deltas(db, ((row.category_id, row.date, row.amount, row.currency) for row in rows))
+    return {row.user_id for row in rows}
+
+
+async def create_recurring_rule(db: AsyncSession, user_id: int, payload: RecurringRuleCreate) -> RecurringRule:
+    await _validate_category(db, user_id, payload)
+    await require_supported_currency(db, _currency(payload), payload.anchor_date)
+    rule = RecurringRule(user_id=user_id, **_rule_values(payload))
+    db.add(rule)
+    await db.flush()
+
+    # Backdated rules are caught up in the same transaction, so the scheduler never sees them half-done.
+    materialized = await materialize_due_occurrences(db, date.today(), rule_id=rule.id)
+    await db.commit()
+    if materialized:
+        invalidate_report_jobs_for_users({user_id})
+        get_note_index().discard({user_id})
+        publish_change(user_id, ChangeResource.TRANSACTION, ChangeAction.GENERATED)
+    await db.refresh(rule)
+    return rule
+
+
+async def list_recurring_rules(db: AsyncSession, user_id: int) -> list[RecurringRule]:
+    result = await db.execute(
+        select(RecurringRule)
+        .where(RecurringRule.user_id == user_id)
+        .order_by(RecurringRule.anchor_date.asc(), RecurringRule.id.asc())
+    )
+    return list(result.scalars().all())
+
+
+async def get_recurring_rule_or_404(db: AsyncSession, user_id: int, rule_id: int) -> RecurringRule:
+    result = await db.execute(
+        select(RecurringRule).where(RecurringRule.id == rule_id, RecurringRule.user_id == user_id)
+    )
+    rule = result.scalar_one_or_none()
+    if rule is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recurring rule not found")
+    return rule
+
+
+async def update_recurring_rule(
+    db: AsyncSession,
+    user_id: int,
+    rule_id: int,
+    payload: RecurringRuleUpdate,
+) -> RecurringRule:
+    rule = await get_recurring_rule_or_404(db, user_id, rule_id)
+    await _validate_category(db, user_id, payload)
+    await require_supported_currency(db, _currency(payload), payload.anchor_date)
+
+    # Occurrences already materialized are real transactions now; the new schedule applies from here on.
+    for field, value in _rule_values(payload).items():
+        setattr(rule, field, value)
+    await db.flush()
+
+    materialized = await materialize_due_occurrences(db, date.today(), rule_id=rule.id)
+    await db.commit()
+    if materialized:
+        invalidate_report_jobs_for_users({user_id})
+        get_note_index().discard({user_id})
+        publish_change(user_id, ChangeResource.TRANSACTION, ChangeAction.GENERATED)
+    await db.refresh(rule)
+    return rule
+
+
+async def delete_recurring_rule(db: AsyncSession, user_id: int, rule_id: int) -> None:
+    result = await db.execute(
+        delete(RecurringRule)
+        .where(RecurringRule.id == rule_id, RecurringRule.user_id == user_id)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recurring rule not found")
+    await db.commit()
+
+
+async def run_recurring_scheduler(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    settings = get_settings()
+    while True:
+        try:
+            async with session_factory() as session:
+                user_ids = await materialize_due_occurrences(session, date.today())
+                fence_user_writes(session, user_ids)
+                await session.commit()
+            invalidate_report_jobs_for_users(user_ids)
+            get_note_index().discard(user_ids)
+            for user_id in user_ids:
+                publish_change(user_id, ChangeResource.TRANSACTION, ChangeAction.GENERATED)
+        except UserMovingError:
+            # A move started after this pass picked its rules; the retry skips that user until the move is done.
+            logger.info("Recurring materialization raced a shard move, retrying")
+            continue
+        except Exception:
+            logger.exception("Recurring transaction materialization failed")
+        await asyncio.sleep(settings.recurring_scheduler_interval_seconds)
+
+
+async def _validate_category(db: AsyncSession, user_id: int, payload: RecurringRuleCreate) -> None:
+    result = await db.execute(
+        select(Category.type).where(Category.id == payload.category_id, Category.user_id == user_id)
+    )
+    category_type = result.scalar_one_or_none()
+    if category_type is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
+    if category_type != payload.type:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Recurring rule type must match the selected category type",
+        )
+
+
+def _rule_values(payload: RecurringRuleCreate) -> dict:
+    return {
+        "category_id": payload.category_id,
+        "amount": payload.amount,
+        "type": payload.type,
+        "currency": _currency(payload),
+        "note": payload.note.strip() if payload.note else None,
+        "frequency": payload.frequency,
+        "anchor_date": payload.anchor_date,
+        "end_date": payload.end_date,
+    }
+
+
+def _currency(payload: RecurringRuleCreate) -> str:
+    return payload.currency or get_settings().base_currency
@@ -0,0 +1,86 @@
+from functools import lru_cache
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.database import get_session_factory, get_shard_router
+from app.core.jobs import Job, JobQueue, QueueFullError
+from app.schemas.report import ReportJobCreate, ReportJobKind, ReportJobPriority, ReportJobRead
+from app.services.report_service import (
+    get_by_category_report,
+    get_monthly_report,
+    get_summary_report,
+    validate_date_range,
+)
+
+PRIORITY_ORDER = {ReportJobPriority.HIGH: 0, ReportJobPriority.NORMAL: 1, ReportJobPriority.LOW: 2}
+
+
+@lru_cache
+def get_report_jobs() -> JobQueue:
+    settings = get_settings()
+    return JobQueue(
+        concurrency=settings.report_job_concurrency,
+        result_ttl_seconds=settings.report_job_result_ttl_seconds,
+        max_queued=settings.report_job_max_queued,
+        session_factory=get_session_factory,
+    )
+
+
+def submit_report_job(user_id: int, payload: ReportJobCreate, shard: str | None = None) -> ReportJobRead:
+    validate_date_range(payload.start_date, payload.end_date)
+    key = (user_id, payload.kind, payload.start_date, payload.end_date, payload.type, payload.currency)
+
+    async def run(db: AsyncSession):
+        if payload.kind == ReportJobKind.SUMMARY:
+            return await get_summary_report(
+                db, user_id, start_date=payload.start_date, end_date=payload.end_date, currency=payload.currency
+            )
+        if payload.kind == ReportJobKind.BY_CATEGORY:
+            return await get_by_category_report(
+                db,
+                user_id,
+                start_date=payload.start_date,
+                end_date=payload.end_date,
+                type_filter=payload.type,
+                currency=payload.currency,
+            )
+        return await get_monthly_report(
+            db, user_id, start_date=payload.start_date, end_date=payload.end_date, currency=payload.currency
+        )
+
+    try:
+        session_factory = get_shard_router().session_factory(shard) if shard is not None else None
+        job = get_report_jobs().submit(user_id, key, PRIORITY_ORDER[payload.priority], run, session_factory)
+    except QueueFullError as exc:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Report queue is full") from exc
+    return to_report_job_read(job)
+
+
+def get_report_job_or_404(user_id: int, job_id: str) -> Job:
+    job = get_report_jobs().get(job_id)
+    if job is None or job.owner_id != user_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report job not found")
+    return job
+
+
+def invalidate_user_report_jobs(user_id: int) -> None:
+    get_report_jobs().invalidate(lambda key: key[0] == user_id)
+
+
+def invalidate_report_jobs_for_users(user_ids: set[int]) -> None:
+    if user_ids:
+        get_report_jobs().invalidate(lambda key: key[0] in user_ids)
+
+
+def to_report_job_read(job: Job) -> ReportJobRead:
+    return ReportJobRead(
+        id=job.id,
+        status=job.status,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        error=job.error,
+        result=job.result,
+    )
@@ -1,10 +1,13 @@
 from datetime import date
 from decimal import Decimal
+from functools import lru_cache
 
 from fastapi import HTTPException, status
-from sqlalchemy import Date, case, cast, func, select
+from sqlalchemy import Select, bindparam, case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
+from app.core.sql import month_trunc
 from app.models.category import Category
 from app.models.enums import TransactionType
 from app.models.transaction import Transaction
@@ -15,8 +18,10 @@ from app.schemas.report import (
     ReportMonthlyResponse,
     ReportSummaryResponse,
 )
+from app.services.fx_service import converted_amount, require_supported_currency
 
 ZERO = Decimal("0")
+CENT = Decimal("0.01")
 
 
 async def get_summary_report(
@@ -24,22 +29,17 @@ async def get_summary_report(
     user_id: int,
     start_date: date | None = None,
     end_date: date | None = None,
+    currency: str | None = None,
 ) -> ReportSummaryResponse:
-    _validate_date_range(start_date, end_date)
-    filters = _build_filters(user_id, start_date, end_date)
+    validate_date_range(start_date, end_date)
+    currency = await resolve_report_currency(db, currency)
+    params = transaction_filter_params(user_id, start_date=start_date, end_date=end_date)
 
-    income_expr = case((Transaction.type == TransactionType.INCOME, Transaction.amount), else_=ZERO)
-    expense_expr = case((Transaction.type == TransactionType.EXPENSE, Transaction.amount), else_=ZERO)
-
-    stmt = select(
-        func.coalesce(func.sum(income_expr), ZERO),
-        func.coalesce(func.sum(expense_expr), ZERO),
-    ).where(*filters)
-
-    result = await db.execute(stmt)
-    income, expenses = result.one()
+    stmt = _summary_statement(currency, get_settings().base_currency, frozenset(params))
+    result = await db.execute(stmt, params)
+    income, expenses = (_money(value) for value in result.one())
     net = income - expenses
-    return ReportSummaryResponse(income=income, expenses=expenses, net=net)
+    return ReportSummaryResponse(currency=currency, income=income, expenses=expenses, net=net)
 
 
 async def get_by_category_report(
@@ -48,44 +48,32 @@ async def get_by_category_report(
     start_date: date | None = None,
     end_date: date | None = None,
     type_filter: TransactionType | None = None,
+    currency: str | None = None,
 ) -> ReportByCategoryResponse:
-    _validate_date_range(start_date, end_date)
-    filters = _build_filters(user_id, start_date, end_date)
-    if type_filter is not None:
-        filters.append(Transaction.type == type_filter)
+    validate_date_range(start_date, end_date)
+    currency = await resolve_report_currency(db, currency)
+    params = transaction_filter_params(user_id, type_filter, start_date=start_date, end_date=end_date)
 
-    stmt = (
-        select(
-            Category.id,
-            Category.name,
-            Category.color,
-            Transaction.type,
-            func.coalesce(func.sum(Transaction.amount), ZERO).label("total"),
-        )
-        .join(Category, Category.id == Transaction.category_id)
-        .where(*filters)
-        .group_by(Category.id, Category.name, Category.color, Transaction.type)
-        .order_by(func.sum(Transaction.amount).desc())
-    )
-
-    rows = (await db.execute(stmt)).all()
-    grand_total = sum((row.total for row in rows), ZERO)
+    stmt = _by_category_statement(currency, get_settings().base_currency, frozenset(params))
+    rows = (await db.execute(stmt, params)).all()
+    totals = [_money(row.total) for row in rows]
+    grand_total = sum(totals, ZERO)
 
     items: list[ReportByCategoryItem] = []
-    for row in rows:
-        percentage = (row.total / grand_total * Decimal("100")) if grand_total > 0 else ZERO
+    for row, total in zip(rows, totals):
+        percentage = (total / grand_total * Decimal("100")) if grand_total > 0 else ZERO
         items.append(
             ReportByCategoryItem(
                 category_id=row.id,
                 category_name=row.name,
                 category_color=row.color,
                 type=row.type,
-                total=row.total,
-                percentage=percentage.quantize(Decimal("0.01")),
+                total=total,
+                percentage=percentage.quantize(CENT),
             )
         )
 
-    return ReportByCategoryResponse(items=items, total=grand_total)
+    return ReportByCategoryResponse(currency=currency, items=items, total=grand_total)
 
 
 async def get_monthly_report(
@@ -93,42 +81,116 @@ async def get_monthly_report(
     user_id: int,
     start_date: date | None = None,
     end_date: date | None = None,
+    currency: str | None = None,
 ) -> ReportMonthlyResponse:
-    _validate_date_range(start_date, end_date)
-    filters = _build_filters(user_id, start_date, end_date)
+    validate_date_range(start_date, end_date)
+    currency = await resolve_report_currency(db, currency)
+    params = transaction_filter_params(user_id, start_date=start_date, end_date=end_date)
+
+    stmt = _monthly_statement(currency, get_settings().base_currency, frozenset(params))
+    rows = (await db.execute(stmt, params)).all()
+    items: list[ReportMonthlyItem] = []
+    for row in rows:
+        income, expenses = _money(row.income), _money(row.expenses)
+        items.append(ReportMonthlyItem(month=row.month, income=income, expenses=expenses, net=income - expenses))
+    return ReportMonthlyResponse(currency=currency, items=items)
+
+
+TRANSACTION_FILTER_CRITERIA = {
+    "user_id": lambda param: Transaction.user_id == param,
+    "type_filter": lambda param: Transaction.type == param,
+    "category_id": lambda param: Transaction.category_id == param,
+    "start_date": lambda param: Transaction.date >= param,
+    "end_date": lambda param: Transaction.date <= param,
+}
+
+
+def transaction_filter_params(
+    user_id: int,
+    type_filter: TransactionType | None = None,
+    category_id: int | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> dict:
+    params = {
+        "user_id": user_id,
+        "type_filter": type_filter,
+        "category_id": category_id,
+        "start_date": start_date,
+        "end_date": end_date,
+    }
+    return {name: value for name, value in params.items() if value is not None}
+
+
+def transaction_filter_template(names: frozenset[str]) -> list:
+    # Values stay bound parameters, so every request with the same set of filters reuses one statement object: its
+    # cache key is memoized, SQLAlchemy skips compilation, and the identical SQL hits asyncpg's prepared statements.
+    return [criterion(bindparam(name)) for name, criterion in TRANSACTION_FILTER_CRITERIA.items() if name in names]
+
+
+# Report statements are built once per currency pair and filter combination; converted_amount bakes both currencies
+# into the SQL, so the base currency is part of the key even though only the display currency is passed on.
+@lru_cache(maxsize=256)
+def _summary_statement(currency: str, base_currency: str, filter_names: frozenset[str]) -> Select:
+    income_expr, expense_expr = _income_expense_exprs(currency)
+    return select(
+        func.coalesce(func.sum(income_expr), ZERO),
+        func.coalesce(func.sum(expense_expr), ZERO),
+    ).where(*transaction_filter_template(filter_names))
 
-    month_col = cast(func.date_trunc("month", Transaction.date), Date)
-    income_expr = case((Transaction.type == TransactionType.INCOME, Transaction.amount), else_=ZERO)
-    expense_expr = case((Transaction.type == TransactionType.EXPENSE, Transaction.amount), else_=ZERO)
 
-    stmt = (
+@lru_cache(maxsize=256)
+def _by_category_statement(currency: str, base_currency: str, filter_names: frozenset[str]) -> Select:
+    total_expr = func.coalesce(func.sum(converted_amount(currency)), ZERO)
+    return (
+        select(
+            Category.id,
+            Category.name,
+            Category.color,
+            Transaction.type,
+            total_expr.label("total"),
+        )
+        .join(Category, Category.id == Transaction.category_id)
+        .where(*transaction_filter_template(filter_names))
+        .group_by(Category.id, Category.name, Category.color, Transaction.type)
+        .order_by(total_expr.desc())
+    )
+
+
+@lru_cache(maxsize=256)
+def _monthly_statement(currency: str, base_currency: str, filter_names: frozenset[str]) -> Select:
+    month_col = month_trunc(Transaction.date)
+    income_expr, expense_expr = _income_expense_exprs(currency)
+    return (
         select(
             month_col.label("month"),
             func.coalesce(func.sum(income_expr), ZERO).label("income"),
             func.coalesce(func.sum(expense_expr), ZERO).label("expenses"),
         )
-        .where(*filters)
+        .where(*transaction_filter_template(filter_names))
         .group_by(month_col)
         .order_by(month_col.asc())
     )
 
-    rows = (await db.execute(stmt)).all()
-    items = [
-        ReportMonthlyItem(month=row.month, income=row.income, expenses=row.expenses, net=row.income - row.expenses)
-        for row in rows
-    ]
-    return ReportMonthlyResponse(items=items)
+
+def _income_expense_exprs(currency: str) -> tuple:
+    amount = converted_amount(currency)
+    return (
+        case((Transaction.type == TransactionType.INCOME, amount), else_=ZERO),
+        case((Transaction.type == TransactionType.EXPENSE, amount), else_=ZERO),
+    )
+
+
+async def resolve_report_currency(db: AsyncSession, currency: str | None) -> str:
+    currency = (currency or get_settings().base_currency).upper()
+    await require_supported_currency(db, currency, date.today())
+    return currency
 
 
-def _build_filters(user_id: int, start_date: date | None, end_date: date | None) -> list:
-    filters: list = [Transaction.user_id == user_id]
-    if start_date is not None:
-        filters.append(Transaction.date >= start_date)
-    if end_date is not None:
-        filters.append(Transaction.date <= end_date)
-    return filters
+def _money(value) -> Decimal:
+    return Decimal(value).quantize(CENT)
 
 
-def _validate_date_range(start_date: date | None, end_date: date | None) -> None:
+def validate_date_range(start_date: date | None, end_date: date | None) -> None:
     if start_date and end_date and start_date > end_date:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start_date must be before or equal to end_date")
\ No newline at end of file
@@ -0,0 +1,240 @@
+import logging
+
+from sqlalchemy import Table, case, delete, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.database import ShardRouter
+from app.models.anomaly import CategoryAmountStats
+from app.models.budget import Budget, BudgetEvent, BudgetSpend
+from app.models.category import Category
+from app.models.forecast import CashFlowForecast
+from app.models.recurring_rule import RecurringRule
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.services.demo_seed_service import UNUSABLE_PASSWORD_HASH
+
+logger = logging.getLogger(__name__)
+
+COPY_CHUNK_SIZE = 5000
+
+
+async def ensure_shard_user(
+    session_factory: async_sessionmaker[AsyncSession],
+    shard: str,
+    user_id: int,
+    name: str,
+    email: str,
+) -> None:
+    # Shards keep a stub of the directory row so their foreign keys to users hold; credentials never leave the
+    # primary database.
+    async with session_factory() as session:
+        insert_stmt = postgresql.insert if session.get_bind().dialect.name == "postgresql" else sqlite.insert
+        await session.execute(
+            insert_stmt(User)
+            .values(
+                id=user_id,
+                name=name,
+                email=email,
+                hashed_password=UNUSABLE_PASSWORD_HASH,
+                shard=shard,
+            )
+            .on_conflict_do_nothing(index_elements=[User.id])
+        )
+        await session.commit()
+
+
+def users_stored_on(shard: str | None) -> tuple:
+    # Criteria for the users whose data a database holds. Batch jobs run against every database and skip users that
+    # are mid-move; the copy carries their last results, and the next run after the move recomputes them.
+    return (User.shard.is_(None) if shard is None else User.shard == shard, User.shard_moving.is_(False))
+
+
+async def move_user(
+    directory: async_sessionmaker[AsyncSession],
+    router: ShardRouter,
+    user_id: int,
+    target: str | None,
+) -> dict[str, int]:
+    async with directory() as session:
+        user = await session.get(User, user_id)
+        if user is None:
+            raise LookupError(f"User {user_id} not found")
+        source, name, email = user.shard, user.name, user.email
+        if source == target:
+            return {}
+
+    source_factory = directory if source is None else router.session_factory(source)
+    target_factory = directory if target is None else router.session_factory(target)
+    # Check-and-set, so two movers cannot both start. Writers re-read the flag on the source while updating the same
+    # row before they commit, so this update waits for in-flight writes and every later write is refused. Deleted
+    # accounts and demo tenants are refused in the same update: their purges delete the user outright and never
+    # wait for a move.
+    if not await _set_moving(directory, user_id, source, True):
+        raise RuntimeError(f"User {user_id} is already being moved, deleted or a demo tenant")
+    try:
+        if source is not None and not await _set_moving(source_factory, user_id, source, True):
+            raise RuntimeError(f"User {user_id} has no stub row on shard {source}")
+        if target is not None:
+            await ensure_shard_user(target_factory, target, user_id, name, email)
+        # Rows left on the target by an earlier failed attempt would otherwise be copied twice.
+        await _clear_target(target_factory, user_id)
+        async with source_factory() as source_session, target_factory() as target_session:
+            copied = await _copy_user_rows(source_session, target_session, user_id)
+            await target_session.commit()
+        async with directory() as session:
+            await session.execute(update(User).where(User.id == user_id).values(shard=target, shard_moving=False))
+            await session.commit()
+    except BaseException:
+        try:
+            await _clear_target(target_factory, user_id, drop_stub=target is not None)
+        finally:
+            if source is not None:
+                await _set_moving(source_factory, user_id, source, False)
+            await _set_moving(directory, user_id, source, False)
+        raise
+
+    async with source_factory() as session:
+        await _delete_user_rows(session, user_id, drop_stub=source is not None)
+        await session.commit()
+    logger.info("Moved user %s from %s to %s: %s", user_id, source or "primary", target or "primary", copied)
+    return copied
+
+
+async def _set_moving(
+    session_factory: async_sessionmaker[AsyncSession], user_id: int, shard: str | None, moving: bool
+) -> bool:
+    statement = (
+        update(User)
+        .where(User.id == user_id, User.shard.is_(None) if shard is None else User.shard == shard)
+        .where(User.shard_moving.is_(not moving))
+        .values(shard_moving=moving)
+        .execution_options(synchronize_session=False)
+    )
+    if moving:
+        statement = statement.where(User.deleted_at.is_(None), User.expires_at.is_(None))
+    async with session_factory() as session:
+        result = await session.execute(statement)
+        await session.commit()
+        return result.rowcount == 1
+
+
+async def _clear_target(session_factory: async_sessionmaker[AsyncSession], user_id: int, drop_stub: bool = False) -> None:
+    async with session_factory() as session:
+        await _delete_user_rows(session, user_id, drop_stub=drop_stub)
+        await session.commit()
+
+
+async def _copy_user_rows(source: AsyncSession, target: AsyncSession, user_id: int) -> dict[str, int]:
+    # Primary keys come from each database's own sequences, so parents are re-inserted one by one to learn their
+    # new ids and children are copied in bulk with the references remapped.
+    category_ids = await _copy_parents(source, target, Category.__table__, Category.user_id == user_id, {})
+    rule_ids = await _copy_parents(
+        source,
+        target,
+        RecurringRule.__table__,
+        RecurringRule.user_id == user_id,
+        {"category_id": category_ids},
+    )
+    budget_ids = await _copy_parents(
+        source, target, Budget.__table__, Budget.user_id == user_id, {"category_id": category_ids}
+    )
+    owned_budgets = select(Budget.id).where(Budget.user_id == user_id)
+    # Versions count per database, so the target continues past the source's; a stub left from an earlier stay on
+    # the target could otherwise repeat a version whose forecasts were computed from other data. Stored forecasts
+    # are not copied, the next batch run recomputes them.
+    version = await source.scalar(select(User.data_version).where(User.id == user_id))
+    await target.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(data_version=case((User.data_version > version, User.data_version), else_=version) + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+    return {
+        "categories": len(category_ids),
+        "recurring_rules": len(rule_ids),
+        "budgets": len(budget_ids),
+        "transactions": await _copy_rows(
+            source,
+            target,
+            Transaction.__table__,
+            Transaction.user_id == user_id,
+            {"category_id": category_ids, "recurring_rule_id": rule_ids},
+        ),
+        "budget_spend": await _copy_rows(
+            source, target, BudgetSpend.__table__, BudgetSpend.budget_id.in_(owned_budgets), {"budget_id": budget_ids}
+        ),
+        "budget_events": await _copy_rows(
+            source, target, BudgetEvent.__table__, BudgetEvent.budget_id.in_(owned_budgets), {"budget_id": budget_ids}
+        ),
+        "category_amount_stats": await _copy_rows(
+            source,
+            target,
+            CategoryAmountStats.__table__,
+            CategoryAmountStats.user_id == user_id,
+            {"category_id": category_ids},
+        ),
+    }
+
+
+async def _copy_parents(
+    source: AsyncSession,
+    target: AsyncSession,
+    table: Table,
+    criteria,
+    remap: dict[str, dict[int, int]],
+) -> dict[int, int]:
+    ids: dict[int, int] = {}
+    result = await source.execute(select(table).where(criteria).order_by(table.c.id))
+    for row in result.mappings().all():
+        values = _remapped(row, remap)
+        old_id = values.pop("id")
+        ids[old_id] = await target.scalar(insert(table).values(values).returning(table.c.id))
+    return ids
+
+
+async def _copy_rows(
+    source: AsyncSession,
+    target: AsyncSession,
+    table: Table,
+    criteria,
+    remap: dict[str, dict[int, int]],
+) -> int:
+    copied = 0
+    result = await source.stream(select(table).where(criteria).execution_options(yield_per=COPY_CHUNK_SIZE))
+    async for partition in result.mappings().partitions():
+        rows = []
+        for row in partition:
+            values = _remapped(row, remap)
+            values.pop("id", None)
+            rows.append(values)
+        await target.execute(insert(table), rows)
+        copied += len(rows)
+    return copied
+
+
+def _remapped(row, remap: dict[str, dict[int, int]]) -> dict:
+    values = dict(row)
+    for column, ids in remap.items():
+        if values[column] is not None:
+            values[column] = ids[values[column]]
+    return values
+
+
+async def _delete_user_rows(session: AsyncSession, user_id: int, drop_stub: bool) -> None:
+    owned_budgets = select(Budget.id).where(Budget.user_id == user_id).scalar_subquery()
+    statements = [
+        delete(BudgetEvent).where(BudgetEvent.budget_id.in_(owned_budgets)),
+        delete(BudgetSpend).where(BudgetSpend.budget_id.in_(owned_budgets)),
+        delete(CashFlowForecast).where(CashFlowForecast.user_id == user_id),
+        delete(CategoryAmountStats).where(CategoryAmountStats.user_id == user_id),
+        delete(Budget).where(Budget.user_id == user_id),
+        delete(Transaction).where(Transaction.user_id == user_id),
+        delete(RecurringRule).where(RecurringRule.user_id == user_id),
+        delete(Category).where(Category.user_id == user_id),
+    ]
+    if drop_stub:
+        statements.append(delete(User).where(User.id == user_id))
+    for statement in statements:
+        await session.execute(statement.execution_options(synchronize_session=False))
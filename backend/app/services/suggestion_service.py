@@ -0,0 +1,245 @@
+import sys
+import time
+from bisect import bisect_left, insort
+from collections import Counter, OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from functools import lru_cache
+from heapq import nlargest
+from itertools import islice, takewhile
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models.transaction import Transaction
+from app.schemas.transaction import NoteSuggestion
+
+# Rough per-note cost of the dict slot, stats object and counter on top of the two strings.
+ENTRY_OVERHEAD_BYTES = 400
+# Invalidations older than the newest this many are folded into a single floor, so the map stays bounded.
+MAX_TRACKED_INVALIDATIONS = 4096
+# Prefixes up to this long match most of a user's notes, so their best matches are kept ranked rather than found by
+# scanning every match on each keystroke.
+SHORT_PREFIX_LENGTH = 2
+MAX_SUGGESTIONS = 20
+
+
+@dataclass
+class NoteStats:
+    note: str
+    count: int = 0
+    categories: Counter = field(default_factory=Counter)
+    last_amount: Decimal | None = None
+    last_date: date | None = None
+
+
+class UserNotes:
+    def __init__(self, expires_at: float) -> None:
+        self.expires_at = expires_at
+        self.keys: list[str] = []
+        self.stats: dict[str, NoteStats] = {}
+        self.size = 0
+        # Ranked keys for each short prefix searched so far, at most MAX_SUGGESTIONS per prefix.
+        self._top: dict[str, list[str]] = {}
+
+    def add(self, note: str, category_id: int, amount: Decimal, day: date, keep_sorted: bool = True) -> int:
+        key = normalize_note(note)
+        stats = self.stats.get(key)
+        added = 0
+        if stats is None:
+            stats = self.stats[key] = NoteStats(note=note)
+            if keep_sorted:
+                insort(self.keys, key)
+            added = sys.getsizeof(key) + sys.getsizeof(note) + ENTRY_OVERHEAD_BYTES
+            self.size += added
+        stats.count += 1
+        stats.categories[category_id] += 1
+        if stats.last_date is None or day >= stats.last_date:
+            stats.note, stats.last_amount, stats.last_date = note, amount, day
+        # Adding only ever raises a note's rank, so it can move into a ranked list but never push a better one out.
+        for top_prefix in _short_prefixes(key):
+            top = self._top.get(top_prefix)
+            if top is not None:
+                if key not in top:
+                    top.append(key)
+                self._rank(top)
+                del top[MAX_SUGGESTIONS:]
+        return added
+
+    def is_latest(self, note: str, day: date) -> bool:
+        stats = self.stats.get(normalize_note(note))
+        return stats is not None and stats.count > 1 and stats.last_date is not None and day >= stats.last_date
+
+    def remove(self, note: str, category_id: int) -> int:
+        key = normalize_note(note)
+        stats = self.stats.get(key)
+        if stats is None:
+            return 0
+        stats.count -= 1
+        stats.categories[category_id] -= 1
+        # A ranked note that drops may now rank below one outside the list; those lists are rebuilt on next search.
+        for top_prefix in _short_prefixes(key):
+            if key in self._top.get(top_prefix, ()):
+                del self._top[top_prefix]
+        if stats.categories[category_id] <= 0:
+            del stats.categories[category_id]
+        if stats.count > 0:
+            return 0
+        del self.stats[key]
+        del self.keys[bisect_left(self.keys, key)]
+        removed = sys.getsizeof(key) + sys.getsizeof(stats.note) + ENTRY_OVERHEAD_BYTES
+        self.size -= removed
+        return removed
+
+    def search(self, prefix: str, limit: int) -> list[NoteStats]:
+        if len(prefix) > SHORT_PREFIX_LENGTH or limit > MAX_SUGGESTIONS:
+            return [self.stats[key] for key in self._scan(prefix, limit)]
+        top = self._top.get(prefix)
+        if top is None:
+            top = self._top[prefix] = self._scan(prefix, MAX_SUGGESTIONS)
+        return [self.stats[key] for key in top[:limit]]
+
+    def _scan(self, prefix: str, limit: int) -> list[str]:
+        start = bisect_left(self.keys, prefix)
+        matches = takewhile(lambda key: key.startswith(prefix), islice(self.keys, start, None))
+        return nlargest(limit, matches, key=self._rank_key)
+
+    def _rank(self, keys: list[str]) -> None:
+        # Same order as the scan: best rank first, ties in key order.
+        keys.sort()
+        keys.sort(key=self._rank_key, reverse=True)
+
+    def _rank_key(self, key: str) -> tuple:
+        stats = self.stats[key]
+        return stats.count, stats.last_date
+
+
+class NoteIndex:
+    def __init__(self, max_bytes: int, ttl_seconds: float) -> None:
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.size = 0
+        self._users: OrderedDict[int, UserNotes] = OrderedDict()
+        self._generation = 0
+        self._invalidated: OrderedDict[int, int] = OrderedDict()
+        self._invalidated_floor = 0
+
+    def get(self, user_id: int) -> UserNotes | None:
+        notes = self._users.get(user_id)
+        if notes is None:
+            return None
+        if notes.expires_at <= time.monotonic():
+            self.discard([user_id])
+            return None
+        self._users.move_to_end(user_id)
+        return notes
+
+    def generation(self) -> int:
+        return self._generation
+
+    def store(self, user_id: int, generation: int, notes: UserNotes) -> None:
+        # A write that committed while the build query ran would be missing from it; such a build is used once
+        # and thrown away.
+        if self._invalidated.get(user_id, self._invalidated_floor) > generation:
+            return
+        self.discard([user_id])
+        self._users[user_id] = notes
+        self.size += notes.size
+        self._evict()
+
+    def record(self, user_id: int, added: Iterable[tuple] = (), removed: Iterable[tuple] = ()) -> None:
+        notes = self._users.get(user_id)
+        removed = list(removed)
+        # A note's last amount and date come from its latest occurrence; removing that leaves nothing to fall back
+        # to short of a rebuild.
+        if notes is None or any(notes.is_latest(note, day) for note, _, day in removed):
+            self.discard([user_id])
+            return
+        for note, category_id, _ in removed:
+            self.size -= notes.remove(note, category_id)
+        for note, category_id, amount, day in added:
+            self.size += notes.add(note, category_id, amount, day)
+        self._evict()
+
+    def discard(self, user_ids: Iterable[int]) -> None:
+        for user_id in user_ids:
+            notes = self._users.pop(user_id, None)
+            if notes is not None:
+                self.size -= notes.size
+            self._invalidate(user_id)
+
+    def clear(self) -> None:
+        self._users.clear()
+        self._invalidated.clear()
+        self._invalidated_floor = self._generation
+        self.size = 0
+
+    def _invalidate(self, user_id: int) -> None:
+        self._generation += 1
+        self._invalidated.pop(user_id, None)
+        self._invalidated[user_id] = self._generation
+        while len(self._invalidated) > MAX_TRACKED_INVALIDATIONS:
+            _, self._invalidated_floor = self._invalidated.popitem(last=False)
+
+    def _evict(self) -> None:
+        while self.size > self.max_bytes and self._users:
+            _, notes = self._users.popitem(last=False)
+            self.size -= notes.size
+
+
+@lru_cache
+def get_note_index() -> NoteIndex:
+    settings = get_settings()
+    return NoteIndex(max_bytes=settings.note_index_max_bytes, ttl_seconds=settings.note_index_ttl_seconds)
+
+
+def normalize_note(note: str) -> str:
+    return " ".join(note.split()).casefold()
+
+
+def _short_prefixes(key: str) -> list[str]:
+    return [key[:length] for length in range(min(len(key), SHORT_PREFIX_LENGTH) + 1)]
+
+
+async def suggest_notes(db: AsyncSession, user_id: int, query: str, limit: int) -> list[NoteSuggestion]:
+    index = get_note_index()
+    notes = index.get(user_id)
+    if notes is None:
+        notes = await _build_user_notes(db, user_id, index)
+
+    return [
+        NoteSuggestion(
+            note=stats.note,
+            category_id=stats.categories.most_common(1)[0][0],
+            last_amount=stats.last_amount,
+            count=stats.count,
+        )
+        for stats in notes.search(normalize_note(query), limit)
+    ]
+
+
+def record_note_changes(user_id: int, added: Iterable[tuple] = (), removed: Iterable[tuple] = ()) -> None:
+    get_note_index().record(
+        user_id,
+        added=[item for item in added if item[0]],
+        removed=[item for item in removed if item[0]],
+    )
+
+
+async def _build_user_notes(db: AsyncSession, user_id: int, index: NoteIndex) -> UserNotes:
+    generation = index.generation()
+    result = await db.execute(
+        select(Transaction.note, Transaction.category_id, Transaction.amount, Transaction.date)
+        .where(Transaction.user_id == user_id, Transaction.note.is_not(None))
+        .order_by(Transaction.date.asc(), Transaction.id.asc())
+    )
+    notes = UserNotes(expires_at=time.monotonic() + index.ttl_seconds)
+    for note, category_id, amount, day in result.tuples():
+        if note.strip():
+            notes.add(note, category_id, amount, day, keep_sorted=False)
+    notes.keys = sorted(notes.stats)
+    index.store(user_id, generation, notes)
+    return notes
@@ -0,0 +1,137 @@
+import asyncio
+import logging
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, exists, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.core.revocation import get_revocation_list
+from app.core.security import TokenError, create_access_token, create_refresh_token, decode_token
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+from app.schemas.auth import AuthTokens
+
+logger = logging.getLogger(__name__)
+
+
+async def issue_tokens(db: AsyncSession, user_id: int, family_id: str | None = None) -> AuthTokens:
+    jti = uuid.uuid4().hex
+    family_id = family_id or jti
+    expires_at = datetime.utcnow() + timedelta(days=get_settings().jwt_refresh_token_expire_days)
+    await db.execute(
+        insert(RefreshToken).values(jti=jti, family_id=family_id, user_id=user_id, expires_at=expires_at)
+    )
+    return AuthTokens(
+        access_token=create_access_token(str(user_id), family_id),
+        refresh_token=create_refresh_token(str(user_id), jti, family_id, expires_at),
+    )
+
+
+async def rotate_refresh_token(db: AsyncSession, refresh_token: str) -> AuthTokens:
+    user_id, jti, family_id = _decode_refresh_token(refresh_token)
+    result = await db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.jti == jti,
+            RefreshToken.user_id == user_id,
+            RefreshToken.used_at.is_(None),
+            RefreshToken.revoked_at.is_(None),
+            ~exists().where(User.id == RefreshToken.user_id, User.expires_at <= datetime.now(UTC)),
+        )
+        .values(used_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        # A token that was already rotated is being replayed, so it leaked: the whole family is cut off, including
+        # whichever copy rotated it first.
+        used_at = await db.scalar(
+            select(RefreshToken.used_at).where(RefreshToken.jti == jti, RefreshToken.revoked_at.is_(None))
+        )
+        if used_at is not None:
+            logger.warning("Refresh token reuse detected for user %s, revoking family %s", user_id, family_id)
+            await revoke_token_family(db, user_id, family_id)
+        raise _invalid_refresh_token()
+
+    tokens = await issue_tokens(db, user_id, family_id)
+    await db.commit()
+    return tokens
+
+
+async def revoke_refresh_token(db: AsyncSession, refresh_token: str) -> None:
+    user_id, _, family_id = _decode_refresh_token(refresh_token)
+    await revoke_token_family(db, user_id, family_id)
+
+
+async def revoke_token_family(db: AsyncSession, user_id: int, family_id: str) -> None:
+    now = datetime.utcnow()
+    await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    # No refresh token of the family outlives this bound, and access tokens expire long before it.
+    get_revocation_list().revoke(family_id, now + timedelta(days=get_settings().jwt_refresh_token_expire_days))
+
+
+async def revoke_user_tokens(db: AsyncSession, user_id: int) -> None:
+    now = datetime.utcnow()
+    result = await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=now)
+        .returning(RefreshToken.family_id)
+        .execution_options(synchronize_session=False)
+    )
+    families = set(result.scalars().all())
+    await db.commit()
+    expires_at = now + timedelta(days=get_settings().jwt_refresh_token_expire_days)
+    for family_id in families:
+        get_revocation_list().revoke(family_id, expires_at)
+
+
+async def load_revocations(db: AsyncSession) -> int:
+    last_expiry = func.max(RefreshToken.expires_at)
+    result = await db.execute(
+        select(RefreshToken.family_id, last_expiry)
+        .where(RefreshToken.revoked_at.is_not(None))
+        .group_by(RefreshToken.family_id)
+        .having(last_expiry > datetime.utcnow())
+    )
+    families = dict(result.tuples().all())
+    get_revocation_list().replace(families)
+    return len(families)
+
+
+async def run_revocation_sync(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    # Other workers revoke into their own memory; reloading periodically bounds how long they can disagree.
+    settings = get_settings()
+    while True:
+        await asyncio.sleep(settings.revocation_sync_interval_seconds)
+        try:
+            async with session_factory() as session:
+                await session.execute(
+                    delete(RefreshToken)
+                    .where(RefreshToken.expires_at <= datetime.utcnow())
+                    .execution_options(synchronize_session=False)
+                )
+                await session.commit()
+                await load_revocations(session)
+        except Exception:
+            logger.exception("Refresh token revocation sync failed")
+
+
+def _decode_refresh_token(refresh_token: str) -> tuple[int, str, str]:
+    try:
+        decoded = decode_token(refresh_token, expected_type="refresh", check_revoked=False)
+        return int(decoded["sub"]), str(decoded["jti"]), str(decoded["fam"])
+    except (TokenError, ValueError, KeyError):
+        raise _invalid_refresh_token()
+
+
+def _invalid_refresh_token() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
@@ -1,35 +1,63 @@
 import math
 from datetime import date
+from functools import lru_cache
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, select
+from sqlalchemy import Select, and_, bindparam, delete, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
+from app.core.config import get_settings
+from app.models.anomaly import CategoryAmountStats
 from app.models.category import Category
 from app.models.enums import TransactionType
 from app.models.transaction import Transaction
 from app.schemas.common import PaginationMeta
-from app.schemas.transaction import TransactionCreate, TransactionListResponse, TransactionRead, TransactionUpdate
+from app.schemas.event import ChangeAction, ChangeResource
+from app.schemas.transaction import (
+    TransactionCategory,
+    TransactionCreate,
+    TransactionListResponse,
+    TransactionRead,
+    TransactionUpdate,
+)
+from app.services.anomaly_service import score_transaction
+from app.services.budget_service import apply_spend_deltas
+from app.services.event_service import publish_change, report_delta
+from app.services.fx_service import require_supported_currency
+from app.services.report_job_service import invalidate_user_report_jobs
+from app.services.report_service import transaction_filter_params, transaction_filter_template
+from app.services.suggestion_service import record_note_changes
 
 
-async def create_transaction(db: AsyncSession, user_id: int, payload: TransactionCreate) -> Transaction:
-    category = await _get_user_category(db, user_id, payload.category_id)
+async def create_transaction(db: AsyncSession, user_id: int, payload: TransactionCreate) -> TransactionRead:
+    category, stats = await _get_user_category(db, user_id, payload.category_id)
     _validate_transaction_type(category.type, payload.type)
+    currency = await _resolve_currency(db, payload)
+    values = _transaction_values(payload, currency)
+    values["anomaly_score"] = await score_transaction(db, stats, payload.amount, currency, payload.date)
 
-    transaction = Transaction(
-        user_id=user_id,
-        category_id=payload.category_id,
-        amount=payload.amount,
-        type=payload.type,
-        note=payload.note.strip() if payload.note else None,
-        date=payload.date,
-    )
-
-    db.add(transaction)
+    # RETURNING hands back the generated columns, so the response needs no second read of the row.
+    transaction_id, created_at = (
+        await db.execute(
+            insert(Transaction)
+            .values(user_id=user_id, **values)
+            .returning(Transaction.id, Transaction.created_at)
+        )
+    ).one()
+    created = _transaction_read(values, category, id=transaction_id, created_at=created_at)
+    await apply_spend_deltas(db, [(payload.category_id, payload.date, payload.amount, currency)])
     await db.commit()
-    await db.refresh(transaction)
-    return await get_transaction_or_404(db, user_id, transaction.id)
+    invalidate_user_report_jobs(user_id)
+    record_note_changes(user_id, added=[(created.note, created.category_id, created.amount, created.date)])
+    publish_change(
+        user_id,
+        ChangeResource.TRANSACTION,
+        ChangeAction.CREATED,
+        id=transaction_id,
+        deltas=[report_delta(payload.category_id, payload.type, payload.date, payload.amount, currency)],
+    )
+    return created
 
 
 async def list_transactions(
@@ -45,26 +73,12 @@ async def list_transactions(
     if start_date and end_date and start_date > end_date:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start_date must be before or equal to end_date")
 
-    filters = _build_filters(
-        user_id=user_id,
-        type_filter=type_filter,
-        category_id=category_id,
-        start_date=start_date,
-        end_date=end_date,
-    )
-
-    total_stmt = select(func.count()).select_from(Transaction).where(*filters)
-    total = int((await db.execute(total_stmt)).scalar_one())
+    params = transaction_filter_params(user_id, type_filter, category_id, start_date, end_date)
+    total_stmt, page_stmt = _list_statements(frozenset(params))
+    total = int((await db.execute(total_stmt, params)).scalar_one())
 
-    stmt = (
-        select(Transaction)
-        .options(selectinload(Transaction.category))
-        .where(*filters)
-        .order_by(Transaction.date.desc(), Transaction.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-    )
-    transactions = (await db.execute(stmt)).scalars().all()
+    params.update(offset=(page - 1) * page_size, limit=page_size)
+    transactions = (await db.execute(page_stmt, params)).scalars().all()
 
     items = [TransactionRead.model_validate(tx) for tx in transactions]
     pagination = PaginationMeta(
@@ -77,12 +91,7 @@ async def list_transactions(
 
 
 async def get_transaction_or_404(db: AsyncSession, user_id: int, transaction_id: int) -> Transaction:
-    stmt = (
-        select(Transaction)
-        .options(selectinload(Transaction.category))
-        .where(Transaction.id == transaction_id, Transaction.user_id == user_id)
-    )
-    result = await db.execute(stmt)
+    result = await db.execute(_transaction_statement(), {"transaction_id": transaction_id, "user_id": user_id})
     transaction = result.scalar_one_or_none()
     if transaction is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transaction not found")
@@ -94,36 +103,119 @@ async def update_transaction(
     user_id: int,
     transaction_id: int,
     payload: TransactionUpdate,
-) -> Transaction:
-    transaction = await get_transaction_or_404(db, user_id, transaction_id)
-    category = await _get_user_category(db, user_id, payload.category_id)
+) -> TransactionRead:
+    row = (
+        await db.execute(
+            _update_lookup_statement(),
+            {"transaction_id": transaction_id, "user_id": user_id, "category_id": payload.category_id},
+        )
+    ).one_or_none()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transaction not found")
+    if row.Category is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
+    transaction, category, stats = row.Transaction, row.Category, row.CategoryAmountStats
     _validate_transaction_type(category.type, payload.type)
+    currency = await _resolve_currency(db, payload)
+    previous_spend = (transaction.category_id, transaction.date, -transaction.amount, transaction.currency)
+    previous_delta = report_delta(
+        transaction.category_id, transaction.type, transaction.date, -transaction.amount, transaction.currency
+    )
+    removed_note = (transaction.note, transaction.category_id, transaction.date)
 
-    transaction.category_id = payload.category_id
-    transaction.amount = payload.amount
-    transaction.type = payload.type
-    transaction.note = payload.note.strip() if payload.note else None
-    transaction.date = payload.date
+    values = _transaction_values(payload, currency)
+    values["anomaly_score"] = await score_transaction(db, stats, payload.amount, currency, payload.date)
+    for field, value in values.items():
+        setattr(transaction, field, value)
+    # Built before the commit expires the loaded row, so the response needs no second read of it.
+    updated = _transaction_read(
+        values,
+        category,
+        id=transaction.id,
+        created_at=transaction.created_at,
+        recurring_rule_id=transaction.recurring_rule_id,
+    )
 
+    await apply_spend_deltas(db, [previous_spend, (payload.category_id, payload.date, payload.amount, currency)])
     await db.commit()
-    await db.refresh(transaction)
-    return await get_transaction_or_404(db, user_id, transaction.id)
+    invalidate_user_report_jobs(user_id)
+    record_note_changes(
+        user_id, added=[(updated.note, updated.category_id, updated.amount, updated.date)], removed=[removed_note]
+    )
+    publish_change(
+        user_id,
+        ChangeResource.TRANSACTION,
+        ChangeAction.UPDATED,
+        id=transaction_id,
+        deltas=[previous_delta, report_delta(payload.category_id, payload.type, payload.date, payload.amount, currency)],
+    )
+    return updated
 
 
 async def delete_transaction(db: AsyncSession, user_id: int, transaction_id: int) -> None:
-    transaction = await get_transaction_or_404(db, user_id, transaction_id)
-    await db.delete(transaction)
+    result = await db.execute(
+        delete(Transaction)
+        .where(Transaction.id == transaction_id, Transaction.user_id == user_id)
+        .returning(
+            Transaction.category_id,
+            Transaction.type,
+            Transaction.date,
+            Transaction.amount,
+            Transaction.currency,
+            Transaction.note,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    deleted = result.one_or_none()
+    if deleted is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transaction not found")
+    await apply_spend_deltas(db, [(deleted.category_id, deleted.date, -deleted.amount, deleted.currency)])
     await db.commit()
+    invalidate_user_report_jobs(user_id)
+    record_note_changes(user_id, removed=[(deleted.note, deleted.category_id, deleted.date)])
+    publish_change(
+        user_id,
+        ChangeResource.TRANSACTION,
+        ChangeAction.DELETED,
+        id=transaction_id,
+        deltas=[report_delta(deleted.category_id, deleted.type, deleted.date, -deleted.amount, deleted.currency)],
+    )
 
 
-async def _get_user_category(db: AsyncSession, user_id: int, category_id: int) -> Category:
+async def _get_user_category(
+    db: AsyncSession, user_id: int, category_id: int
+) -> tuple[Category, CategoryAmountStats | None]:
+    # The amount stats ride along on the category lookup, so scoring a write costs no extra round trip.
     result = await db.execute(
-        select(Category).where(Category.id == category_id, Category.user_id == user_id)
+        select(Category, CategoryAmountStats)
+        .outerjoin(CategoryAmountStats, CategoryAmountStats.category_id == Category.id)
+        .where(Category.id == category_id, Category.user_id == user_id)
     )
-    category = result.scalar_one_or_none()
-    if category is None:
+    row = result.one_or_none()
+    if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
-    return category
+    return row.Category, row.CategoryAmountStats
+
+
+async def _resolve_currency(db: AsyncSession, payload: TransactionCreate | TransactionUpdate) -> str:
+    currency = payload.currency or get_settings().base_currency
+    await require_supported_currency(db, currency, payload.date)
+    return currency
+
+
+def _transaction_values(payload: TransactionCreate | TransactionUpdate, currency: str) -> dict:
+    return {
+        "category_id": payload.category_id,
+        "amount": payload.amount,
+        "type": payload.type,
+        "currency": currency,
+        "note": payload.note.strip() if payload.note else None,
+        "date": payload.date,
+    }
+
+
+def _transaction_read(values: dict, category: Category, **generated) -> TransactionRead:
+    return TransactionRead(**values, **generated, category=TransactionCategory.model_validate(category))
 
 
 def _validate_transaction_type(category_type: TransactionType, transaction_type: TransactionType) -> None:
@@ -134,7 +226,7 @@ def _validate_transaction_type(category_type: TransactionType, transaction_type:
         )
 
 
-def _build_filters(
+def build_transaction_filters(
     user_id: int,
     type_filter: TransactionType | None,
     category_id: int | None,
@@ -151,3 +243,39 @@ def _build_filters(
     if end_date is not None:
         filters.append(Transaction.date <= end_date)
     return filters
+
+
+@lru_cache(maxsize=None)
+def _list_statements(names: frozenset[str]) -> tuple[Select, Select]:
+    filters = transaction_filter_template(names)
+    total_stmt = select(func.count()).select_from(Transaction).where(*filters)
+    page_stmt = (
+        select(Transaction)
+        .options(joinedload(Transaction.category, innerjoin=True))
+        .where(*filters)
+        .order_by(Transaction.date.desc(), Transaction.created_at.desc())
+        .offset(bindparam("offset"))
+        .limit(bindparam("limit"))
+    )
+    return total_stmt, page_stmt
+
+
+@lru_cache(maxsize=None)
+def _update_lookup_statement() -> Select:
+    # The row being updated and its new category (with amount stats, as on create) come back in one round trip.
+    return (
+        select(Transaction, Category, CategoryAmountStats)
+        .select_from(Transaction)
+        .outerjoin(Category, and_(Category.id == bindparam("category_id"), Category.user_id == bindparam("user_id")))
+        .outerjoin(CategoryAmountStats, CategoryAmountStats.category_id == Category.id)
+        .where(Transaction.id == bindparam("transaction_id"), Transaction.user_id == bindparam("user_id"))
+    )
+
+
+@lru_cache(maxsize=None)
+def _transaction_statement() -> Select:
+    return (
+        select(Transaction)
+        .options(joinedload(Transaction.category, innerjoin=True))
+        .where(Transaction.id == bindparam("transaction_id"), Transaction.user_id == bindparam("user_id"))
+    )
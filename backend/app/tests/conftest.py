@@ -1,40 +1,85 @@
 import os
 from collections.abc import AsyncGenerator
+from contextvars import ContextVar
 from datetime import date
 
+import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import delete, event
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-
-from app.core.database import get_db_session
-from app.main import app
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.database import (
+    configure_sqlite,
+    create_session_factory,
+    get_db_session,
+    get_db_session_factory,
+    instrument_engine,
+)
+from app.core.query_budget import count_extra_chunks, get_query_budget
+from app.core.revocation import get_revocation_list
+from app.main import create_app
+from app.models.anomaly import CategoryAmountStats
 from app.models.base import Base
+from app.models.budget import Budget, BudgetEvent, BudgetSpend
 from app.models.category import Category
+from app.models.forecast import CashFlowForecast
+from app.models.fx_rate import FxRate
+from app.models.recurring_rule import RecurringRule
+from app.models.refresh_token import RefreshToken
 from app.models.transaction import Transaction
 from app.models.user import User
+from app.services.forecast_service import get_forecast_cache
+from app.services.fx_service import get_fx_rate_cache
+from app.services.suggestion_service import get_note_index
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///./test_pftracker.db"
 
+_recorded_statements: ContextVar[list[str] | None] = ContextVar("recorded_statements", default=None)
+
+
+class QueryBudgetEnforcer:
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        statements: list[str] = []
+        token = _recorded_statements.set(statements)
+        try:
+            with count_extra_chunks() as extra_chunks:
+                await self.app(scope, receive, send)
+        finally:
+            _recorded_statements.reset(token)
+
+        route = scope.get("route")
+        budget = get_query_budget(getattr(route, "endpoint", None), extra_chunks[0])
+        if budget is not None and len(statements) > budget:
+            captured = "\n".join(f"  {index}. {statement}" for index, statement in enumerate(statements, start=1))
+            pytest.fail(
+                f"{scope['method']} {route.path} executed {len(statements)} statements, budget is {budget}:\n{captured}",
+                pytrace=False,
+            )
+
 
 @pytest_asyncio.fixture(scope="session")
 async def engine():
-    if os.path.exists("test_pftracker.db"):
-        os.remove("test_pftracker.db")
+    for path in ("test_pftracker.db", "test_pftracker.db-wal", "test_pftracker.db-shm"):
+        if os.path.exists(path):
+            os.remove(path)
 
     test_engine = create_async_engine(TEST_DATABASE_URL, future=True)
+    instrument_engine(test_engine)
+    configure_sqlite(test_engine)
 
-    @event.listens_for(test_engine.sync_engine, "connect")
-    def register_date_trunc(dbapi_connection, _):
-        def date_trunc(unit: str, value: str | None) -> str | None:
-            if value is None:
-                return None
-            if unit != "month":
-                return value
-            parsed = str(value)
-            return f"{parsed[:7]}-01"
-
-        dbapi_connection.create_function("date_trunc", 2, date_trunc)
+    @event.listens_for(test_engine.sync_engine, "before_cursor_execute")
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements = _recorded_statements.get()
+        if statements is not None:
+            statements.append(statement)
 
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -42,34 +87,53 @@ async def engine():
     yield test_engine
 
     await test_engine.dispose()
-    if os.path.exists("test_pftracker.db"):
-        os.remove("test_pftracker.db")
+    for path in ("test_pftracker.db", "test_pftracker.db-wal", "test_pftracker.db-shm"):
+        if os.path.exists(path):
+            os.remove(path)
 
 
 @pytest_asyncio.fixture(scope="session")
 async def session_maker(engine):
-    return async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    return create_session_factory(engine, expire_on_commit=False)
 
 
 @pytest_asyncio.fixture(autouse=True)
 async def clean_db(session_maker) -> AsyncGenerator[None, None]:
     async with session_maker() as session:
+        await session.execute(delete(CashFlowForecast))
+        await session.execute(delete(CategoryAmountStats))
+        await session.execute(delete(BudgetEvent))
+        await session.execute(delete(BudgetSpend))
+        await session.execute(delete(Budget))
         await session.execute(delete(Transaction))
+        await session.execute(delete(RecurringRule))
         await session.execute(delete(Category))
+        await session.execute(delete(RefreshToken))
         await session.execute(delete(User))
+        await session.execute(delete(FxRate))
         await session.commit()
+    get_fx_rate_cache().clear()
+    get_forecast_cache().clear()
+    get_note_index().clear()
+    get_revocation_list().clear()
     yield
 
 
+@pytest.fixture(scope="session")
+def app():
+    return create_app()
+
+
 @pytest_asyncio.fixture
-async def client(session_maker) -> AsyncGenerator[AsyncClient, None]:
+async def client(app, session_maker) -> AsyncGenerator[AsyncClient, None]:
     async def override_get_db_session() -> AsyncGenerator[AsyncSession, None]:
         async with session_maker() as session:
             yield session
 
     app.dependency_overrides[get_db_session] = override_get_db_session
+    app.dependency_overrides[get_db_session_factory] = lambda: session_maker
 
-    transport = ASGITransport(app=app)
+    transport = ASGITransport(app=QueryBudgetEnforcer(app))
     async with AsyncClient(transport=transport, base_url="http://testserver") as async_client:
         yield async_client
 
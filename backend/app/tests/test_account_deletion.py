@@ -0,0 +1,89 @@
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.budget import Budget, BudgetSpend
+from app.models.category import Category
+from app.models.recurring_rule import RecurringRule
+from app.models.refresh_token import RefreshToken
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.services import account_service
+from app.services.account_service import purge_deleted_accounts
+
+
+@pytest.mark.asyncio
+async def test_deleted_account_is_locked_out_then_purged_in_chunks(
+    client, session_maker, register_user, create_category, create_transaction, monkeypatch
+):
+    auth = await register_user(name="Leaving", email="leaving@example.com", password="Password123")
+    user_id = auth["user"]["id"]
+    tokens = auth["tokens"]
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    food = await create_category(tokens["access_token"], name="Food", kind="expense", color="#f97316")
+    rent = await create_category(tokens["access_token"], name="Rent", kind="expense", color="#ef4444")
+    for day in range(1, 6):
+        await create_transaction(
+            tokens["access_token"],
+            category_id=food["id"],
+            amount="10.00",
+            kind="expense",
+            tx_date=date.today() - timedelta(days=day),
+        )
+    response = await client.post(
+        "/budgets", headers=headers, json={"category_id": food["id"], "period": "monthly", "limit_amount": "100.00"}
+    )
+    assert response.status_code == 201
+    response = await client.post(
+        "/recurring-rules",
+        headers=headers,
+        json={
+            "category_id": rent["id"],
+            "amount": "500.00",
+            "type": "expense",
+            "frequency": "monthly",
+            "anchor_date": (date.today() - timedelta(days=70)).isoformat(),
+        },
+    )
+    assert response.status_code == 201
+
+    other = await register_user(name="Staying", email="staying@example.com", password="Password123")
+    await create_category(other["tokens"]["access_token"], name="Food", kind="expense", color="#f97316")
+
+    response = await client.get("/users/me/deletion", headers=headers)
+    assert response.status_code == 404
+    response = await client.delete("/users/me", headers=headers)
+    assert response.status_code == 202
+    response = await client.get("/users/me/deletion", headers=headers)
+    assert response.json() == {"phase": "pending", "deleted_rows": {}}
+    response = await client.get("/categories", headers=headers)
+    assert response.status_code == 401
+    response = await client.post("/auth/login", json={"email": "leaving@example.com", "password": "Password123"})
+    assert response.status_code == 401
+    response = await client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 401
+
+    progress = []
+
+    async def read_progress(seconds: float) -> None:
+        progress.append((await client.get("/users/me/deletion", headers=headers)).json())
+
+    monkeypatch.setattr(account_service.asyncio, "sleep", read_progress)
+    assert await purge_deleted_accounts(session_maker, chunk_size=2, pause_seconds=0) == 1
+    monkeypatch.undo()
+    assert progress[0] == {"phase": "transactions", "deleted_rows": {"transactions": 2}}
+    assert progress[-1]["phase"] == "categories"
+    assert progress[-1]["deleted_rows"]["recurring_rules"] == 1
+    response = await client.get("/users/me/deletion", headers=headers)
+    assert response.json() == {"phase": "completed", "deleted_rows": {}}
+    async with session_maker() as session:
+        for model in (Transaction, RecurringRule, Budget, Category, RefreshToken):
+            assert await session.scalar(select(func.count()).select_from(model).where(model.user_id == user_id)) == 0
+        assert await session.scalar(select(func.count()).select_from(BudgetSpend)) == 0
+        assert await session.get(User, user_id) is None
+        assert await session.scalar(select(func.count()).select_from(Category)) == 1
+    assert await purge_deleted_accounts(session_maker, pause_seconds=0) == 0
+
+    response = await client.get("/categories", headers={"Authorization": f"Bearer {other['tokens']['access_token']}"})
+    assert [item["name"] for item in response.json()] == ["Food"]
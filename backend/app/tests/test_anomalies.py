@@ -0,0 +1,62 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.services.anomaly_service import refresh_category_amount_stats, robust_group_stats
+
+
+def test_robust_group_stats_computes_median_and_mad_per_group():
+    groups = np.array([7, 3, 7, 3, 7, 3, 3])
+    values = np.array([10.0, 1.0, 30.0, 2.0, 20.0, 100.0, 3.0])
+
+    keys, first, counts, medians, mads = robust_group_stats(groups, values)
+
+    assert keys.tolist() == [3, 7]
+    assert counts.tolist() == [4, 3]
+    assert medians.tolist() == [2.5, 20.0]
+    assert mads.tolist() == [1.0, 10.0]
+    assert groups[first].tolist() == [3, 7]
+
+
+@pytest.mark.asyncio
+async def test_new_transactions_are_scored_against_stored_stats(
+    client, session_maker, register_user, create_category, create_transaction
+):
+    auth = await register_user(name="Anomaly", email="anomaly@example.com", password="Password123")
+    token = auth["tokens"]["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    groceries = await create_category(token, name="Groceries", kind="expense", color="#f59e0b")
+
+    start = date.today() - timedelta(days=60)
+    for offset, amount in enumerate(("48.00", "52.00", "50.00", "47.50", "55.00", "49.00", "51.00", "53.00", "46.00")):
+        created = await create_transaction(
+            token, category_id=groceries["id"], amount=amount, kind="expense", tx_date=start + timedelta(days=offset)
+        )
+        assert created["anomaly_score"] is None
+
+    async with session_maker() as session:
+        assert await refresh_category_amount_stats(session) == 1
+
+    usual = await create_transaction(
+        token, category_id=groceries["id"], amount="54.00", kind="expense", tx_date=date.today()
+    )
+    outlier = await create_transaction(
+        token, category_id=groceries["id"], amount="250.00", kind="expense", tx_date=date.today()
+    )
+    assert usual["anomaly_score"] is None
+    assert Decimal(outlier["anomaly_score"]) > Decimal("3.5")
+
+    response = await client.get("/transactions/anomalies", headers=headers)
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == [outlier["id"]]
+
+    response = await client.put(
+        f"/transactions/{outlier['id']}",
+        headers=headers,
+        json={"category_id": groceries["id"], "amount": "50.00", "type": "expense", "date": date.today().isoformat()},
+    )
+    assert response.json()["anomaly_score"] is None
+    response = await client.get("/transactions/anomalies", headers=headers)
+    assert response.json() == []
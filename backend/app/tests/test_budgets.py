@@ -0,0 +1,79 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.core.metrics import registry
+from app.services.budget_service import apply_spend_deltas
+
+
+@pytest.mark.asyncio
+async def test_budget_status_tracks_writes_and_records_threshold_events(
+    client, register_user, create_category, create_transaction
+):
+    auth = await register_user(name="Budget", email="budget@example.com", password="Password123")
+    token = auth["tokens"]["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    dining = await create_category(token, name="Dining", kind="expense", color="#ef4444")
+    salary = await create_category(token, name="Salary", kind="income", color="#17c964")
+
+    today = date.today()
+    last_month = today.replace(day=1) - timedelta(days=1)
+    await create_transaction(token, category_id=dining["id"], amount="50.00", kind="expense", tx_date=today)
+    await create_transaction(token, category_id=dining["id"], amount="500.00", kind="expense", tx_date=last_month)
+
+    rejected = await client.post("/budgets", headers=headers, json={"category_id": salary["id"], "limit_amount": "10"})
+    assert rejected.status_code == 400
+
+    created = await client.post(
+        "/budgets", headers=headers, json={"category_id": dining["id"], "period": "monthly", "limit_amount": "200.00"}
+    )
+    assert created.status_code == 201
+    duplicate = await client.post("/budgets", headers=headers, json={"category_id": dining["id"], "limit_amount": "5"})
+    assert duplicate.status_code == 409
+
+    status_item = (await client.get("/budgets/status", headers=headers)).json()["items"][0]
+    assert Decimal(status_item["spent"]) == Decimal("50.00")
+    assert status_item["period_start"] == today.replace(day=1).isoformat()
+
+    crossing = await create_transaction(token, category_id=dining["id"], amount="120.00", kind="expense", tx_date=today)
+    events = (await client.get("/budgets/events", headers=headers)).json()
+    assert [(event["threshold"], Decimal(event["spent"])) for event in events] == [(80, Decimal("170.00"))]
+
+    moved = await client.put(
+        f"/transactions/{crossing['id']}",
+        headers=headers,
+        json={"category_id": dining["id"], "amount": "160.00", "type": "expense", "date": today.isoformat()},
+    )
+    assert moved.status_code == 200
+    events = (await client.get("/budgets/events", headers=headers)).json()
+    assert [event["threshold"] for event in events] == [100, 80]
+
+    assert (await client.delete(f"/transactions/{crossing['id']}", headers=headers)).status_code == 204
+    status_item = (await client.get("/budgets/status", headers=headers)).json()["items"][0]
+    assert Decimal(status_item["spent"]) == Decimal("50.00")
+    assert Decimal(status_item["remaining"]) == Decimal("150.00")
+    assert status_item["percent_used"] == 25.0
+
+
+@pytest.mark.asyncio
+async def test_spend_without_an_exchange_rate_is_logged_and_counted(
+    client, session_maker, register_user, create_category, caplog
+):
+    auth = await register_user(name="Budget", email="budget-fx@example.com", password="Password123")
+    token = auth["tokens"]["access_token"]
+    travel = await create_category(token, name="Travel", kind="expense", color="#0ea5e9")
+    created = await client.post(
+        "/budgets",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"category_id": travel["id"], "period": "monthly", "limit_amount": "200.00"},
+    )
+    assert created.status_code == 201
+    registry.reset()
+
+    async with session_maker() as session:
+        await apply_spend_deltas(session, [(travel["id"], date.today(), Decimal("10.00"), "XYZ")])
+        await session.commit()
+
+    assert registry.counters["budget_spend_skipped_total"][2] == {("XYZ",): 1}
+    assert "No XYZ exchange rate" in caplog.text
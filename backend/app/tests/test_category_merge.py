@@ -0,0 +1,195 @@
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.config import get_settings
+from app.models.anomaly import CategoryAmountStats
+from app.models.transaction import Transaction
+from app.services import category_service
+from app.services.anomaly_service import refresh_category_amount_stats
+from app.services.budget_service import apply_spend_deltas
+from app.services.category_service import merge_category, reassign_category_transactions
+from app.services.event_service import get_event_broker
+
+
+@pytest.mark.asyncio
+async def test_reassign_and_merge_move_transactions_and_budget_spend(
+    client, register_user, create_category, create_transaction
+):
+    auth = await register_user(name="Merger", email="merge@example.com", password="Password123")
+    token = auth["tokens"]["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    dining = await create_category(token, name="Dining", kind="expense", color="#ef4444")
+    restaurants = await create_category(token, name="Restaurants", kind="expense", color="#f97316")
+    salary = await create_category(token, name="Salary", kind="income", color="#17c964")
+
+    today = date.today()
+    last_month = today.replace(day=1) - timedelta(days=1)
+    await create_transaction(token, category_id=dining["id"], amount="50.00", kind="expense", tx_date=today)
+    for amount in ("30.00", "40.00", "50.00"):
+        await create_transaction(token, category_id=restaurants["id"], amount=amount, kind="expense", tx_date=today)
+    await create_transaction(token, category_id=restaurants["id"], amount="500.00", kind="expense", tx_date=last_month)
+    for category, limit in ((dining, "200.00"), (restaurants, "100.00")):
+        response = await client.post(
+            "/budgets", headers=headers, json={"category_id": category["id"], "period": "monthly", "limit_amount": limit}
+        )
+        assert response.status_code == 201
+    rule = await client.post(
+        "/recurring-rules",
+        headers=headers,
+        json={
+            "category_id": restaurants["id"],
+            "amount": "15.00",
+            "type": "expense",
+            "frequency": "monthly",
+            "anchor_date": (today + timedelta(days=40)).isoformat(),
+        },
+    )
+    assert rule.status_code == 201
+
+    for target, expected in ((salary["id"], 400), (restaurants["id"], 400), (999999, 404)):
+        response = await client.post(
+            f"/categories/{restaurants['id']}/merge", headers=headers, json={"target_category_id": target}
+        )
+        assert response.status_code == expected
+
+    response = await client.post(
+        f"/categories/{restaurants['id']}/reassign",
+        headers=headers,
+        json={"target_category_id": dining["id"], "start_date": today.replace(day=1).isoformat()},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"target_category_id": dining["id"], "moved_transactions": 3, "moved_recurring_rules": 0}
+    items = (await client.get("/budgets/status", headers=headers)).json()["items"]
+    spent = {item["category_id"]: Decimal(item["spent"]) for item in items}
+    assert spent == {dining["id"]: Decimal("170.00"), restaurants["id"]: Decimal("0.00")}
+    events = (await client.get("/budgets/events", headers=headers)).json()
+    assert [(event["threshold"], Decimal(event["spent"])) for event in events] == [(80, Decimal("170.00"))]
+
+    response = await client.post(
+        f"/categories/{restaurants['id']}/merge", headers=headers, json={"target_category_id": dining["id"]}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"target_category_id": dining["id"], "moved_transactions": 1, "moved_recurring_rules": 1}
+
+    categories = {item["name"]: item for item in (await client.get("/categories", headers=headers)).json()}
+    assert "Restaurants" not in categories
+    assert categories["Dining"]["transaction_count"] == 5
+    rules = (await client.get("/recurring-rules", headers=headers)).json()
+    assert [item["category_id"] for item in rules] == [dining["id"]]
+    budgets = (await client.get("/budgets", headers=headers)).json()
+    assert [item["category_id"] for item in budgets] == [dining["id"]]
+
+    other = await register_user(name="Other", email="other-merge@example.com", password="Password123")
+    response = await client.post(
+        f"/categories/{dining['id']}/reassign",
+        headers={"Authorization": f"Bearer {other['tokens']['access_token']}"},
+        json={"target_category_id": dining["id"] + 100},
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_moves_rebuild_amount_stats_of_both_categories(
+    session_maker, register_user, create_category, create_transaction
+):
+    auth = await register_user(name="Stats", email="move-stats@example.com", password="Password123")
+    token = auth["tokens"]["access_token"]
+    user_id = auth["user"]["id"]
+    source = await create_category(token, name="Old", kind="expense", color="#ef4444")
+    target = await create_category(token, name="New", kind="expense", color="#f97316")
+    today = date.today()
+    for amount in ("10.00", "20.00", "30.00"):
+        await create_transaction(token, category_id=source["id"], amount=amount, kind="expense", tx_date=today)
+    await create_transaction(token, category_id=target["id"], amount="200.00", kind="expense", tx_date=today)
+    async with session_maker() as session:
+        assert await refresh_category_amount_stats(session) == 2
+
+    async def stats() -> dict[int, tuple[int, Decimal]]:
+        async with session_maker() as session:
+            result = await session.execute(
+                select(CategoryAmountStats.category_id, CategoryAmountStats.sample_size, CategoryAmountStats.median)
+            )
+            return {category_id: (size, median) for category_id, size, median in result.tuples()}
+
+    async with session_maker() as session:
+        await reassign_category_transactions(
+            session, user_id, source["id"], target["id"], start_date=today, end_date=today
+        )
+    assert await stats() == {target["id"]: (4, Decimal("25.00"))}
+
+    await create_transaction(token, category_id=source["id"], amount="40.00", kind="expense", tx_date=today)
+    async with session_maker() as session:
+        await reassign_category_transactions(session, user_id, target["id"], source["id"])
+    assert await stats() == {source["id"]: (5, Decimal("30.00"))}
+    async with session_maker() as session:
+        await merge_category(session, user_id, source["id"], target["id"])
+    assert await stats() == {target["id"]: (5, Decimal("30.00"))}
+
+
+@pytest.mark.asyncio
+async def test_large_reassign_runs_in_chunks(
+    session_maker, register_user, create_category, create_transaction, monkeypatch
+):
+    monkeypatch.setattr(get_settings(), "category_move_chunk_size", 2)
+    auth = await register_user(name="Chunks", email="chunks@example.com", password="Password123")
+    token = auth["tokens"]["access_token"]
+    source = await create_category(token, name="Old", kind="expense", color="#ef4444")
+    target = await create_category(token, name="New", kind="expense", color="#f97316")
+    for day in range(1, 6):
+        await create_transaction(
+            token, category_id=source["id"], amount="10.00", kind="expense", tx_date=date(2026, 3, day)
+        )
+
+    async with session_maker() as session:
+        result = await reassign_category_transactions(session, auth["user"]["id"], source["id"], target["id"])
+    assert result.moved_transactions == 5
+    async with session_maker() as session:
+        counts = await session.execute(
+            select(Transaction.category_id, func.count()).group_by(Transaction.category_id)
+        )
+        assert dict(counts.tuples().all()) == {target["id"]: 5}
+
+
+@pytest.mark.asyncio
+async def test_failed_merge_announces_the_partial_move_and_can_be_repeated(
+    session_maker, register_user, create_category, create_transaction, monkeypatch
+):
+    monkeypatch.setattr(get_settings(), "category_move_chunk_size", 2)
+    auth = await register_user(name="Partial", email="partial@example.com", password="Password123")
+    token = auth["tokens"]["access_token"]
+    user_id = auth["user"]["id"]
+    source = await create_category(token, name="Old", kind="expense", color="#ef4444")
+    target = await create_category(token, name="New", kind="expense", color="#f97316")
+    for day in range(1, 6):
+        await create_transaction(
+            token, category_id=source["id"], amount="10.00", kind="expense", tx_date=date(2026, 3, day)
+        )
+
+    calls = 0
+
+    async def fail_second_chunk(db, deltas):
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise RuntimeError("connection lost")
+        return await apply_spend_deltas(db, deltas)
+
+    monkeypatch.setattr(category_service, "apply_spend_deltas", fail_second_chunk)
+    with get_event_broker().subscribe(user_id) as subscription:
+        async with session_maker() as session:
+            with pytest.raises(RuntimeError):
+                await merge_category(session, user_id, source["id"], target["id"])
+        name, data = await subscription.get()
+    assert name == "category.reassigned"
+    assert json.loads(data)["target_id"] == target["id"]
+
+    async with session_maker() as session:
+        counts = await session.execute(select(Transaction.category_id, func.count()).group_by(Transaction.category_id))
+        assert dict(counts.tuples().all()) == {target["id"]: 2, source["id"]: 3}
+
+        result = await merge_category(session, user_id, source["id"], target["id"])
+    assert result.moved_transactions == 3
@@ -0,0 +1,62 @@
+import asyncio
+import re
+
+import pytest
+
+from app.core.config import get_settings
+
+COLLAPSED_LINE = re.compile(r"^\S.* \d+$")
+retained: list[bytes] = []
+
+
+def allocate_for_heap_diff() -> None:
+    retained.extend(bytes(1024) for _ in range(2000))
+
+
+@pytest.mark.asyncio
+async def test_profile_and_heap_captures_are_admin_only_and_exclusive(client, register_user, monkeypatch):
+    admin = await register_user(name="Admin", email="profiler@example.com", password="Password123")
+    member = await register_user(name="Member", email="member-prof@example.com", password="Password123")
+    monkeypatch.setattr(get_settings(), "admin_emails", "profiler@example.com")
+    headers = {"Authorization": f"Bearer {admin['tokens']['access_token']}"}
+
+    response = await client.get(
+        "/debug/profile",
+        params={"seconds": 0.1},
+        headers={"Authorization": f"Bearer {member['tokens']['access_token']}"},
+    )
+    assert response.status_code == 403
+
+    profile, concurrent = await asyncio.gather(
+        client.get("/debug/profile", params={"seconds": 0.5, "hz": 50}, headers=headers),
+        _after(0.1, client.get("/debug/heap", params={"seconds": 0.1}, headers=headers)),
+    )
+    assert profile.status_code == 200
+    assert concurrent.status_code == 409
+    assert 10 <= int(profile.headers["x-profile-samples"]) <= 26
+    lines = profile.text.splitlines()
+    assert lines and all(COLLAPSED_LINE.match(line) for line in lines)
+    assert any(line.startswith("MainThread;") for line in lines)
+
+    async def allocate_later() -> None:
+        await asyncio.sleep(0.1)
+        allocate_for_heap_diff()
+
+    try:
+        heap, _ = await asyncio.gather(
+            client.get("/debug/heap", params={"seconds": 0.3, "limit": 10}, headers=headers),
+            allocate_later(),
+        )
+    finally:
+        retained.clear()
+    assert heap.status_code == 200
+    body = heap.json()
+    assert body["group_by"] == "lineno"
+    top = body["items"][0]
+    assert "test_debug_profiling.py" in top["location"]
+    assert top["size_diff_bytes"] >= 2000 * 1024
+
+
+async def _after(delay: float, request):
+    await asyncio.sleep(delay)
+    return await request
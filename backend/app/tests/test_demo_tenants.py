@@ -0,0 +1,90 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select, update
+
+from app.core.config import get_settings
+from app.core.security import hash_password
+from app.models.category import Category
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.services.demo_seed_service import UNUSABLE_PASSWORD_HASH, ensure_demo_data
+from app.services.demo_tenant_service import reap_expired_demo_tenants
+
+
+@pytest.mark.asyncio
+async def test_demo_login_clones_isolated_tenants_and_reaper_removes_them(client, session_maker):
+    async with session_maker() as session:
+        await ensure_demo_data(session)
+        await ensure_demo_data(session)
+        assert await session.scalar(select(func.count()).select_from(User)) == 1
+
+    first = (await client.post("/auth/demo")).json()
+    second = (await client.post("/auth/demo")).json()
+    assert first["user"]["id"] != second["user"]["id"]
+
+    first_headers = {"Authorization": f"Bearer {first['tokens']['access_token']}"}
+    second_headers = {"Authorization": f"Bearer {second['tokens']['access_token']}"}
+
+    first_categories = (await client.get("/categories", headers=first_headers)).json()
+    assert len(first_categories) == 6
+    assert sum(item["transaction_count"] for item in first_categories) == 8
+
+    first_transactions = (await client.get("/transactions", headers=first_headers)).json()
+    delete_response = await client.delete(
+        f"/transactions/{first_transactions['items'][0]['id']}",
+        headers=first_headers,
+    )
+    assert delete_response.status_code == 204
+
+    second_transactions = (await client.get("/transactions", headers=second_headers)).json()
+    assert second_transactions["pagination"]["total"] == 8
+
+    async with session_maker() as session:
+        await session.execute(
+            update(User)
+            .where(User.id == first["user"]["id"])
+            .values(expires_at=datetime.now(UTC) - timedelta(minutes=1))
+        )
+        await session.commit()
+
+    # Expired tenants are locked out before the reaper runs.
+    response = await client.get("/categories", headers=first_headers)
+    assert response.status_code == 401
+    response = await client.post("/auth/refresh", json={"refresh_token": first["tokens"]["refresh_token"]})
+    assert response.status_code == 401
+    response = await client.post("/auth/refresh", json={"refresh_token": second["tokens"]["refresh_token"]})
+    assert response.status_code == 200
+
+    async with session_maker() as session:
+
+        assert await reap_expired_demo_tenants(session, chunk_size=1) == 1
+        remaining_users = set((await session.execute(select(User.id))).scalars().all())
+        assert first["user"]["id"] not in remaining_users
+        assert second["user"]["id"] in remaining_users
+        orphaned = await session.scalar(
+            select(func.count()).select_from(Category).where(Category.user_id == first["user"]["id"])
+        )
+        assert orphaned == 0
+        orphaned = await session.scalar(
+            select(func.count()).select_from(Transaction).where(Transaction.user_id == first["user"]["id"])
+        )
+        assert orphaned == 0
+
+    expired_access = await client.get("/categories", headers=first_headers)
+    assert expired_access.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_existing_template_loses_its_password(client, session_maker):
+    async with session_maker() as session:
+        await ensure_demo_data(session)
+        await session.execute(update(User).values(hashed_password=hash_password("Password123")))
+        await session.commit()
+
+        await ensure_demo_data(session)
+        assert await session.scalar(select(User.hashed_password)) == UNUSABLE_PASSWORD_HASH
+
+    settings = get_settings()
+    response = await client.post("/auth/login", json={"email": settings.demo_user_email, "password": "Password123"})
+    assert response.status_code == 401
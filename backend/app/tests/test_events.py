@@ -0,0 +1,170 @@
+import asyncio
+import json
+from datetime import date
+
+import pytest
+
+from app.core.events import EventBroker
+from app.services.event_service import get_event_broker
+
+
+class LoopbackChannel:
+    # Stands in for a Postgres channel: every NOTIFY reaches every listening connection, the sender's included.
+    def __init__(self) -> None:
+        self.listeners: list = []
+        self.notifications: list[str] = []
+
+    async def add_listener(self, channel, callback) -> None:
+        self.listeners.append(callback)
+
+    async def remove_listener(self, channel, callback) -> None:
+        self.listeners.remove(callback)
+
+    async def execute(self, query: str) -> None:
+        pass
+
+    async def executemany(self, query: str, args) -> None:
+        for channel, payload in args:
+            self.notifications.append(payload)
+            for callback in list(self.listeners):
+                callback(self, 0, channel, payload)
+
+
+async def start_asgi(app, scope: dict, first_message: dict) -> tuple[asyncio.Queue, asyncio.Queue, asyncio.Task]:
+    inbound: asyncio.Queue = asyncio.Queue()
+    outbound: asyncio.Queue = asyncio.Queue()
+    await inbound.put(first_message)
+    task = asyncio.create_task(app(scope, inbound.get, outbound.put))
+    return inbound, outbound, task
+
+
+async def next_sse_event(outbound: asyncio.Queue, buffer: list[str]) -> tuple[str, dict]:
+    while True:
+        text = "".join(buffer)
+        if "\n\n" in text:
+            block, rest = text.split("\n\n", 1)
+            buffer[:] = [rest]
+            fields = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+            if fields:
+                return fields["event"], json.loads(fields["data"])
+            continue
+        message = await asyncio.wait_for(outbound.get(), timeout=5)
+        if message["type"] == "http.response.body":
+            buffer.append(message.get("body", b"").decode())
+
+
+def http_scope(path: str, token: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"testserver"), (b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 5000),
+        "server": ("testserver", 80),
+    }
+
+
+@pytest.mark.asyncio
+async def test_sse_stream_pushes_own_changes_with_report_deltas(
+    app, client, register_user, create_category, create_transaction
+):
+    owner = await register_user(name="Owner", email="stream-owner@example.com", password="Password123")
+    other = await register_user(name="Other", email="stream-other@example.com", password="Password123")
+    token = owner["tokens"]["access_token"]
+
+    inbound, outbound, task = await start_asgi(
+        app, http_scope("/events/stream", token), {"type": "http.request", "body": b"", "more_body": False}
+    )
+    start = await asyncio.wait_for(outbound.get(), timeout=5)
+    assert start["status"] == 200
+    assert dict(start["headers"])[b"content-type"].startswith(b"text/event-stream")
+    buffer: list[str] = []
+    assert await next_sse_event(outbound, buffer) == ("ready", {})
+
+    await create_category(other["tokens"]["access_token"], name="Elsewhere", kind="expense", color="#000000")
+    food = await create_category(token, name="Food", kind="expense", color="#f97316")
+    name, event = await next_sse_event(outbound, buffer)
+    assert name == "category.created"
+    assert event["id"] == food["id"]
+
+    transaction = await create_transaction(
+        token, category_id=food["id"], amount="12.50", kind="expense", tx_date=date(2026, 3, 14)
+    )
+    name, event = await next_sse_event(outbound, buffer)
+    assert name == "transaction.created"
+    assert event["id"] == transaction["id"]
+    assert event["deltas"] == [
+        {"category_id": food["id"], "type": "expense", "month": "2026-03-01", "currency": "USD", "amount": "12.50"}
+    ]
+
+    headers = {"Authorization": f"Bearer {token}"}
+    assert (await client.delete(f"/transactions/{transaction['id']}", headers=headers)).status_code == 204
+    name, event = await next_sse_event(outbound, buffer)
+    assert name == "transaction.deleted"
+    assert event["deltas"][0]["amount"] == "-12.50"
+
+    await inbound.put({"type": "http.disconnect"})
+    await asyncio.wait_for(task, timeout=5)
+    assert get_event_broker().subscriber_count == 0
+
+
+@pytest.mark.asyncio
+async def test_websocket_authenticates_with_first_message(app, client, register_user, create_category):
+    auth = await register_user(name="Socket", email="socket@example.com", password="Password123")
+    token = auth["tokens"]["access_token"]
+    scope = {"type": "websocket", "path": "/events/ws", "raw_path": b"/events/ws", "query_string": b"", "headers": []}
+
+    inbound, outbound, task = await start_asgi(app, dict(scope), {"type": "websocket.connect"})
+    assert (await asyncio.wait_for(outbound.get(), timeout=5))["type"] == "websocket.accept"
+    await inbound.put({"type": "websocket.receive", "text": "not-a-token"})
+    closed = await asyncio.wait_for(outbound.get(), timeout=5)
+    assert (closed["type"], closed["code"]) == ("websocket.close", 1008)
+    await asyncio.wait_for(task, timeout=5)
+
+    inbound, outbound, task = await start_asgi(app, dict(scope), {"type": "websocket.connect"})
+    assert (await asyncio.wait_for(outbound.get(), timeout=5))["type"] == "websocket.accept"
+    await inbound.put({"type": "websocket.receive", "text": token})
+    assert json.loads((await asyncio.wait_for(outbound.get(), timeout=5))["text"]) == {"event": "ready", "data": {}}
+
+    category = await create_category(token, name="Rent", kind="expense", color="#123456")
+    message = json.loads((await asyncio.wait_for(outbound.get(), timeout=5))["text"])
+    assert message["event"] == "category.created"
+    assert message["data"]["id"] == category["id"]
+
+    await inbound.put({"type": "websocket.disconnect", "code": 1000})
+    await asyncio.wait_for(task, timeout=5)
+    assert get_event_broker().subscriber_count == 0
+
+
+@pytest.mark.asyncio
+async def test_relay_fans_out_to_other_workers_once():
+    channel = LoopbackChannel()
+    first, second = EventBroker(queue_size=10), EventBroker(queue_size=10)
+    relays = [asyncio.create_task(first.relay(channel)), asyncio.create_task(second.relay(channel))]
+    await asyncio.sleep(0)
+    try:
+        with first.subscribe(7) as on_first, second.subscribe(7) as on_second, second.subscribe(8) as unrelated:
+            first.publish(7, "transaction.created", '{"id": 1}')
+            first.publish(7, "transaction.updated", json.dumps({"note": "x" * 8000}))
+            for subscription in (on_first, on_second):
+                assert await asyncio.wait_for(subscription.get(), timeout=1) == ("transaction.created", '{"id": 1}')
+            assert on_first.queue.get_nowait()[0] == "transaction.updated"
+            assert await asyncio.wait_for(on_second.get(), timeout=1) == ("resync", "{}")
+            assert on_first.queue.empty() and on_second.queue.empty() and unrelated.queue.empty()
+            assert len(channel.notifications) == 2
+
+            for index in range(11):
+                second.deliver(7, "transaction.deleted", str(index))
+            assert await on_second.get() == ("resync", "{}")
+            assert on_second.queue.empty()
+    finally:
+        for relay in relays:
+            relay.cancel()
+        await asyncio.gather(*relays, return_exceptions=True)
+    assert channel.listeners == []
@@ -0,0 +1,126 @@
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from sqlalchemy import select, update
+
+from app.models.forecast import CashFlowForecast
+from app.models.user import User
+from app.schemas.report import ForecastResponse
+from app.services.forecast_service import (
+    ForecastCache,
+    forecast_matrix,
+    month_index,
+    month_start,
+    store_forecasts_for_all_users,
+)
+
+
+def test_forecast_matrix_picks_the_best_model_per_series():
+    months = np.arange(24, dtype=np.float64)
+    history = np.stack(
+        [
+            np.full(24, 100.0),
+            10.0 * months + 50.0,
+            np.tile([10.0] * 11 + [500.0], 2),
+        ]
+    )
+
+    forecasts, choice = forecast_matrix(history, 3)
+
+    assert np.allclose(forecasts[0], 100.0)
+    assert np.allclose(forecasts[1], [290.0, 300.0, 310.0])
+    assert choice[2] == 1
+    assert np.allclose(forecasts[2], [10.0, 10.0, 10.0])
+
+
+
+def test_forecast_cache_bounds_entries_and_keys_on_the_data_version():
+    cache = ForecastCache(max_entries=2, ttl_seconds=60)
+    response = ForecastResponse.model_construct()
+    for user_id in range(3):
+        cache.put((user_id, "USD", date(2026, 3, 1), 0), response)
+
+    assert len(cache._entries) == 2
+    assert cache.get((0, "USD", date(2026, 3, 1), 0)) is None
+    assert cache.get((2, "USD", date(2026, 3, 1), 0)) is response
+    assert cache.get((2, "USD", date(2026, 3, 1), 1)) is None
+
+
+@pytest.mark.asyncio
+async def test_forecast_endpoint_recomputes_after_writes(
+    client, register_user, create_category, create_transaction
+):
+    auth = await register_user(name="Forecaster", email="forecast@example.com", password="Password123")
+    token = auth["tokens"]["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    salary = await create_category(token, name="Salary", kind="income", color="#22c55e")
+    rent = await create_category(token, name="Rent", kind="expense", color="#ef4444")
+
+    current = month_index(date.today())
+    for offset in range(1, 7):
+        day = month_start(current - offset).replace(day=5)
+        await create_transaction(token, category_id=salary["id"], amount="1000.00", kind="income", tx_date=day)
+        await create_transaction(token, category_id=rent["id"], amount="1500.00", kind="expense", tx_date=day)
+
+    response = await client.get("/reports/forecast", headers=headers, params={"months": 2})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["currency"] == "USD"
+    assert Decimal(body["balance"]) == Decimal("-3000.00")
+    assert [item["month"] for item in body["months"]] == [
+        month_start(current + 1).isoformat(),
+        month_start(current + 2).isoformat(),
+    ]
+    assert [Decimal(item["net"]) for item in body["months"]] == [Decimal("-500.00"), Decimal("-500.00")]
+    assert Decimal(body["months"][-1]["balance"]) == Decimal("-4000.00")
+    assert {item["category_name"] for item in body["categories"]} == {"Salary", "Rent"}
+
+    await create_transaction(
+        token, category_id=salary["id"], amount="600.00", kind="income", tx_date=month_start(current - 1)
+    )
+    response = await client.get("/reports/forecast", headers=headers, params={"months": 2})
+    assert Decimal(response.json()["balance"]) == Decimal("-2400.00")
+
+
+@pytest.mark.asyncio
+async def test_endpoint_serves_the_nightly_batch_until_the_user_writes(
+    client, session_maker, register_user, create_category, create_transaction
+):
+    auth = await register_user(name="Batched", email="batched@example.com", password="Password123")
+    token = auth["tokens"]["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    rent = await create_category(token, name="Rent", kind="expense", color="#ef4444")
+    current = month_index(date.today())
+    for offset in range(1, 4):
+        day = month_start(current - offset).replace(day=5)
+        await create_transaction(token, category_id=rent["id"], amount="1500.00", kind="expense", tx_date=day)
+    second = await register_user(name="Moving", email="moving@example.com", password="Password123")
+    async with session_maker() as session:
+        await session.execute(update(User).where(User.id == second["user"]["id"]).values(shard_moving=True))
+        await session.commit()
+
+    async with session_maker() as session:
+        assert await store_forecasts_for_all_users(session, chunk_size=1) == 1
+        stored = await session.scalar(select(CashFlowForecast))
+        assert stored.user_id == auth["user"]["id"]
+        assert stored.data_version == await session.scalar(select(User.data_version).where(User.id == stored.user_id))
+        assert len(stored.payload["months"]) == 24
+        # Marks the stored row so the test can tell it was served instead of recomputed.
+        await session.execute(
+            update(CashFlowForecast).values(payload={**stored.payload, "balance": "-1.00"})
+        )
+        await session.commit()
+
+    response = await client.get("/reports/forecast", headers=headers, params={"months": 2})
+    assert Decimal(response.json()["balance"]) == Decimal("-1.00")
+    assert len(response.json()["months"]) == 2
+    assert response.json()["months"][0]["expenses"] == "1500.00"
+
+    await create_transaction(
+        token, category_id=rent["id"], amount="100.00", kind="expense", tx_date=month_start(current - 1)
+    )
+    response = await client.get("/reports/forecast", headers=headers, params={"months": 2})
+    assert Decimal(response.json()["balance"]) == Decimal("-4600.00")
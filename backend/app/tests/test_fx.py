@@ -0,0 +1,73 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.models.fx_rate import FxRate
+from app.services.fx_service import load_fx_rates, to_base_currency
+
+
+@pytest.mark.asyncio
+async def test_reports_convert_to_display_currency_with_nearest_date_rates(
+    client, session_maker, register_user, create_category
+):
+    async with session_maker() as session:
+        await load_fx_rates(
+            session,
+            [
+                (date(2026, 1, 1), "EUR", Decimal("1.10")),
+                (date(2026, 2, 1), "EUR", Decimal("1.20")),
+            ],
+        )
+
+    auth = await register_user(name="FX", email="fx@example.com", password="Password123")
+    headers = {"Authorization": f"Bearer {auth['tokens']['access_token']}"}
+    travel = await create_category(auth["tokens"]["access_token"], name="Travel", kind="expense", color="#0ea5e9")
+
+    for amount, currency, tx_date in (
+        ("100.00", None, date(2026, 1, 15)),
+        ("100.00", "EUR", date(2026, 1, 15)),
+        ("100.00", "EUR", date(2026, 2, 10)),
+        ("50.00", "EUR", date(2025, 12, 20)),
+    ):
+        response = await client.post(
+            "/transactions",
+            headers=headers,
+            json={
+                "category_id": travel["id"],
+                "amount": amount,
+                "type": "expense",
+                "currency": currency,
+                "date": tx_date.isoformat(),
+            },
+        )
+        assert response.status_code == 201
+        assert response.json()["currency"] == (currency or "USD")
+
+    in_usd = (await client.get("/reports/summary", headers=headers)).json()
+    assert in_usd["currency"] == "USD"
+    # The December transaction predates every rate and falls back to the earliest one after it.
+    assert Decimal(in_usd["expenses"]) == Decimal("385.00")
+
+    in_eur = (await client.get("/reports/by-category", params={"currency": "EUR"}, headers=headers)).json()
+    assert in_eur["currency"] == "EUR"
+    assert Decimal(in_eur["total"]) == Decimal("340.91")
+
+    unknown = await client.post(
+        "/transactions",
+        headers=headers,
+        json={"category_id": travel["id"], "amount": "1.00", "type": "expense", "currency": "JPY", "date": "2026-01-01"},
+    )
+    assert unknown.status_code == 400
+    assert (await client.get("/reports/summary", params={"currency": "JPY"}, headers=headers)).status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_missing_rates_are_not_cached(session_maker):
+    async with session_maker() as session:
+        assert await to_base_currency(session, Decimal("10.00"), "CHF", date(2026, 3, 1)) is None
+        # As if a loader in another process had inserted the rate: nothing clears this process's cache.
+        session.add(FxRate(currency="CHF", date=date(2026, 3, 1), rate=Decimal("1.05")))
+        await session.commit()
+
+        assert await to_base_currency(session, Decimal("10.00"), "CHF", date(2026, 3, 1)) == Decimal("10.50")
@@ -0,0 +1,41 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+
+from app.models.category import Category
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.tools.generate import GenerateOptions, generate_dataset
+
+
+async def _ledger(session_maker, email_domain: str) -> list[tuple]:
+    async with session_maker() as session:
+        result = await session.execute(
+            select(User.email, Category.name, Transaction.type, Transaction.amount, Transaction.note, Transaction.date)
+            .join(Transaction, Transaction.user_id == User.id)
+            .join(Category, Category.id == Transaction.category_id)
+            .where(User.email.like(f"%@{email_domain}"))
+            .order_by(Transaction.id)
+        )
+        return [(email.split("@")[0], *rest) for email, *rest in result.all()]
+
+
+@pytest.mark.asyncio
+async def test_generate_dataset_is_deterministic_and_spans_years(engine, session_maker):
+    options = GenerateOptions(users=3, transactions_per_user=400, years=2, seed=7, chunk_size=250, end_date=date(2026, 6, 30))
+
+    first = await generate_dataset(engine, options)
+    second = await generate_dataset(engine, GenerateOptions(**{**options.__dict__, "email_domain": "replay.test"}))
+
+    assert first.users == second.users == 3
+    assert first.transactions == second.transactions == 1200
+
+    ledger = await _ledger(session_maker, options.email_domain)
+    assert ledger == await _ledger(session_maker, "replay.test")
+
+    dates = [row[5] for row in ledger]
+    assert min(dates) >= date(2024, 7, 1)
+    assert max(dates) <= date(2026, 6, 30)
+    assert {tx_date.year for tx_date in dates} == {2024, 2025, 2026}
+    assert all(row[3] > 0 for row in ledger)
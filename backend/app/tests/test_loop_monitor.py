@@ -0,0 +1,48 @@
+import pytest
+import pytest_asyncio
+
+from app.core import metrics
+from app.core.config import get_settings
+from app.core.loop_monitor import loop_monitor
+
+
+@pytest_asyncio.fixture
+async def running_monitor():
+    previous = (loop_monitor.interval_ms, loop_monitor.threshold_ms, loop_monitor.stalls.maxlen)
+    loop_monitor.configure(interval_ms=10, threshold_ms=50, capacity=20)
+    loop_monitor.clear()
+    loop_monitor.start()
+    yield loop_monitor
+    await loop_monitor.stop()
+    loop_monitor.configure(*previous)
+    loop_monitor.clear()
+
+
+@pytest.mark.asyncio
+async def test_blocking_call_is_captured_with_route_and_site(client, register_user, running_monitor, monkeypatch):
+    metrics.registry.reset()
+    admin = await register_user(name="Admin", email="loop-admin@example.com", password="Password123")
+    monkeypatch.setattr(get_settings(), "admin_emails", "loop-admin@example.com")
+    running_monitor.clear()
+
+    # bcrypt runs on the event loop and takes far longer than the threshold.
+    response = await client.post("/auth/login", json={"email": "loop-admin@example.com", "password": "Password123"})
+    assert response.status_code == 200
+
+    headers = {"Authorization": f"Bearer {admin['tokens']['access_token']}"}
+    body = (await client.get("/debug/event-loop", headers=headers)).json()
+    assert body["enabled"] is True
+    stall = body["items"][0]
+    assert stall["endpoint"] == "POST /auth/login"
+    assert stall["site"].startswith("verify_password (security.py:")
+    assert stall["finished"] is True
+    assert stall["duration_ms"] >= 50
+    assert any(frame.startswith("login_user (auth_service.py:") for frame in stall["stack"])
+    assert body["sites"][0]["site"] == stall["site"]
+    assert body["sites"][0]["endpoints"] == ["POST /auth/login"]
+
+    rendered = metrics.registry.render()
+    assert '# TYPE event_loop_lag_seconds histogram' in rendered
+    assert 'event_loop_lag_seconds_bucket{le="0.1"}' in rendered
+    lag_count = next(line for line in rendered.splitlines() if line.startswith("event_loop_lag_seconds_count"))
+    assert int(lag_count.split()[1]) > 1
@@ -0,0 +1,66 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import metrics
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reports_route_latency_and_db_statements(client, register_user):
+    metrics.registry.reset()
+    auth = await register_user(name="Metrics", email="metrics@example.com", password="Password123")
+    token = auth["tokens"]["access_token"]
+
+    response = await client.get("/categories", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+
+    metrics_response = await client.get("/metrics")
+    assert metrics_response.status_code == 200
+    assert metrics_response.headers["content-type"].startswith("text/plain")
+    body = metrics_response.text
+
+    assert '# TYPE http_request_duration_seconds histogram' in body
+    assert 'http_request_duration_seconds_count{method="GET",route="/categories",status="200"} 1' in body
+    assert 'http_response_size_bytes_count{method="GET",route="/categories"} 1' in body
+    # One statement to load the user, one for the category listing.
+    assert 'db_statements_per_request_sum{method="GET",route="/categories"} 2.000000' in body
+    assert 'http_requests_in_flight{method="GET"} 1' in body
+
+
+@pytest.mark.asyncio
+async def test_metrics_middleware_overhead_is_below_20_microseconds():
+    async def bare_app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    async def app_with_two_statements(scope, receive, send):
+        for _ in range(2):
+            context = SimpleNamespace()
+            metrics.before_cursor_execute(None, None, "SELECT 1", (), context, False)
+            metrics.after_cursor_execute(None, None, "SELECT 1", (), context, False)
+        await bare_app(scope, receive, send)
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        return None
+
+    instrumented = metrics.MetricsMiddleware(app_with_two_statements, metrics.MetricsRegistry())
+    scope = {"type": "http", "method": "GET", "path": "/bench"}
+    iterations = 20_000
+
+    async def run(app) -> float:
+        best = float("inf")
+        for _ in range(5):
+            started = time.perf_counter()
+            for _ in range(iterations):
+                await app(dict(scope), receive, send)
+            best = min(best, time.perf_counter() - started)
+        return best / iterations
+
+    baseline = await run(bare_app)
+    instrumented_cost = await run(instrumented)
+    overhead = instrumented_cost - baseline
+    assert overhead < 20e-6, f"metrics overhead {overhead * 1e6:.2f} us per request"
@@ -0,0 +1,141 @@
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.services import suggestion_service
+from app.services.suggestion_service import NoteIndex, UserNotes, get_note_index
+
+
+def test_note_index_evicts_least_recently_used_users_under_memory_cap():
+    index = NoteIndex(max_bytes=3000, ttl_seconds=60)
+    for user_id in (1, 2, 3):
+        notes = UserNotes(expires_at=float("inf"))
+        for number in range(2):
+            notes.add(f"note {user_id}-{number}", 10, Decimal("1.00"), date(2026, 1, 1))
+        index.store(user_id, index.generation(), notes)
+        index.get(1)
+
+    assert index.get(2) is None
+    assert index.get(1) is not None and index.get(3) is not None
+    assert index.size <= index.max_bytes
+
+
+def test_search_ranks_every_prefix_match():
+    notes = UserNotes(expires_at=float("inf"))
+    for number in range(1000):
+        notes.add(f"a{number:04d}", 10, Decimal("1.00"), date(2026, 1, 1))
+    for _ in range(3):
+        notes.add("a9999", 10, Decimal("1.00"), date(2026, 1, 1))
+    notes.keys = sorted(notes.stats)
+
+    assert [stats.note for stats in notes.search("a", 1)] == ["a9999"]
+
+
+def test_short_prefix_rankings_follow_adds_and_removes():
+    rng = random.Random(7)
+    notes = UserNotes(expires_at=float("inf"))
+    added: list[tuple[str, date]] = []
+    for step in range(3000):
+        if added and rng.random() < 0.3:
+            note, day = added.pop(rng.randrange(len(added)))
+            if not notes.is_latest(note, day):
+                notes.remove(note, 10)
+                continue
+            added.append((note, day))
+        note = rng.choice("abc") + rng.choice("abc") + rng.choice("abcdef")
+        day = date(2026, 1, 1) + timedelta(days=step)
+        notes.add(note, 10, Decimal("1.00"), day)
+        added.append((note, day))
+        if step % 50 == 0:
+            for prefix in ("", "a", "bc", "cab"):
+                assert notes.search(prefix, 5) == [notes.stats[key] for key in notes._scan(prefix, 5)]
+
+
+def test_short_prefix_search_does_not_scan_every_match(monkeypatch):
+    notes = UserNotes(expires_at=float("inf"))
+    for number in range(200):
+        notes.add(f"s{number:03d}", 10, Decimal("1.00"), date(2026, 1, 1))
+    assert notes.search("s", 8)[0].note == "s000"
+
+    def scan(prefix: str, limit: int) -> list[str]:
+        raise AssertionError(f"scanned every match of {prefix!r}")
+
+    monkeypatch.setattr(notes, "_scan", scan)
+    notes.add("s199", 10, Decimal("1.00"), date(2026, 1, 2))
+    for _ in range(3):
+        assert notes.search("s", 8)[0].note == "s199"
+
+
+def test_removing_latest_occurrence_drops_the_users_index():
+    index = NoteIndex(max_bytes=100_000, ttl_seconds=60)
+    notes = UserNotes(expires_at=float("inf"))
+    for amount, day in (("850.00", date(2025, 12, 1)), ("900.00", date(2026, 1, 1)), ("950.00", date(2026, 2, 1))):
+        notes.add("Rent", 10, Decimal(amount), day)
+    index.store(1, index.generation(), notes)
+
+    index.record(1, removed=[("Rent", 10, date(2025, 12, 1))])
+    assert index.get(1).stats["rent"].last_amount == Decimal("950.00")
+    index.record(1, removed=[("Rent", 10, date(2026, 2, 1))])
+    assert index.get(1) is None
+
+
+def test_invalidations_are_bounded_and_still_reject_stale_builds(monkeypatch):
+    monkeypatch.setattr(suggestion_service, "MAX_TRACKED_INVALIDATIONS", 10)
+    index = NoteIndex(max_bytes=100_000, ttl_seconds=60)
+    generation = index.generation()
+    index.discard(range(50))
+
+    assert len(index._invalidated) == 10
+    index.store(1, generation, UserNotes(expires_at=float("inf")))
+    assert index.get(1) is None
+    index.store(1, index.generation(), UserNotes(expires_at=float("inf")))
+    assert index.get(1) is not None
+
+
+@pytest.mark.asyncio
+async def test_suggest_ranks_prefix_matches_and_tracks_writes(
+    client, register_user, create_category, create_transaction
+):
+    auth = await register_user(name="Suggest", email="suggest@example.com", password="Password123")
+    token = auth["tokens"]["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    groceries = await create_category(token, name="Groceries", kind="expense", color="#f59e0b")
+    dining = await create_category(token, name="Dining", kind="expense", color="#ef4444")
+
+    for amount, category, note in (
+        ("20.00", groceries, "Supermarket"),
+        ("25.00", groceries, "supermarket "),
+        ("18.00", dining, "Supermarket"),
+        ("12.00", dining, "Sushi bar"),
+        ("9.00", dining, "Coffee"),
+    ):
+        await create_transaction(
+            token, category_id=category["id"], amount=amount, kind="expense", tx_date=date(2026, 3, 1), note=note
+        )
+
+    response = await client.get("/transactions/suggest", headers=headers, params={"q": "su"})
+    assert response.status_code == 200
+    assert response.json() == [
+        {"note": "Supermarket", "category_id": groceries["id"], "last_amount": "18.00", "count": 3},
+        {"note": "Sushi bar", "category_id": dining["id"], "last_amount": "12.00", "count": 1},
+    ]
+    assert get_note_index().get(auth["user"]["id"]) is not None
+
+    created = await create_transaction(
+        token, category_id=dining["id"], amount="30.00", kind="expense", tx_date=date(2026, 3, 2), note="Sushi bar"
+    )
+    response = await client.get("/transactions/suggest", headers=headers, params={"q": "SUSHI"})
+    assert response.json()[0]["count"] == 2
+    assert response.json()[0]["last_amount"] == "30.00"
+
+    await client.delete(f"/transactions/{created['id']}", headers=headers)
+    response = await client.put(
+        f"/transactions/{created['id'] - 2}",
+        headers=headers,
+        json={"category_id": dining["id"], "amount": "12.00", "type": "expense", "date": "2026-03-01", "note": "Tea"},
+    )
+    assert response.status_code == 200
+    response = await client.get("/transactions/suggest", headers=headers, params={"q": "su"})
+    assert [item["note"] for item in response.json()] == ["Supermarket"]
@@ -0,0 +1,128 @@
+from datetime import date
+
+import pytest
+from fastapi.routing import APIRoute
+
+from app.core.config import get_settings
+from app.core.query_budget import QUERY_BUDGET_PER_CHUNK_ATTR, get_query_budget, query_budget
+from app.services.fx_service import get_fx_rate_cache, load_fx_rates
+
+
+def test_every_endpoint_declares_a_query_budget(app):
+    missing = [
+        f"{sorted(route.methods)} {route.path}"
+        for route in app.routes
+        if isinstance(route, APIRoute) and get_query_budget(route.endpoint) is None
+    ]
+    assert missing == []
+
+
+@pytest.mark.asyncio
+async def test_exceeding_a_query_budget_fails_with_captured_sql(app, client, register_user, create_category):
+    auth = await register_user(name="Budget", email="budget@example.com", password="Password123")
+    token = auth["tokens"]["access_token"]
+    await create_category(token, name="Food", kind="expense", color="#f31260")
+
+    route = next(route for route in app.routes if isinstance(route, APIRoute) and route.path == "/categories" and "GET" in route.methods)
+    original_budget = get_query_budget(route.endpoint)
+    query_budget(1)(route.endpoint)
+    try:
+        with pytest.raises(pytest.fail.Exception) as exc_info:
+            await client.get("/categories", headers={"Authorization": f"Bearer {token}"})
+    finally:
+        query_budget(original_budget)(route.endpoint)
+
+    message = str(exc_info.value)
+    assert "GET /categories executed 2 statements, budget is 1" in message
+    assert "FROM categories" in message
+
+
+async def assert_uses_whole_budget(app, client, method: str, path: str, url: str, extra_chunks: int = 0, **kwargs):
+    route = next(
+        route for route in app.routes if isinstance(route, APIRoute) and route.path == path and method in route.methods
+    )
+    budget = get_query_budget(route.endpoint)
+    per_chunk = getattr(route.endpoint, QUERY_BUDGET_PER_CHUNK_ATTR)
+    get_fx_rate_cache().clear()
+    query_budget(budget - 1, per_chunk)(route.endpoint)
+    try:
+        with pytest.raises(pytest.fail.Exception) as exc_info:
+            await client.request(method, url, **kwargs)
+    finally:
+        query_budget(budget, per_chunk)(route.endpoint)
+    assert f"executed {budget + extra_chunks * per_chunk} statements" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_transaction_write_budgets_are_their_worst_case(
+    app, client, session_maker, register_user, create_category
+):
+    # Worst case: a budget on the category, a threshold crossed, and exchange-rate series not yet cached for either
+    # the old or the new currency. Each write must use its whole budget and not one more.
+    async with session_maker() as session:
+        await load_fx_rates(session, [(date(2026, 1, 1), "EUR", "1.10"), (date(2026, 1, 1), "GBP", "1.30")])
+    auth = await register_user(name="Worst", email="worst-case@example.com", password="Password123")
+    headers = {"Authorization": f"Bearer {auth['tokens']['access_token']}"}
+    travel = await create_category(auth["tokens"]["access_token"], name="Travel", kind="expense", color="#0ea5e9")
+    budget = await client.post(
+        "/budgets", headers=headers, json={"category_id": travel["id"], "period": "monthly", "limit_amount": "10.00"}
+    )
+    assert budget.status_code == 201
+
+    body = {"category_id": travel["id"], "amount": "10.00", "type": "expense", "currency": "EUR", "date": "2026-03-02"}
+    await assert_uses_whole_budget(app, client, "POST", "/transactions", "/transactions", headers=headers, json=body)
+    transaction_id = (await client.get("/transactions", headers=headers)).json()["items"][0]["id"]
+    body.update(currency="GBP", date="2026-04-02")
+    await assert_uses_whole_budget(
+        app,
+        client,
+        "PUT",
+        "/transactions/{transaction_id}",
+        f"/transactions/{transaction_id}",
+        headers=headers,
+        json=body,
+    )
+    await assert_uses_whole_budget(
+        app, client, "DELETE", "/transactions/{transaction_id}", f"/transactions/{transaction_id}", headers=headers
+    )
+
+
+@pytest.mark.asyncio
+async def test_category_move_budget_grows_with_each_committed_chunk(
+    app, client, session_maker, register_user, create_category, create_transaction, monkeypatch
+):
+    # Five transactions in chunks of two commit twice before the final chunk. Every chunk crosses both thresholds of
+    # the target's monthly budget, so each one pays for its spend upsert and its event insert.
+    monkeypatch.setattr(get_settings(), "category_move_chunk_size", 2)
+    async with session_maker() as session:
+        await load_fx_rates(session, [(date(2026, 1, 1), "EUR", "1.10")])
+    auth = await register_user(name="Mover", email="mover@example.com", password="Password123")
+    token = auth["tokens"]["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    source = await create_category(token, name="Old", kind="expense", color="#ef4444")
+    target = await create_category(token, name="New", kind="expense", color="#f97316")
+    budget = await client.post(
+        "/budgets", headers=headers, json={"category_id": target["id"], "period": "monthly", "limit_amount": "10.00"}
+    )
+    assert budget.status_code == 201
+    for day, amount in [
+        ("2026-03-01", "5.00"),
+        ("2026-03-02", "5.00"),
+        ("2026-04-01", "5.00"),
+        ("2026-04-02", "5.00"),
+        ("2026-05-01", "10.00"),
+    ]:
+        body = {"category_id": source["id"], "amount": amount, "type": "expense", "currency": "EUR", "date": day}
+        response = await client.post("/transactions", headers=headers, json=body)
+        assert response.status_code == 201
+
+    await assert_uses_whole_budget(
+        app,
+        client,
+        "POST",
+        "/categories/{category_id}/merge",
+        f"/categories/{source['id']}/merge",
+        extra_chunks=2,
+        headers=headers,
+        json={"target_category_id": target["id"]},
+    )
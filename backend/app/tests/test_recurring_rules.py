@@ -0,0 +1,115 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select, update
+
+from app.models.enums import RecurrenceFrequency, TransactionType
+from app.models.recurring_rule import RecurringRule
+from app.models.transaction import Transaction
+from app.services.recurring_rule_service import materialize_due_occurrences
+
+
+@pytest.mark.asyncio
+async def test_backdated_rule_is_caught_up_on_create(client, session_maker, register_user, create_category):
+    auth = await register_user(name="Recurring", email="recurring@example.com", password="Password123")
+    token = auth["tokens"]["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    groceries = await create_category(token, name="Groceries", kind="expense", color="#f59e0b")
+
+    today = date.today()
+    response = await client.post(
+        "/recurring-rules",
+        headers=headers,
+        json={
+            "category_id": groceries["id"],
+            "amount": "55.00",
+            "type": "expense",
+            "frequency": "weekly",
+            "anchor_date": (today - timedelta(days=14)).isoformat(),
+        },
+    )
+    assert response.status_code == 201
+    rule = response.json()
+    assert rule["materialized_through"] == today.isoformat()
+
+    listed = (await client.get("/transactions", headers=headers)).json()
+    assert listed["pagination"]["total"] == 3
+    assert {item["recurring_rule_id"] for item in listed["items"]} == {rule["id"]}
+
+    async with session_maker() as session:
+        assert await materialize_due_occurrences(session, today) == set()
+
+    mismatched = await client.post(
+        "/recurring-rules",
+        headers=headers,
+        json={**rule, "type": "income", "anchor_date": today.isoformat()},
+    )
+    assert mismatched.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_materialization_clamps_month_ends_and_is_idempotent(session_maker, register_user, create_category):
+    auth = await register_user(name="Rent", email="rent-rule@example.com", password="Password123")
+    rent = await create_category(auth["tokens"]["access_token"], name="Rent", kind="expense", color="#f31260")
+
+    async with session_maker() as session:
+        rule = RecurringRule(
+            user_id=auth["user"]["id"],
+            category_id=rent["id"],
+            amount=Decimal("900.00"),
+            type=TransactionType.EXPENSE,
+            currency="USD",
+            frequency=RecurrenceFrequency.MONTHLY,
+            anchor_date=date(2026, 1, 31),
+            end_date=date(2026, 6, 30),
+        )
+        session.add(rule)
+        await session.commit()
+
+        assert await materialize_due_occurrences(session, date(2026, 3, 15)) == {auth["user"]["id"]}
+        await session.commit()
+        # Catch-up after "downtime" only adds what is missing, and replaying from scratch adds nothing.
+        await materialize_due_occurrences(session, date(2026, 12, 31))
+        await session.execute(update(RecurringRule).values(materialized_through=None))
+        await materialize_due_occurrences(session, date(2026, 12, 31))
+        await session.commit()
+
+        dates = (
+            await session.execute(
+                select(Transaction.date).where(Transaction.recurring_rule_id == rule.id).order_by(Transaction.date)
+            )
+        ).scalars().all()
+
+    assert dates == [
+        date(2026, 1, 31),
+        date(2026, 2, 28),
+        date(2026, 3, 31),
+        date(2026, 4, 30),
+        date(2026, 5, 31),
+        date(2026, 6, 30),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_category_with_a_rule_cannot_be_deleted(client, register_user, create_category):
+    auth = await register_user(name="Ruled", email="ruled-category@example.com", password="Password123")
+    token = auth["tokens"]["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    gym = await create_category(token, name="Gym", kind="expense", color="#8b5cf6")
+    response = await client.post(
+        "/recurring-rules",
+        headers=headers,
+        json={
+            "category_id": gym["id"],
+            "amount": "30.00",
+            "type": "expense",
+            "frequency": "monthly",
+            "anchor_date": (date.today() + timedelta(days=10)).isoformat(),
+        },
+    )
+    assert response.status_code == 201
+
+    response = await client.delete(f"/categories/{gym['id']}", headers=headers)
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Cannot delete category with existing recurring rules"
@@ -0,0 +1,57 @@
+import pytest
+
+from app.core.revocation import get_revocation_list
+from app.services.token_service import load_revocations
+
+
+@pytest.mark.asyncio
+async def test_refresh_rotation_detects_reuse_and_revokes_family(client, register_user):
+    auth = await register_user(name="Rotator", email="rotate@example.com", password="Password123")
+    first = auth["tokens"]
+
+    response = await client.post("/auth/refresh", json={"refresh_token": first["refresh_token"]})
+    assert response.status_code == 200
+    second = response.json()
+    assert second["refresh_token"] != first["refresh_token"]
+    response = await client.get("/categories", headers={"Authorization": f"Bearer {second['access_token']}"})
+    assert response.status_code == 200
+
+    response = await client.post("/auth/refresh", json={"refresh_token": first["refresh_token"]})
+    assert response.status_code == 401
+
+    response = await client.post("/auth/refresh", json={"refresh_token": second["refresh_token"]})
+    assert response.status_code == 401
+    for token in (first["access_token"], second["access_token"]):
+        response = await client.get("/categories", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 401
+
+    response = await client.post("/auth/login", json={"email": "rotate@example.com", "password": "Password123"})
+    assert response.status_code == 200
+    fresh = response.json()["tokens"]
+    response = await client.get("/categories", headers={"Authorization": f"Bearer {fresh['access_token']}"})
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_logout_revokes_only_that_session_and_survives_restart(client, session_maker, register_user):
+    auth = await register_user(name="Leaver", email="leave@example.com", password="Password123")
+    tokens = auth["tokens"]
+    response = await client.post("/auth/login", json={"email": "leave@example.com", "password": "Password123"})
+    other = response.json()["tokens"]
+
+    response = await client.post("/auth/logout", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 204
+    response = await client.get("/categories", headers={"Authorization": f"Bearer {tokens['access_token']}"})
+    assert response.status_code == 401
+    response = await client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 401
+    response = await client.get("/categories", headers={"Authorization": f"Bearer {other['access_token']}"})
+    assert response.status_code == 200
+
+    get_revocation_list().clear()
+    async with session_maker() as session:
+        assert await load_revocations(session) == 1
+    response = await client.get("/categories", headers={"Authorization": f"Bearer {tokens['access_token']}"})
+    assert response.status_code == 401
+    response = await client.post("/auth/refresh", json={"refresh_token": "not-a-token"})
+    assert response.status_code == 401
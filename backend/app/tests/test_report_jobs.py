@@ -0,0 +1,79 @@
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+
+from app.services.report_job_service import get_report_jobs
+
+
+@pytest_asyncio.fixture
+async def report_jobs(session_maker):
+    queue = get_report_jobs()
+    original_factory = queue.session_factory
+    queue.session_factory = lambda: session_maker
+    yield queue
+    await queue.stop()
+    queue.session_factory = original_factory
+
+
+async def _wait_for_job(client, headers, job_id: str) -> dict:
+    for _ in range(100):
+        job = (await client.get(f"/reports/jobs/{job_id}", headers=headers)).json()
+        if job["status"] in ("succeeded", "failed"):
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError("report job did not finish")
+
+
+@pytest.mark.asyncio
+async def test_report_jobs_run_in_background_cache_results_and_invalidate_on_writes(
+    client, report_jobs, register_user, create_category, create_transaction
+):
+    auth = await register_user(name="Jobs", email="jobs@example.com", password="Password123")
+    other = await register_user(name="Other", email="other-jobs@example.com", password="Password123")
+    headers = {"Authorization": f"Bearer {auth['tokens']['access_token']}"}
+    token = auth["tokens"]["access_token"]
+
+    rent = await create_category(token, name="Rent", kind="expense", color="#f31260")
+    await create_transaction(token, category_id=rent["id"], amount="800.00", kind="expense", tx_date=date(2026, 1, 7))
+
+    submitted = await client.post(
+        "/reports/jobs",
+        headers=headers,
+        json={"kind": "by_category", "type": "expense", "priority": "high"},
+    )
+    assert submitted.status_code == 202
+    job_id = submitted.json()["id"]
+
+    job = await _wait_for_job(client, headers, job_id)
+    assert job["status"] == "succeeded"
+    assert Decimal(job["result"]["total"]) == Decimal("800.00")
+
+    repeat = await client.post("/reports/jobs", headers=headers, json={"kind": "by_category", "type": "expense"})
+    assert repeat.json()["id"] == job_id
+    assert repeat.json()["status"] == "succeeded"
+
+    async with client.stream("GET", f"/reports/jobs/{job_id}/events", headers=headers) as stream:
+        body = "".join([chunk async for chunk in stream.aiter_text()])
+    assert "event: status" in body and '"succeeded"' in body
+
+    other_lookup = await client.get(
+        f"/reports/jobs/{job_id}",
+        headers={"Authorization": f"Bearer {other['tokens']['access_token']}"},
+    )
+    assert other_lookup.status_code == 404
+
+    await create_transaction(token, category_id=rent["id"], amount="50.00", kind="expense", tx_date=date(2026, 1, 9))
+    refreshed = await client.post("/reports/jobs", headers=headers, json={"kind": "by_category", "type": "expense"})
+    assert refreshed.json()["id"] != job_id
+    job = await _wait_for_job(client, headers, refreshed.json()["id"])
+    assert Decimal(job["result"]["total"]) == Decimal("850.00")
+
+    invalid = await client.post(
+        "/reports/jobs",
+        headers=headers,
+        json={"kind": "summary", "start_date": "2026-02-01", "end_date": "2026-01-01"},
+    )
+    assert invalid.status_code == 400
@@ -0,0 +1,232 @@
+import asyncio
+import os
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import delete, func, select, update
+
+from app.core import database
+from app.core.database import ShardRouter
+from app.core.config import get_settings
+from app.core.dependencies import fence_user_writes
+from app.models.anomaly import CategoryAmountStats
+from app.models.base import Base
+from app.models.category import Category
+from app.models.enums import TransactionType
+from app.models.forecast import CashFlowForecast
+from app.models.recurring_rule import RecurringRule
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.services import shard_service
+from app.services.anomaly_service import refresh_category_amount_stats
+from app.services.forecast_service import store_forecasts_for_all_users
+from app.services.fx_service import load_fx_rates, to_base_currency
+from app.services.recurring_rule_service import run_recurring_scheduler
+from app.services.shard_service import move_user
+
+SHARD_FILES = {"east": "test_shard_east.db", "west": "test_shard_west.db"}
+
+
+@pytest_asyncio.fixture
+async def shard_router():
+    router = ShardRouter(
+        {name: f"sqlite+aiosqlite:///./{path}" for name, path in SHARD_FILES.items()},
+        new_user_shards=["east"],
+    )
+    for shard in router.urls:
+        async with router.engine(shard).begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    database._shard_router = router
+    yield router
+    database._shard_router = None
+    await router.dispose()
+    for path in SHARD_FILES.values():
+        if os.path.exists(path):
+            os.remove(path)
+
+
+async def _transaction_count(session_factory, user_id: int) -> int:
+    async with session_factory() as session:
+        return await session.scalar(select(func.count()).select_from(Transaction).where(Transaction.user_id == user_id))
+
+
+@pytest.mark.asyncio
+async def test_user_data_is_routed_to_its_shard_and_can_be_moved(
+    client, session_maker, shard_router, register_user, create_category, create_transaction
+):
+    auth = await register_user(name="Sharded", email="sharded@example.com", password="Password123")
+    user_id = auth["user"]["id"]
+    token = auth["tokens"]["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    food = await create_category(token, name="Food", kind="expense", color="#f97316")
+    for amount in ("10.00", "20.00"):
+        await create_transaction(token, category_id=food["id"], amount=amount, kind="expense", tx_date=date(2026, 3, 1))
+
+    east, west = shard_router.session_factory("east"), shard_router.session_factory("west")
+    async with session_maker() as session:
+        assert (await session.get(User, user_id)).shard == "east"
+    assert await _transaction_count(east, user_id) == 2
+    assert await _transaction_count(session_maker, user_id) == 0
+
+    copied = await move_user(session_maker, shard_router, user_id, "west")
+    assert copied["categories"] == 1 and copied["transactions"] == 2
+    assert await _transaction_count(east, user_id) == 0
+    assert await _transaction_count(west, user_id) == 2
+
+    response = await client.get("/transactions", headers=headers)
+    assert response.status_code == 200
+    assert sorted(item["amount"] for item in response.json()["items"]) == ["10.00", "20.00"]
+    assert {item["category"]["name"] for item in response.json()["items"]} == {"Food"}
+
+    await move_user(session_maker, shard_router, user_id, None)
+    assert await _transaction_count(west, user_id) == 0
+    assert await _transaction_count(session_maker, user_id) == 2
+    response = await client.get("/reports/summary", headers=headers)
+    assert response.json()["expenses"] == "30.00"
+
+    async with session_maker() as session:
+        user = await session.get(User, user_id)
+        user.shard_moving = True
+        await session.commit()
+    response = await client.get("/transactions", headers=headers)
+    assert response.status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_failed_move_leaves_no_copies_and_writes_are_fenced(
+    client, session_maker, shard_router, register_user, create_category, create_transaction, monkeypatch
+):
+    auth = await register_user(name="Fenced", email="fenced@example.com", password="Password123")
+    user_id = auth["user"]["id"]
+    token = auth["tokens"]["access_token"]
+    food = await create_category(token, name="Food", kind="expense", color="#f97316")
+    for amount in ("10.00", "20.00"):
+        await create_transaction(token, category_id=food["id"], amount=amount, kind="expense", tx_date=date(2026, 3, 1))
+    east, west = shard_router.session_factory("east"), shard_router.session_factory("west")
+
+    # A mover that died after committing its copy left rows on the target.
+    await shard_service.ensure_shard_user(west, "west", user_id, "Fenced", "fenced@example.com")
+    async with east() as source, west() as target:
+        await shard_service._copy_user_rows(source, target, user_id)
+        await target.commit()
+    assert await _transaction_count(west, user_id) == 2
+
+    copy_user_rows = shard_service._copy_user_rows
+
+    async def failing_copy(source, target, user_id):
+        await copy_user_rows(source, target, user_id)
+        await target.commit()
+        raise ConnectionError("target went away")
+
+    monkeypatch.setattr(shard_service, "_copy_user_rows", failing_copy)
+    with pytest.raises(ConnectionError):
+        await move_user(session_maker, shard_router, user_id, "west")
+    assert await _transaction_count(west, user_id) == 0
+    async with west() as session:
+        assert await session.get(User, user_id) is None
+    for factory in (session_maker, east):
+        async with factory() as session:
+            assert (await session.get(User, user_id)).shard_moving is False
+
+    monkeypatch.setattr(shard_service, "_copy_user_rows", copy_user_rows)
+    # A request that passed the moving check before the move started cannot commit once the flag is set.
+    async with east() as session:
+        fence_user_writes(session, [user_id])
+        session.add(Category(user_id=user_id, name="Late", type=TransactionType.EXPENSE, color="#000000"))
+        assert await shard_service._set_moving(east, user_id, "east", True)
+        with pytest.raises(HTTPException) as refused:
+            await session.commit()
+    assert refused.value.status_code == 503
+    assert await shard_service._set_moving(east, user_id, "east", False)
+
+    await move_user(session_maker, shard_router, user_id, "west")
+    assert await _transaction_count(west, user_id) == 2
+    assert await _transaction_count(east, user_id) == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_leaves_a_moving_user_alone(
+    client, session_maker, shard_router, register_user, create_category, monkeypatch
+):
+    auth = await register_user(name="Scheduled", email="scheduled@example.com", password="Password123")
+    user_id = auth["user"]["id"]
+    token = auth["tokens"]["access_token"]
+    rent = await create_category(token, name="Rent", kind="expense", color="#ef4444")
+    response = await client.post(
+        "/recurring-rules",
+        headers={"Authorization": f"Bearer {token}"},
+        json={
+            "category_id": rent["id"],
+            "amount": "500.00",
+            "type": "expense",
+            "frequency": "weekly",
+            "anchor_date": (date.today() - timedelta(days=14)).isoformat(),
+        },
+    )
+    assert response.status_code == 201
+    east, west = shard_router.session_factory("east"), shard_router.session_factory("west")
+    # Rewind the rule so the schedulers have three occurrences to materialize once they start.
+    async with east() as session:
+        await session.execute(delete(Transaction).where(Transaction.user_id == user_id))
+        await session.execute(update(RecurringRule).values(materialized_through=None))
+        await session.commit()
+
+    monkeypatch.setattr(get_settings(), "recurring_scheduler_interval_seconds", 0)
+    schedulers: list[asyncio.Task] = []
+    copy_user_rows = shard_service._copy_user_rows
+
+    async def copy_while_schedulers_run(source, target, user_id):
+        copied = await copy_user_rows(source, target, user_id)
+        schedulers.extend(asyncio.create_task(run_recurring_scheduler(factory)) for factory in (east, west))
+        await asyncio.sleep(0.2)
+        # Anything the scheduler wrote to the source now would be deleted with the source rows after the switch.
+        assert await _transaction_count(east, user_id) == 0
+        return copied
+
+    monkeypatch.setattr(shard_service, "_copy_user_rows", copy_while_schedulers_run)
+    try:
+        await move_user(session_maker, shard_router, user_id, "west")
+        for _ in range(50):
+            if await _transaction_count(west, user_id) == 3:
+                break
+            await asyncio.sleep(0.05)
+    finally:
+        for task in schedulers:
+            task.cancel()
+        await asyncio.gather(*schedulers, return_exceptions=True)
+    assert await _transaction_count(west, user_id) == 3
+    assert await _transaction_count(east, user_id) == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_jobs_run_on_the_database_that_holds_each_user(
+    session_maker, shard_router, register_user, create_category, create_transaction
+):
+    auth = await register_user(name="Batched", email="batched@example.com", password="Password123")
+    user_id = auth["user"]["id"]
+    token = auth["tokens"]["access_token"]
+    food = await create_category(token, name="Food", kind="expense", color="#f97316")
+    await create_transaction(token, category_id=food["id"], amount="10.00", kind="expense", tx_date=date.today())
+    east = shard_router.session_factory("east")
+
+    async with session_maker() as session:
+        assert await store_forecasts_for_all_users(session) == 0
+        assert await refresh_category_amount_stats(session) == 0
+    async with east() as session:
+        assert await store_forecasts_for_all_users(session, shard="east") == 1
+        assert await refresh_category_amount_stats(session, shard="east") == 1
+        assert await session.scalar(select(CashFlowForecast.user_id)) == user_id
+        assert await session.scalar(select(CategoryAmountStats.sample_size)) == 1
+
+
+@pytest.mark.asyncio
+async def test_exchange_rates_are_cached_per_database(session_maker, shard_router):
+    async with session_maker() as session:
+        await load_fx_rates(session, [(date(2026, 3, 1), "EUR", "1.10")])
+        assert await to_base_currency(session, Decimal("10.00"), "EUR", date(2026, 3, 2)) == Decimal("11.00")
+
+    async with shard_router.session_factory("east")() as session:
+        assert await to_base_currency(session, Decimal("10.00"), "EUR", date(2026, 3, 2)) is None
@@ -0,0 +1,71 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import get_settings
+from app.core.slow_queries import _explain_prefix, slow_query_log
+
+
+@pytest.fixture
+def capture_all_queries(engine):
+    previous = (slow_query_log.threshold_ms, slow_query_log.records.maxlen, slow_query_log.explain)
+    slow_query_log.configure(threshold_ms=0, capacity=50, explain=True)
+    slow_query_log.clear()
+    slow_query_log.install(engine)
+    yield slow_query_log
+    slow_query_log.uninstall(engine)
+    slow_query_log.configure(*previous)
+    slow_query_log.clear()
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_are_recorded_with_endpoint_and_plan_for_admins_only(
+    client, register_user, capture_all_queries, monkeypatch, tmp_path
+):
+    admin = await register_user(name="Admin", email="admin@example.com", password="Password123")
+    member = await register_user(name="Member", email="member@example.com", password="Password123")
+    monkeypatch.setattr(get_settings(), "admin_emails", "admin@example.com")
+
+    forbidden = await client.get(
+        "/debug/slow-queries",
+        headers={"Authorization": f"Bearer {member['tokens']['access_token']}"},
+    )
+    assert forbidden.status_code == 403
+
+    admin_headers = {"Authorization": f"Bearer {admin['tokens']['access_token']}"}
+    assert (await client.get("/reports/summary", headers=admin_headers)).status_code == 200
+    await capture_all_queries.wait_for_explains()
+
+    response = await client.get("/debug/slow-queries", headers=admin_headers)
+    assert response.status_code == 200
+    items = response.json()["items"]
+    report_query = next(item for item in items if item["endpoint"] == "GET /reports/summary" and "sum" in item["statement"])
+    assert report_query["plan"]
+    assert report_query["explain_error"] is None
+
+    jsonl = await client.get("/debug/slow-queries.jsonl", headers=admin_headers)
+    assert jsonl.headers["content-type"] == "application/x-ndjson"
+    assert all(json.loads(line)["statement"] for line in jsonl.text.splitlines())
+
+    dump_path = tmp_path / "slow.jsonl"
+    assert capture_all_queries.dump_jsonl(dump_path) == len(capture_all_queries.snapshot())
+
+
+@pytest.mark.parametrize(
+    ("statement", "analyzed"),
+    [
+        ("SELECT id FROM transactions WHERE user_id = $1", True),
+        ("WITH recent AS (SELECT id FROM transactions) SELECT count(*) FROM recent", True),
+        ("SELECT id, updated_at FROM users", True),
+        ("WITH moved AS (UPDATE transactions SET category_id = $1 RETURNING id) SELECT count(*) FROM moved", False),
+        ("WITH rows AS (SELECT 1) INSERT INTO fx_rates SELECT * FROM rows", False),
+        ("SELECT id FROM report_jobs ORDER BY id LIMIT 1 FOR UPDATE SKIP LOCKED", False),
+        ("SELECT shard_moving FROM users WHERE id = $1 FOR SHARE", False),
+        ("SELECT * INTO scratch FROM transactions", False),
+        ("UPDATE users SET name = $1", False),
+    ],
+)
+def test_only_plain_selects_are_explained_with_analyze(statement, analyzed):
+    engine = SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+    assert _explain_prefix(engine, statement).startswith("EXPLAIN (ANALYZE") is analyzed
@@ -0,0 +1,92 @@
+import asyncio
+from datetime import date
+
+import pytest
+from sqlalchemy import insert, select, text
+from sqlalchemy.dialects import postgresql
+
+from app.core.config import get_settings
+from app.core.sql import month_trunc
+from app.models.category import Category
+from app.models.enums import TransactionType
+from app.models.transaction import Transaction
+from app.models.user import User
+
+
+@pytest.mark.asyncio
+async def test_monthly_report_buckets_natively_and_pragmas_apply(
+    client, engine, register_user, create_category, create_transaction
+):
+    auth = await register_user(name="Monthly", email="monthly@example.com", password="Password123")
+    token = auth["tokens"]["access_token"]
+    food = await create_category(token, name="Food", kind="expense", color="#f97316")
+    salary = await create_category(token, name="Salary", kind="income", color="#22c55e")
+    for category, kind, amount, tx_date in (
+        (food, "expense", "10.00", date(2026, 1, 31)),
+        (food, "expense", "5.50", date(2026, 1, 1)),
+        (salary, "income", "100.00", date(2026, 3, 15)),
+    ):
+        await create_transaction(token, category_id=category["id"], amount=amount, kind=kind, tx_date=tx_date)
+
+    response = await client.get("/reports/monthly", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert [(item["month"], item["income"], item["expenses"]) for item in response.json()["items"]] == [
+        ("2026-01-01", "0.00", "15.50"),
+        ("2026-03-01", "100.00", "0.00"),
+    ]
+
+    async with engine.connect() as conn:
+        assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+        assert (await conn.execute(text("PRAGMA foreign_keys"))).scalar() == 1
+    compiled = str(month_trunc(Transaction.date).compile(dialect=postgresql.dialect()))
+    assert compiled == "CAST(date_trunc('month', transactions.date) AS DATE)"
+
+
+@pytest.mark.asyncio
+async def test_writers_queue_while_readers_proceed(session_maker):
+    async with session_maker() as session:
+        user = User(name="Writer", email="writer@example.com", hashed_password="x")
+        session.add(user)
+        await session.commit()
+        user_id = user.id
+
+    active = 0
+    peak = 0
+
+    async def write(index: int) -> None:
+        nonlocal active, peak
+        async with session_maker() as session:
+            # Without busy_timeout, any writer that reached SQLite while another held the lock would fail outright.
+            await session.execute(text("PRAGMA busy_timeout=0"))
+            try:
+                await session.execute(select(User.id).where(User.id == user_id))
+                await session.execute(
+                    insert(Category).values(
+                        user_id=user_id, name=f"Category {index}", type=TransactionType.EXPENSE, color="#000000"
+                    )
+                )
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                await session.commit()
+            finally:
+                await session.execute(text(f"PRAGMA busy_timeout={get_settings().sqlite_busy_timeout_ms}"))
+
+    async with session_maker() as holder:
+        holder.add(Category(user_id=user_id, name="Held", type=TransactionType.EXPENSE, color="#000000"))
+        await holder.flush()
+        writers = asyncio.gather(*(write(index) for index in range(12)))
+        async with session_maker() as reader:
+            count = await asyncio.wait_for(
+                reader.scalar(select(User.id).where(User.id == user_id)),
+                timeout=1,
+            )
+        assert count == user_id
+        await holder.commit()
+    await writers
+
+    assert peak == 1
+    async with session_maker() as session:
+        names = (await session.execute(select(Category.name).where(Category.user_id == user_id))).scalars().all()
+    assert len(names) == 13
@@ -0,0 +1,55 @@
+from datetime import date
+
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from app.services.report_service import transaction_filter_params
+from app.services.transaction_service import _list_statements
+
+
+@pytest.mark.asyncio
+async def test_filtered_reads_reuse_one_statement_per_filter_combination(
+    client, register_user, create_category, create_transaction
+):
+    auth = await register_user(name="Cached", email="cached@example.com", password="Password123")
+    token = auth["tokens"]["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    food = await create_category(token, name="Food", kind="expense", color="#f97316")
+    rent = await create_category(token, name="Rent", kind="expense", color="#ef4444")
+    salary = await create_category(token, name="Salary", kind="income", color="#22c55e")
+    for category, kind, amount, tx_date in (
+        (food, "expense", "12.00", date(2026, 1, 3)),
+        (food, "expense", "8.00", date(2026, 2, 3)),
+        (rent, "expense", "700.00", date(2026, 2, 1)),
+        (salary, "income", "2000.00", date(2026, 2, 5)),
+    ):
+        await create_transaction(token, category_id=category["id"], amount=amount, kind=kind, tx_date=tx_date)
+
+    params = {"type": "expense", "start_date": "2026-02-01", "page_size": 1}
+    first = (await client.get("/transactions", params=params, headers=headers)).json()
+    second = (await client.get("/transactions", params={**params, "page": 2}, headers=headers)).json()
+    assert first["pagination"]["total"] == 2
+    assert {first["items"][0]["amount"], second["items"][0]["amount"]} == {"8.00", "700.00"}
+    response = await client.get("/transactions", params={"category_id": food["id"]}, headers=headers)
+    assert [item["amount"] for item in response.json()["items"]] == ["8.00", "12.00"]
+    assert _list_statements.cache_info().hits >= 1
+
+    response = await client.get(
+        "/reports/by-category", params={"type": "expense", "start_date": "2026-02-01"}, headers=headers
+    )
+    assert [(item["category_name"], item["total"]) for item in response.json()["items"]] == [
+        ("Rent", "700.00"),
+        ("Food", "8.00"),
+    ]
+    response = await client.get("/reports/summary", params={"end_date": "2026-01-31"}, headers=headers)
+    assert (response.json()["income"], response.json()["expenses"]) == ("0.00", "12.00")
+
+    # asyncpg keys its per-connection prepared statements by SQL text, so equal text means the statement is
+    # prepared once per connection and reused from then on.
+    dialect = asyncpg.dialect()
+    compiled = {
+        str(statement.compile(dialect=dialect))
+        for user_id, start_date in ((1, date(2026, 1, 1)), (2, date(2025, 6, 1)))
+        for statement in _list_statements(frozenset(transaction_filter_params(user_id, start_date=start_date)))[1:]
+    }
+    assert len(compiled) == 1
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.core.tracing import Tracer, TracingMiddleware
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+@pytest.mark.asyncio
+async def test_sampled_requests_export_spans_for_auth_statements_and_encoding(
+    app, client, engine, register_user, tmp_path
+):
+    auth = await register_user(name="Traced", email="traced@example.com", password="Password123")
+    headers = {"Authorization": f"Bearer {auth['tokens']['access_token']}"}
+    tracer = Tracer()
+    path = tmp_path / "traces.jsonl"
+    tracer.configure(sample_rate=0.0, path=path, max_bytes=1024 * 1024, backup_count=1)
+    tracer.install(engine)
+    try:
+        transport = ASGITransport(app=TracingMiddleware(app, tracer))
+        async with AsyncClient(transport=transport, base_url="http://testserver") as traced_client:
+            response = await traced_client.get("/reports/summary", headers=headers)
+            assert response.status_code == 200
+            assert "traceresponse" not in response.headers
+
+            response = await traced_client.get(
+                "/reports/summary", headers={**headers, "traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"}
+            )
+            assert response.status_code == 200
+            assert response.headers["traceresponse"].startswith(f"00-{TRACE_ID}-")
+    finally:
+        tracer.uninstall(engine)
+        tracer.stop()
+
+    spans = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert {item["traceId"] for item in spans} == {TRACE_ID}
+    by_name = {item["name"]: item for item in spans}
+    root = by_name["GET /reports/summary"]
+    assert root["parentSpanId"] == PARENT_ID
+    assert root["attributes"]["http.status_code"] == 200
+    assert by_name["request.resolve"]["parentSpanId"] == root["spanId"]
+    assert by_name["auth.get_current_user"]["parentSpanId"] == by_name["request.resolve"]["spanId"]
+    assert by_name["auth.decode_token"]["parentSpanId"] == by_name["auth.get_current_user"]["spanId"]
+    assert by_name["endpoint"]["attributes"]["code.function"] == "summary_report_endpoint"
+    assert by_name["response.encode"]["startTimeUnixNano"] == by_name["endpoint"]["endTimeUnixNano"]
+
+    statements = [item for item in spans if item["name"] == "db.statement"]
+    parents = {item["parentSpanId"] for item in statements}
+    assert parents == {by_name["auth.get_current_user"]["spanId"], by_name["endpoint"]["spanId"]}
+    assert any("sum" in item["attributes"]["db.statement"].lower() for item in statements)
+    for item in spans:
+        assert item["startTimeUnixNano"] <= item["endTimeUnixNano"]
@@ -0,0 +1,116 @@
+from datetime import date
+from decimal import Decimal
+from io import BytesIO
+
+import pyarrow as pa
+import pyarrow.ipc
+import pyarrow.parquet as pq
+import pytest
+
+from app.core.config import get_settings
+from app.models.transaction import Transaction
+from app.services.export_service import ExportFormat, load_category_dictionary, stream_transaction_export
+
+
+@pytest.mark.asyncio
+async def test_export_parquet_and_arrow_stream_with_filters(
+    client, register_user, create_category, create_transaction, monkeypatch
+):
+    monkeypatch.setattr(get_settings(), "export_batch_rows", 2)
+    auth = await register_user(name="Exporter", email="export@example.com", password="Password123")
+    token = auth["tokens"]["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    food = await create_category(token, name="Food", kind="expense", color="#f97316")
+    salary = await create_category(token, name="Salary", kind="income", color="#22c55e")
+
+    for amount, category, kind, tx_date, note in (
+        ("12.50", food, "expense", date(2026, 3, 1), "Lunch"),
+        ("3000.00", salary, "income", date(2026, 3, 2), None),
+        ("40.10", food, "expense", date(2026, 3, 3), None),
+        ("9.99", food, "expense", date(2026, 4, 1), "Snack"),
+        ("7.00", food, "expense", date(2026, 4, 2), None),
+    ):
+        await create_transaction(
+            token, category_id=category["id"], amount=amount, kind=kind, tx_date=tx_date, note=note
+        )
+
+    response = await client.get("/transactions/export.parquet", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.parquet"
+    parquet = pq.ParquetFile(BytesIO(response.content))
+    assert parquet.metadata.num_row_groups == 3
+    table = parquet.read()
+    assert table.num_rows == 5
+    assert pa.types.is_dictionary(table.schema.field("category").type)
+    assert pa.types.is_dictionary(table.schema.field("type").type)
+    rows = table.to_pylist()
+    assert [row["date"] for row in rows] == sorted(row["date"] for row in rows)
+    assert rows[0]["category"] == "Food"
+    assert rows[0]["type"] == "expense"
+    assert rows[0]["amount"] == Decimal("12.50")
+    assert rows[0]["note"] == "Lunch"
+    assert rows[1]["category"] == "Salary"
+
+    response = await client.get(
+        "/transactions/export.arrows",
+        headers=headers,
+        params={"type": "expense", "start_date": "2026-03-02", "end_date": "2026-04-30"},
+    )
+    assert response.status_code == 200
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.column("amount").to_pylist() == [Decimal("40.10"), Decimal("9.99"), Decimal("7.00")]
+    assert set(table.column("category").to_pylist()) == {"Food"}
+
+
+@pytest.mark.asyncio
+async def test_export_of_empty_ledger_and_invalid_range(client, register_user):
+    auth = await register_user(name="Empty", email="empty-export@example.com", password="Password123")
+    headers = {"Authorization": f"Bearer {auth['tokens']['access_token']}"}
+
+    response = await client.get("/transactions/export.parquet", headers=headers)
+    assert response.status_code == 200
+    table = pq.read_table(BytesIO(response.content))
+    assert table.num_rows == 0
+    assert "category" in table.column_names
+
+    response = await client.get(
+        "/transactions/export.arrows",
+        headers=headers,
+        params={"start_date": "2026-05-01", "end_date": "2026-04-01"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_export_appends_categories_created_after_the_dictionary_was_loaded(
+    session_maker, register_user, create_category, create_transaction, monkeypatch
+):
+    monkeypatch.setattr(get_settings(), "export_batch_rows", 1)
+    auth = await register_user(name="Exporter", email="export-late@example.com", password="Password123")
+    token = auth["tokens"]["access_token"]
+    food = await create_category(token, name="Food", kind="expense", color="#f97316")
+    async with session_maker() as session:
+        category_index, category_names = await load_category_dictionary(session, auth["user"]["id"])
+    travel = await create_category(token, name="Travel", kind="expense", color="#0ea5e9")
+    for day, category in ((1, food), (2, travel), (3, food)):
+        await create_transaction(
+            token, category_id=category["id"], amount="5.00", kind="expense", tx_date=date(2026, 3, day)
+        )
+
+    for export_format in ExportFormat:
+        chunks = [
+            chunk
+            async for chunk in stream_transaction_export(
+                session_maker,
+                export_format,
+                [Transaction.user_id == auth["user"]["id"]],
+                dict(category_index),
+                list(category_names),
+            )
+        ]
+        content = b"".join(chunks)
+        if export_format == ExportFormat.PARQUET:
+            table = pq.read_table(BytesIO(content))
+        else:
+            table = pa.ipc.open_stream(content).read_all()
+        assert table.column("category").to_pylist() == ["Food", "Travel", "Food"]
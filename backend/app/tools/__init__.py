@@ -0,0 +1 @@
+# Marker file for tools package.
\ No newline at end of file
@@ -0,0 +1,32 @@
+import argparse
+import asyncio
+import time
+
+from app.core.database import dispose_engine, get_shard_router
+from app.services.anomaly_service import refresh_category_amount_stats
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.tools.compute_anomaly_stats",
+        description="Recompute per-category median/MAD amount statistics used to flag unusual transactions.",
+    )
+    parser.add_argument("--chunk-size", type=int, help="Users per pass. Defaults to ANOMALY_STATS_CHUNK_SIZE.")
+    return parser.parse_args()
+
+
+async def main() -> None:
+    args = parse_args()
+    started = time.perf_counter()
+    stored = 0
+    try:
+        for shard, session_factory in get_shard_router().session_factories():
+            async with session_factory() as session:
+                stored += await refresh_category_amount_stats(session, chunk_size=args.chunk_size, shard=shard)
+    finally:
+        await dispose_engine()
+    print(f"stored stats for {stored} categories in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,32 @@
+import argparse
+import asyncio
+import time
+
+from app.core.database import dispose_engine, get_shard_router
+from app.services.forecast_service import store_forecasts_for_all_users
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.tools.forecast_users",
+        description="Forecast cash flow for every user into cash_flow_forecasts (run nightly).",
+    )
+    parser.add_argument("--chunk-size", type=int, help="Users per pass. Defaults to FORECAST_BATCH_CHUNK_SIZE.")
+    return parser.parse_args()
+
+
+async def main() -> None:
+    args = parse_args()
+    started = time.perf_counter()
+    stored = 0
+    try:
+        for shard, session_factory in get_shard_router().session_factories():
+            async with session_factory() as session:
+                stored += await store_forecasts_for_all_users(session, chunk_size=args.chunk_size, shard=shard)
+    finally:
+        await dispose_engine()
+    print(f"forecast {stored} users in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,298 @@
+import argparse
+import asyncio
+import calendar
+import random
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from itertools import accumulate
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+
+from app.models.base import Base
+from app.models.category import Category
+from app.models.transaction import Transaction
+from app.models.user import User
+
+TRANSACTION_COLUMNS = ("user_id", "category_id", "amount", "type", "currency", "note", "date", "created_at")
+FLAT = (1.0,) * 12
+
+
+@dataclass(frozen=True)
+class CategorySpec:
+    name: str
+    type: str
+    color: str
+    monthly_rate: float
+    mu: float
+    sigma: float
+    seasonality: tuple[float, ...]
+    notes: tuple[str | None, ...]
+
+
+CORE_CATEGORIES = (
+    CategorySpec("Salary", "income", "#17c964", 1.0, 8.2, 0.05, FLAT, ("Monthly salary", "Payroll")),
+    CategorySpec("Rent", "expense", "#f31260", 1.0, 7.2, 0.02, FLAT, ("Apartment rent", "Rent")),
+    CategorySpec(
+        "Groceries", "expense", "#f59e0b", 7.0, 3.9, 0.6,
+        (1.0, 0.95, 1.0, 1.0, 1.0, 1.0, 1.05, 1.05, 1.0, 1.0, 1.1, 1.3),
+        ("Weekly groceries", "Supermarket refill", "Farmers market", "Bakery", None),
+    ),
+    CategorySpec("Transport", "expense", "#8b5cf6", 8.0, 2.8, 0.7, FLAT, ("Metro", "Taxi", "Fuel", "Bus pass", None)),
+    CategorySpec(
+        "Utilities", "expense", "#3b82f6", 2.0, 4.6, 0.3,
+        (1.5, 1.45, 1.2, 0.9, 0.75, 0.8, 0.9, 0.9, 0.8, 0.95, 1.2, 1.45),
+        ("Electricity", "Gas", "Water", "Internet"),
+    ),
+)
+
+OPTIONAL_CATEGORIES = (
+    CategorySpec("Freelance", "income", "#06b6d4", 0.8, 6.3, 0.7, FLAT, ("Landing page project", "Consulting", "Design revisions")),
+    CategorySpec("Interest", "income", "#14b8a6", 1.0, 2.5, 0.8, FLAT, ("Savings interest",)),
+    CategorySpec(
+        "Dining", "expense", "#ef4444", 4.0, 3.3, 0.6,
+        (0.85, 0.85, 0.95, 1.0, 1.05, 1.15, 1.2, 1.15, 1.0, 0.95, 0.95, 1.3),
+        ("Lunch", "Dinner out", "Coffee", "Takeaway", None),
+    ),
+    CategorySpec("Entertainment", "expense", "#ec4899", 2.5, 3.2, 0.7, FLAT, ("Cinema", "Concert", "Streaming", "Games")),
+    CategorySpec(
+        "Travel", "expense", "#0ea5e9", 0.4, 6.0, 0.8,
+        (0.4, 0.4, 0.7, 0.9, 1.1, 1.9, 2.6, 2.4, 1.0, 0.7, 0.4, 1.1),
+        ("Flights", "Hotel", "Train tickets", "Car rental"),
+    ),
+    CategorySpec(
+        "Shopping", "expense", "#a855f7", 2.0, 3.9, 0.9,
+        (1.2, 0.7, 0.8, 0.9, 0.9, 0.9, 1.0, 1.1, 1.0, 0.9, 1.6, 2.2),
+        ("Clothes", "Electronics", "Home goods", None),
+    ),
+    CategorySpec("Health", "expense", "#22c55e", 0.7, 4.0, 0.8, FLAT, ("Pharmacy", "Doctor visit", "Gym membership")),
+    CategorySpec(
+        "Gifts", "expense", "#f97316", 0.25, 4.2, 0.7,
+        (0.3, 0.8, 0.4, 0.4, 0.8, 0.6, 0.5, 0.5, 0.6, 0.7, 1.2, 5.0),
+        ("Birthday gift", "Holiday gifts", "Wedding gift"),
+    ),
+)
+
+
+@dataclass(frozen=True)
+class GenerateOptions:
+    users: int
+    transactions_per_user: int
+    years: int = 3
+    seed: int = 42
+    chunk_size: int = 10_000
+    user_batch_size: int = 200
+    email_domain: str = "gen.pftracker.app"
+    password_hash: str = "!"
+    end_date: date | None = None
+    currency: str = "USD"
+
+
+@dataclass
+class GenerateStats:
+    users: int = 0
+    categories: int = 0
+    transactions: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_minute(self) -> float:
+        return (self.users + self.categories + self.transactions) / self.seconds * 60 if self.seconds else 0.0
+
+
+class MonthCalendar:
+    def __init__(self, end_date: date, years: int) -> None:
+        self.months: list[tuple[int, int, int]] = []
+        year, month = end_date.year - years, end_date.month
+        for _ in range(years * 12):
+            month += 1
+            if month > 12:
+                year, month = year + 1, 1
+            self.months.append((year, month, calendar.monthrange(year, month)[1]))
+        self.indices = range(len(self.months))
+        self._cum_weights: dict[tuple[float, ...], list[float]] = {}
+
+    def cum_weights(self, seasonality: tuple[float, ...]) -> list[float]:
+        weights = self._cum_weights.get(seasonality)
+        if weights is None:
+            weights = self._cum_weights[seasonality] = list(
+                accumulate(seasonality[month - 1] for _, month, _ in self.months)
+            )
+        return weights
+
+
+def generate_user_transactions(
+    rng: random.Random,
+    user_id: int,
+    categories: list[tuple[int, CategorySpec]],
+    count: int,
+    months: MonthCalendar,
+    currency: str,
+) -> list[tuple]:
+    picks = rng.choices(range(len(categories)), weights=[spec.monthly_rate for _, spec in categories], k=count)
+    per_category = [0] * len(categories)
+    for index in picks:
+        per_category[index] += 1
+
+    # Each user earns and spends at their own level around the category medians.
+    scale = rng.lognormvariate(0.0, 0.25)
+    rows: list[tuple] = []
+    for (category_id, spec), category_count in zip(categories, per_category):
+        if not category_count:
+            continue
+        month_picks = rng.choices(months.indices, cum_weights=months.cum_weights(spec.seasonality), k=category_count)
+        for month_index in month_picks:
+            year, month, days_in_month = months.months[month_index]
+            tx_date = date(year, month, rng.randint(1, days_in_month))
+            seasonal = spec.seasonality[month - 1] ** 0.5
+            amount = max(0.01, rng.lognormvariate(spec.mu, spec.sigma) * scale * seasonal)
+            created_at = datetime(year, month, tx_date.day, rng.randint(7, 22), rng.randint(0, 59), rng.randint(0, 59))
+            rows.append(
+                (
+                    user_id,
+                    category_id,
+                    Decimal(f"{amount:.2f}"),
+                    spec.type,
+                    currency,
+                    rng.choice(spec.notes),
+                    tx_date,
+                    created_at,
+                )
+            )
+    return rows
+
+
+async def generate_dataset(engine: AsyncEngine, options: GenerateOptions) -> GenerateStats:
+    stats = GenerateStats()
+    started = time.perf_counter()
+    months = MonthCalendar(options.end_date or date.today(), options.years)
+    use_copy = engine.dialect.name == "postgresql" and engine.dialect.driver == "asyncpg"
+
+    for batch_start in range(0, options.users, options.user_batch_size):
+        batch_indices = range(batch_start, min(batch_start + options.user_batch_size, options.users))
+        async with engine.begin() as conn:
+            emails = {index: f"u{options.seed}-{index}@{options.email_domain}" for index in batch_indices}
+            result = await conn.execute(
+                insert(User.__table__).returning(User.id, User.email),
+                [
+                    {"name": f"Generated User {index}", "email": email, "hashed_password": options.password_hash}
+                    for index, email in emails.items()
+                ],
+            )
+            ids_by_email = {row.email: row.id for row in result.all()}
+            user_ids = [ids_by_email[emails[index]] for index in batch_indices]
+            stats.users += len(user_ids)
+
+            user_rngs: dict[int, random.Random] = {}
+            user_specs: dict[int, list[CategorySpec]] = {}
+            category_rows: list[dict] = []
+            for index, user_id in zip(batch_indices, user_ids):
+                rng = random.Random(f"{options.seed}:{index}")
+                specs = list(CORE_CATEGORIES) + rng.sample(OPTIONAL_CATEGORIES, k=rng.randint(2, len(OPTIONAL_CATEGORIES)))
+                user_rngs[user_id] = rng
+                user_specs[user_id] = specs
+                category_rows.extend(
+                    {"user_id": user_id, "name": spec.name, "type": spec.type, "color": spec.color} for spec in specs
+                )
+
+            result = await conn.execute(
+                insert(Category.__table__).returning(Category.id, Category.user_id, Category.name),
+                category_rows,
+            )
+            category_ids = {(row.user_id, row.name): row.id for row in result.all()}
+            stats.categories += len(category_ids)
+
+            pending: list[tuple] = []
+            for user_id in user_ids:
+                categories = [(category_ids[(user_id, spec.name)], spec) for spec in user_specs[user_id]]
+                pending.extend(
+                    generate_user_transactions(
+                        user_rngs[user_id], user_id, categories, options.transactions_per_user, months, options.currency
+                    )
+                )
+                if len(pending) >= options.chunk_size:
+                    stats.transactions += await _load_transactions(conn, pending, use_copy)
+                    pending = []
+            if pending:
+                stats.transactions += await _load_transactions(conn, pending, use_copy)
+
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+async def _load_transactions(conn: AsyncConnection, rows: list[tuple], use_copy: bool) -> int:
+    if use_copy:
+        raw_connection = await conn.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            Transaction.__tablename__, records=rows, columns=TRANSACTION_COLUMNS
+        )
+    else:
+        await conn.execute(insert(Transaction.__table__), [dict(zip(TRANSACTION_COLUMNS, row)) for row in rows])
+    return len(rows)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.tools.generate",
+        description="Generate a deterministic synthetic dataset for benchmarking.",
+    )
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--transactions", type=int, default=1000, help="Transactions per user.")
+    parser.add_argument("--years", type=int, default=3, help="History length ending today.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="Rows per COPY / insert batch.")
+    parser.add_argument("--user-batch-size", type=int, default=200, help="Users committed per transaction.")
+    parser.add_argument("--end-date", type=date.fromisoformat, help="Last day of generated history (default: today).")
+    parser.add_argument("--email-domain", default="gen.pftracker.app")
+    parser.add_argument("--password", help="Password for every generated user (hashed once). Users cannot log in without one.")
+    parser.add_argument("--database-url", help="Defaults to DATABASE_URL from the app settings.")
+    parser.add_argument("--create-schema", action="store_true", help="Create tables first (fresh databases only).")
+    return parser.parse_args()
+
+
+async def main() -> None:
+    from app.core.config import get_settings
+
+    args = parse_args()
+    settings = get_settings()
+    if args.database_url is None:
+        args.database_url = settings.database_url
+
+    password_hash = "!"
+    if args.password:
+        from app.core.security import hash_password
+
+        password_hash = hash_password(args.password)
+
+    engine = create_async_engine(args.database_url)
+    try:
+        if args.create_schema:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+        options = GenerateOptions(
+            users=args.users,
+            transactions_per_user=args.transactions,
+            years=args.years,
+            seed=args.seed,
+            chunk_size=args.chunk_size,
+            user_batch_size=args.user_batch_size,
+            email_domain=args.email_domain,
+            password_hash=password_hash,
+            end_date=args.end_date,
+            currency=settings.base_currency,
+        )
+        stats = await generate_dataset(engine, options)
+    finally:
+        await engine.dispose()
+
+    print(
+        f"users={stats.users} categories={stats.categories} transactions={stats.transactions} "
+        f"seconds={stats.seconds:.1f} rows/min={stats.rows_per_minute:,.0f}"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,44 @@
+import argparse
+import asyncio
+import csv
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+from app.core.database import dispose_engine, get_shard_router
+from app.services.fx_service import load_fx_rates
+
+
+def read_rates(path: Path) -> list[tuple[date, str, Decimal]]:
+    with path.open(newline="", encoding="utf-8") as handle:
+        return [
+            (date.fromisoformat(row["date"]), row["currency"].strip().upper(), Decimal(row["rate"]))
+            for row in csv.DictReader(handle)
+        ]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.tools.load_fx_rates",
+        description="Upsert exchange rates from CSV files with date,currency,rate columns into the primary database "
+        "and every shard. A rate is the value of one unit of the currency in BASE_CURRENCY.",
+    )
+    parser.add_argument("paths", nargs="+", type=Path)
+    return parser.parse_args()
+
+
+async def main() -> None:
+    args = parse_args()
+    rows = [rate for path in args.paths for rate in read_rates(path)]
+    loaded = 0
+    try:
+        # Every database converts its own users' amounts, so each one keeps a full copy of the rates.
+        for _, session_factory in get_shard_router().session_factories():
+            async with session_factory() as session:
+                loaded = await load_fx_rates(session, rows)
+    finally:
+        await dispose_engine()
+    print(f"loaded {loaded} rates from {len(args.paths)} file(s)")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,62 @@
+import argparse
+import asyncio
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.database import ShardRouter, dispose_engine, get_session_factory, get_shard_router
+from app.models.base import Base
+from app.models.user import User
+from app.services.shard_service import move_user
+
+PRIMARY = "primary"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.tools.shards",
+        description="Manage the user shards configured in SHARD_DATABASE_URLS.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("init", help="Create the schema on every shard (fresh databases only).")
+    commands.add_parser("list", help="Count users per shard from the directory.")
+    move = commands.add_parser("move", help="Move one user's data to another shard.")
+    move.add_argument("--user-id", type=int, required=True)
+    move.add_argument("--to", required=True, help=f"Target shard name, or {PRIMARY!r}.")
+    return parser.parse_args()
+
+
+async def init_shards(router: ShardRouter) -> None:
+    for shard in router.urls:
+        async with router.engine(shard).begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        print(f"created schema on {shard}")
+
+
+async def list_shards(directory: async_sessionmaker) -> None:
+    async with directory() as session:
+        result = await session.execute(select(User.shard, func.count()).group_by(User.shard).order_by(User.shard))
+        for shard, users in result.all():
+            print(f"{shard or PRIMARY:<24} users={users:,}")
+
+
+async def main() -> None:
+    args = parse_args()
+    router = get_shard_router()
+    # The directory is the primary database, so moves to and from it go through the same engine the app uses.
+    directory = get_session_factory()
+    try:
+        if args.command == "init":
+            await init_shards(router)
+        elif args.command == "list":
+            await list_shards(directory)
+        else:
+            target = None if args.to == PRIMARY else args.to
+            copied = await move_user(directory, router, args.user_id, target)
+            print(f"moved user {args.user_id} to {args.to}: {copied or 'already there'}")
+    finally:
+        await dispose_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,61 @@
+import argparse
+import asyncio
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+
+from app.core.database import build_engine
+from app.models import *  # noqa: F401,F403
+from app.models.base import Base
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.tools.sqlite_db",
+        description="Set up and maintain an embedded SQLite deployment.",
+    )
+    parser.add_argument("--database-url", help="Defaults to DATABASE_URL from the app settings.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("init", help="Create the schema and stamp it at the latest migration.")
+    commands.add_parser("optimize", help="Refresh planner statistics and truncate the WAL (run nightly).")
+    return parser.parse_args()
+
+
+def _stamp_head(connection) -> None:
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(ALEMBIC_INI.parent / "alembic"))
+    MigrationContext.configure(connection).stamp(ScriptDirectory.from_config(config), "head")
+
+
+async def main() -> None:
+    args = parse_args()
+    if args.database_url is None:
+        from app.core.config import get_settings
+
+        args.database_url = get_settings().database_url
+
+    engine = build_engine(args.database_url)
+    if engine.dialect.name != "sqlite":
+        raise SystemExit(f"{args.database_url.split('://', 1)[0]} is not a SQLite URL; use alembic upgrade head instead")
+    try:
+        if args.command == "init":
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+                await conn.run_sync(_stamp_head)
+            print("created schema and stamped head")
+        else:
+            async with engine.connect() as conn:
+                await conn.execute(text("PRAGMA optimize"))
+                busy, wal_pages, checkpointed = (await conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))).one()
+            print(f"optimized; checkpointed {checkpointed}/{wal_pages} WAL pages (busy={busy})")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1 @@
+# Marker file for bench package.
\ No newline at end of file
@@ -0,0 +1,165 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import uuid
+from contextlib import AsyncExitStack
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+
+from bench.scenarios import ENDPOINT_MIX, BenchUser, setup_user
+from bench.stats import EndpointSamples, compare, format_table, summarize
+
+DEFAULT_DATABASE_URL = "sqlite+aiosqlite:///./bench.db"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m bench", description="Async load test for the API.")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--base-url", help="Drive an already running server instead of the in-process app.")
+    target.add_argument("--spawn-uvicorn", action="store_true", help="Start a local uvicorn worker and drive it over HTTP.")
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL", DEFAULT_DATABASE_URL))
+    parser.add_argument("--create-schema", action="store_true", help="Create tables before the run (fresh databases).")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=20.0, help="Measured seconds, after setup.")
+    parser.add_argument("--seed-transactions", type=int, default=200, help="Transactions created per virtual user before measuring.")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--output", type=Path, help="Write JSON results here.")
+    parser.add_argument("--baseline", type=Path, help="Compare against this JSON result; exit 1 on regression.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown before failing.")
+    return parser.parse_args()
+
+
+def configure_environment(args: argparse.Namespace) -> None:
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("JWT_SECRET_KEY", "bench-secret")
+    os.environ["APP_DEBUG"] = "false"
+    os.environ.setdefault("DEMO_MODE", "false")
+
+
+async def create_schema() -> None:
+    from app.core.database import dispose_engine, init_db
+
+    await init_db()
+    await dispose_engine()
+
+
+async def wait_for_health(client: httpx.AsyncClient, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        if time.monotonic() > deadline:
+            raise RuntimeError("Server did not become healthy in time")
+        await asyncio.sleep(0.2)
+
+
+async def run_worker(
+    client: httpx.AsyncClient,
+    user: BenchUser,
+    rng: random.Random,
+    deadline: float,
+    samples: dict[str, EndpointSamples],
+) -> None:
+    names = list(ENDPOINT_MIX)
+    weights = [weight for _, weight in ENDPOINT_MIX.values()]
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, weights)[0]
+        scenario, _ = ENDPOINT_MIX[name]
+        started = time.perf_counter()
+        try:
+            status_code = (await scenario(client, user, rng)).status_code
+        except httpx.TransportError:
+            status_code = 599
+        samples[name].record(time.perf_counter() - started, status_code)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    async with AsyncExitStack() as stack:
+        if args.base_url:
+            client = await stack.enter_async_context(httpx.AsyncClient(base_url=args.base_url, timeout=60))
+            target = args.base_url
+        elif args.spawn_uvicorn:
+            process = subprocess.Popen(
+                [sys.executable, "-m", "uvicorn", "app.main:create_app", "--factory", "--port", str(args.port), "--log-level", "warning"],
+                env=os.environ.copy(),
+            )
+            stack.callback(process.wait)
+            stack.callback(process.terminate)
+            target = f"http://127.0.0.1:{args.port}"
+            client = await stack.enter_async_context(httpx.AsyncClient(base_url=target, timeout=60))
+        else:
+            from app.main import create_app
+
+            app = create_app()
+            await stack.enter_async_context(app.router.lifespan_context(app))
+            transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+            client = await stack.enter_async_context(httpx.AsyncClient(transport=transport, base_url="http://bench"))
+            target = "in-process"
+
+        await wait_for_health(client)
+
+        run_id = uuid.uuid4().hex[:8]
+        rngs = [random.Random(args.seed + index) for index in range(args.concurrency)]
+        users = await asyncio.gather(
+            *(
+                setup_user(client, f"bench-{run_id}-{index}@example.com", args.seed_transactions, rngs[index])
+                for index in range(args.concurrency)
+            )
+        )
+
+        samples = {name: EndpointSamples() for name in ENDPOINT_MIX}
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(
+            *(run_worker(client, user, rng, deadline, samples) for user, rng in zip(users, rngs))
+        )
+        wall_seconds = time.perf_counter() - started
+
+    result = summarize(samples, wall_seconds)
+    result["meta"] = {
+        "target": target,
+        "database": args.database_url.split("://", 1)[0],
+        "concurrency": args.concurrency,
+        "duration_seconds": round(wall_seconds, 2),
+        "seed_transactions": args.seed_transactions,
+        "started_at": datetime.now(UTC).isoformat(timespec="seconds"),
+    }
+    return result
+
+
+def main() -> int:
+    args = parse_args()
+    configure_environment(args)
+    if args.create_schema:
+        asyncio.run(create_schema())
+
+    result = asyncio.run(run(args))
+    print(format_table(result))
+
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+
+    if args.baseline:
+        regressions = compare(result, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+        if regressions:
+            print(f"\nRegressions against {args.baseline} (tolerance {args.tolerance:.0%}):")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print(f"\nNo regressions against {args.baseline}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
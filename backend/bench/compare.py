@@ -0,0 +1,29 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from bench.stats import format_comparison
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m bench.compare",
+        description="Print two bench results side by side, e.g. SQLite against Postgres.",
+    )
+    parser.add_argument("left", type=Path)
+    parser.add_argument("right", type=Path)
+    parser.add_argument("--labels", nargs=2, metavar=("LEFT", "RIGHT"), help="Column labels. Defaults to each run's database.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    left, right = (json.loads(path.read_text(encoding="utf-8")) for path in (args.left, args.right))
+    labels = args.labels or [result["meta"]["database"].split("+", 1)[0] for result in (left, right)]
+    print(format_comparison(left, right, *labels))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
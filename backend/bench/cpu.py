@@ -0,0 +1,93 @@
+import argparse
+import asyncio
+import cProfile
+import os
+import pstats
+import random
+import time
+import uuid
+
+import httpx
+
+from bench.__main__ import DEFAULT_DATABASE_URL, configure_environment, create_schema
+from bench.scenarios import (
+    get_transaction,
+    list_transactions,
+    report_by_category,
+    report_monthly,
+    report_summary,
+    setup_user,
+)
+
+# Read paths only: their statements are identical from one request to the next, so any per-request cost of
+# building and compiling them shows up here instead of being hidden behind write I/O.
+SCENARIOS = {
+    "list_transactions": list_transactions,
+    "get_transaction": get_transaction,
+    "report_summary": report_summary,
+    "report_by_category": report_by_category,
+    "report_monthly": report_monthly,
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m bench.cpu",
+        description="Measure process CPU time per request for the hot read endpoints, one request at a time.",
+    )
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL", DEFAULT_DATABASE_URL))
+    parser.add_argument("--create-schema", action="store_true", help="Create tables before the run (fresh databases).")
+    parser.add_argument("--requests", type=int, default=500, help="Measured requests per endpoint and round.")
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds per endpoint; the fastest one is reported.")
+    parser.add_argument("--warmup", type=int, default=100, help="Unmeasured requests per endpoint.")
+    parser.add_argument("--seed-transactions", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1234)
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace) -> dict[str, tuple[float, float, float]]:
+    from app.main import create_app
+
+    app = create_app()
+    rng = random.Random(args.seed)
+    results: dict[str, tuple[float, float, float]] = {}
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            user = await setup_user(client, f"cpu-{uuid.uuid4().hex[:8]}@example.com", args.seed_transactions, rng)
+            for name, scenario in SCENARIOS.items():
+                for _ in range(args.warmup):
+                    (await scenario(client, user, rng)).raise_for_status()
+                # Other load on the machine only ever adds time, so the fastest round is the least noisy estimate.
+                for _ in range(args.rounds):
+                    cpu_started, wall_started = time.process_time(), time.perf_counter()
+                    for _ in range(args.requests):
+                        (await scenario(client, user, rng)).raise_for_status()
+                    cpu = (time.process_time() - cpu_started) / args.requests * 1000
+                    wall = (time.perf_counter() - wall_started) / args.requests * 1000
+                    best_cpu, best_wall, _ = results.get(name, (cpu, wall, 0.0))
+                    results[name] = (min(best_cpu, cpu), min(best_wall, wall), 0.0)
+                # Python calls per request do not depend on machine load, so they show small changes reliably.
+                profile = cProfile.Profile()
+                profile.enable()
+                for _ in range(args.requests):
+                    (await scenario(client, user, rng)).raise_for_status()
+                profile.disable()
+                results[name] = (*results[name][:2], pstats.Stats(profile).total_calls / args.requests)
+    return results
+
+
+def main() -> None:
+    args = parse_args()
+    configure_environment(args)
+    if args.create_schema:
+        asyncio.run(create_schema())
+
+    results = asyncio.run(run(args))
+    print(f"{'endpoint':<20} {'cpu ms/req':>11} {'wall ms/req':>12} {'calls/req':>10}")
+    for name, (cpu_ms, wall_ms, calls) in results.items():
+        print(f"{name:<20} {cpu_ms:>11.3f} {wall_ms:>12.3f} {calls:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
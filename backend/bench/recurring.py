@@ -0,0 +1,114 @@
+import argparse
+import asyncio
+import os
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from bench.__main__ import DEFAULT_DATABASE_URL
+from app.models.base import Base
+from app.models.category import Category
+from app.models.recurring_rule import RecurringRule
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.services.recurring_rule_service import materialize_due_occurrences
+
+FREQUENCY_WEIGHTS = {"monthly": 60, "weekly": 25, "yearly": 10, "daily": 5}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m bench.recurring",
+        description="Time set-based materialization of recurring rules.",
+    )
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL", DEFAULT_DATABASE_URL))
+    parser.add_argument("--create-schema", action="store_true", help="Create tables first (fresh databases only).")
+    parser.add_argument("--rules", type=int, default=100_000)
+    parser.add_argument("--rules-per-user", type=int, default=5)
+    parser.add_argument("--history-days", type=int, default=90, help="Anchors are spread over this many past days.")
+    parser.add_argument("--downtime-days", type=int, default=30, help="Gap covered by the catch-up run.")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+async def seed_rules(engine: AsyncEngine, args: argparse.Namespace, today: date) -> None:
+    rng = random.Random(args.seed)
+    run_id = f"{args.seed}-{time.time_ns()}"
+    users = max(1, -(-args.rules // args.rules_per_user))
+    frequencies, weights = zip(*FREQUENCY_WEIGHTS.items())
+
+    async with engine.begin() as conn:
+        result = await conn.execute(
+            insert(User.__table__).returning(User.id),
+            [
+                {"name": f"Recurring {index}", "email": f"recurring-{run_id}-{index}@bench.pftracker.app", "hashed_password": "!"}
+                for index in range(users)
+            ],
+        )
+        user_ids = list(result.scalars().all())
+        result = await conn.execute(
+            insert(Category.__table__).returning(Category.id, Category.user_id),
+            [{"user_id": user_id, "name": "Bills", "type": "expense", "color": "#f31260"} for user_id in user_ids],
+        )
+        category_ids = {row.user_id: row.id for row in result.all()}
+
+        rows = []
+        for index in range(args.rules):
+            user_id = user_ids[index // args.rules_per_user]
+            rows.append(
+                {
+                    "user_id": user_id,
+                    "category_id": category_ids[user_id],
+                    "amount": Decimal(f"{rng.lognormvariate(4.0, 1.0) + 1:.2f}"),
+                    "type": "expense",
+                    "frequency": rng.choices(frequencies, weights)[0],
+                    "anchor_date": today - timedelta(days=rng.randint(0, args.history_days)),
+                }
+            )
+        for start in range(0, len(rows), 10_000):
+            await conn.execute(insert(RecurringRule.__table__), rows[start:start + 10_000])
+
+
+async def run(args: argparse.Namespace) -> None:
+    engine = create_async_engine(args.database_url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    today = date.today()
+    try:
+        if args.create_schema:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+        started = time.perf_counter()
+        await seed_rules(engine, args, today)
+        print(f"seeded {args.rules:,} rules in {time.perf_counter() - started:.1f}s")
+
+        phases = (
+            ("initial catch-up", today),
+            ("no-op rerun", today),
+            ("next day", today + timedelta(days=1)),
+            (f"after {args.downtime_days}d downtime", today + timedelta(days=1 + args.downtime_days)),
+        )
+        for name, as_of in phases:
+            async with session_factory() as session:
+                before = await session.scalar(select(func.count()).select_from(Transaction))
+                started = time.perf_counter()
+                users = await materialize_due_occurrences(session, as_of)
+                await session.commit()
+                elapsed = time.perf_counter() - started
+                inserted = await session.scalar(select(func.count()).select_from(Transaction)) - before
+            rate = inserted / elapsed if elapsed else 0.0
+            print(f"{name:<24} inserted={inserted:>9,} users={len(users):>7,} seconds={elapsed:7.2f} rows/s={rate:,.0f}")
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    asyncio.run(run(parse_args()))
+
+
+if __name__ == "__main__":
+    main()
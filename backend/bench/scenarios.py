@@ -0,0 +1,122 @@
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from httpx import AsyncClient, Response
+
+BENCH_PASSWORD = "BenchPass123"
+
+
+@dataclass
+class BenchUser:
+    email: str
+    access_token: str
+    expense_category_ids: list[int] = field(default_factory=list)
+    income_category_ids: list[int] = field(default_factory=list)
+    transaction_ids: list[int] = field(default_factory=list)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.access_token}"}
+
+
+Scenario = Callable[[AsyncClient, BenchUser, random.Random], Awaitable[Response]]
+
+
+async def login(client: AsyncClient, user: BenchUser, rng: random.Random) -> Response:
+    response = await client.post("/auth/login", json={"email": user.email, "password": BENCH_PASSWORD})
+    if response.status_code == 200:
+        user.access_token = response.json()["tokens"]["access_token"]
+    return response
+
+
+async def report_summary(client: AsyncClient, user: BenchUser, rng: random.Random) -> Response:
+    return await client.get("/reports/summary", headers=user.headers)
+
+
+async def report_by_category(client: AsyncClient, user: BenchUser, rng: random.Random) -> Response:
+    return await client.get("/reports/by-category", params={"type": "expense"}, headers=user.headers)
+
+
+async def report_monthly(client: AsyncClient, user: BenchUser, rng: random.Random) -> Response:
+    return await client.get("/reports/monthly", headers=user.headers)
+
+
+async def list_transactions(client: AsyncClient, user: BenchUser, rng: random.Random) -> Response:
+    params = {"page": rng.randint(1, 3), "page_size": 20}
+    return await client.get("/transactions", params=params, headers=user.headers)
+
+
+async def list_categories(client: AsyncClient, user: BenchUser, rng: random.Random) -> Response:
+    return await client.get("/categories", headers=user.headers)
+
+
+async def create_transaction(client: AsyncClient, user: BenchUser, rng: random.Random) -> Response:
+    response = await client.post("/transactions", json=random_transaction(user, rng), headers=user.headers)
+    if response.status_code == 201:
+        user.transaction_ids.append(response.json()["id"])
+    return response
+
+
+async def get_transaction(client: AsyncClient, user: BenchUser, rng: random.Random) -> Response:
+    transaction_id = rng.choice(user.transaction_ids)
+    return await client.get(f"/transactions/{transaction_id}", headers=user.headers)
+
+
+# Weights approximate a dashboard-heavy session: reads dominate, logins and writes are occasional.
+ENDPOINT_MIX: dict[str, tuple[Scenario, int]] = {
+    "login": (login, 2),
+    "report_summary": (report_summary, 15),
+    "report_by_category": (report_by_category, 15),
+    "report_monthly": (report_monthly, 10),
+    "list_transactions": (list_transactions, 25),
+    "list_categories": (list_categories, 10),
+    "get_transaction": (get_transaction, 8),
+    "create_transaction": (create_transaction, 15),
+}
+
+
+def random_transaction(user: BenchUser, rng: random.Random) -> dict:
+    is_income = rng.random() < 0.2
+    category_ids = user.income_category_ids if is_income else user.expense_category_ids
+    amount = rng.uniform(1500, 5000) if is_income else rng.lognormvariate(3.5, 1.0)
+    return {
+        "category_id": rng.choice(category_ids),
+        "amount": f"{max(amount, 0.01):.2f}",
+        "type": "income" if is_income else "expense",
+        "date": (date.today() - timedelta(days=rng.randint(0, 730))).isoformat(),
+        "note": rng.choice(["Groceries", "Coffee", "Rent", "Salary", "Taxi", None]),
+    }
+
+
+async def setup_user(client: AsyncClient, email: str, transactions: int, rng: random.Random) -> BenchUser:
+    response = await client.post(
+        "/auth/register",
+        json={"name": "Bench User", "email": email, "password": BENCH_PASSWORD},
+    )
+    response.raise_for_status()
+    user = BenchUser(email=email, access_token=response.json()["tokens"]["access_token"])
+
+    category_specs = [
+        ("Salary", "income", "#17c964"),
+        ("Freelance", "income", "#06b6d4"),
+        ("Rent", "expense", "#f31260"),
+        ("Groceries", "expense", "#f59e0b"),
+        ("Transport", "expense", "#8b5cf6"),
+        ("Utilities", "expense", "#3b82f6"),
+    ]
+    for name, kind, color in category_specs:
+        response = await client.post(
+            "/categories",
+            json={"name": name, "type": kind, "color": color},
+            headers=user.headers,
+        )
+        response.raise_for_status()
+        target = user.income_category_ids if kind == "income" else user.expense_category_ids
+        target.append(response.json()["id"])
+
+    for _ in range(max(transactions, 1)):
+        response = await create_transaction(client, user, rng)
+        response.raise_for_status()
+    return user
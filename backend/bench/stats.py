@@ -0,0 +1,113 @@
+import math
+from dataclasses import dataclass, field
+
+
+@dataclass
+class EndpointSamples:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    def record(self, elapsed: float, status_code: int) -> None:
+        self.latencies.append(elapsed)
+        if status_code >= 400:
+            self.errors += 1
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(samples: dict[str, EndpointSamples], wall_seconds: float) -> dict:
+    endpoints: dict[str, dict] = {}
+    total_requests = 0
+    total_errors = 0
+    for name, endpoint in sorted(samples.items()):
+        latencies = sorted(endpoint.latencies)
+        count = len(latencies)
+        total_requests += count
+        total_errors += endpoint.errors
+        endpoints[name] = {
+            "count": count,
+            "errors": endpoint.errors,
+            "error_rate": round(endpoint.errors / count, 4) if count else 0.0,
+            "throughput_rps": round(count / wall_seconds, 2) if wall_seconds else 0.0,
+            "mean_ms": round(sum(latencies) / count * 1000, 3) if count else 0.0,
+            "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        }
+
+    return {
+        "totals": {
+            "requests": total_requests,
+            "errors": total_errors,
+            "throughput_rps": round(total_requests / wall_seconds, 2) if wall_seconds else 0.0,
+        },
+        "endpoints": endpoints,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions: list[str] = []
+    for name, base in baseline["endpoints"].items():
+        now = current["endpoints"].get(name)
+        if now is None:
+            regressions.append(f"{name}: missing from current run")
+            continue
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            if base[metric] and now[metric] > base[metric] * (1 + tolerance):
+                regressions.append(f"{name}: {metric} {base[metric]:.2f} -> {now[metric]:.2f}")
+        if now["error_rate"] > base["error_rate"]:
+            regressions.append(f"{name}: error_rate {base['error_rate']:.2%} -> {now['error_rate']:.2%}")
+
+    base_rps = baseline["totals"]["throughput_rps"]
+    now_rps = current["totals"]["throughput_rps"]
+    if base_rps and now_rps < base_rps * (1 - tolerance):
+        regressions.append(f"throughput_rps {base_rps:.2f} -> {now_rps:.2f}")
+    return regressions
+
+
+def format_table(result: dict) -> str:
+    header = f"{'endpoint':<22}{'count':>8}{'err':>6}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    lines = [header, "-" * len(header)]
+    for name, row in result["endpoints"].items():
+        lines.append(
+            f"{name:<22}{row['count']:>8}{row['errors']:>6}{row['throughput_rps']:>10.1f}"
+            f"{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}{row['p99_ms']:>10.2f}"
+        )
+    totals = result["totals"]
+    lines.append("-" * len(header))
+    lines.append(f"{'total':<22}{totals['requests']:>8}{totals['errors']:>6}{totals['throughput_rps']:>10.1f}")
+    return "\n".join(lines)
+
+
+def format_comparison(left: dict, right: dict, left_label: str, right_label: str) -> str:
+    header = (
+        f"{'endpoint':<22}{left_label + ' p50':>14}{right_label + ' p50':>14}{'ratio':>8}"
+        f"{left_label + ' p95':>14}{right_label + ' p95':>14}{'ratio':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    for name in sorted(set(left["endpoints"]) | set(right["endpoints"])):
+        a, b = left["endpoints"].get(name), right["endpoints"].get(name)
+        if a is None or b is None:
+            lines.append(f"{name:<22}  only in {left_label if b is None else right_label}")
+            continue
+        lines.append(
+            f"{name:<22}{a['p50_ms']:>14.2f}{b['p50_ms']:>14.2f}{_ratio(b['p50_ms'], a['p50_ms']):>8}"
+            f"{a['p95_ms']:>14.2f}{b['p95_ms']:>14.2f}{_ratio(b['p95_ms'], a['p95_ms']):>8}"
+        )
+    lines.append("-" * len(header))
+    a, b = left["totals"], right["totals"]
+    lines.append(
+        f"{'throughput rps':<22}{a['throughput_rps']:>14.1f}{b['throughput_rps']:>14.1f}"
+        f"{_ratio(b['throughput_rps'], a['throughput_rps']):>8}"
+    )
+    lines.append(f"{'errors':<22}{a['errors']:>14}{b['errors']:>14}")
+    return "\n".join(lines)
+
+
+def _ratio(value: float, reference: float) -> str:
+    return f"{value / reference:.2f}x" if reference else "-"